@@ -15,9 +15,9 @@ api_router.include_router(
     tags=["projects"]
 )
 
+# Test case routes carry their full paths (/projects/{id}/testcases, /testcases/{id})
 api_router.include_router(
     testcases.router,
-    prefix="/testcases",
     tags=["testcases"]
 )
 
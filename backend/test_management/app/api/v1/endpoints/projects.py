@@ -4,31 +4,39 @@ Projects endpoints
 
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Depends, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_async_db
 from app.models.project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListResponse
-from app.services.project_service import ProjectService
+from app.models.purge_job import PurgeJobResponse
+from app.services.project_service import AsyncProjectService
 from app.middleware.auth import get_current_user_dependency
 from core.config import settings
 
 router = APIRouter()
 
 
+def get_project_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncProjectService:
+    """Dependency injection for AsyncProjectService"""
+    return AsyncProjectService(db)
+
+
 @router.get("", response_model=ProjectListResponse)
 async def list_projects(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
     status: Optional[str] = Query(None, description="Filter by project status"),
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    project_service: AsyncProjectService = Depends(get_project_service)
 ):
     """List all projects for the current user"""
-    project_service = ProjectService(db)
-    return project_service.get_user_projects(
+    return await project_service.get_user_projects(
         user_id=current_user["user_id"],
         skip=skip,
-        limit=limit
+        limit=limit,
+        status=status
     )
 
 
@@ -36,12 +44,11 @@ async def list_projects(
 async def create_project(
     project_data: ProjectCreate,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    project_service: AsyncProjectService = Depends(get_project_service)
 ):
     """Create a new project"""
-    project_service = ProjectService(db)
     try:
-        return project_service.create_project(
+        return await project_service.create_project(
             project_data=project_data,
             user_id=current_user["user_id"]
         )
@@ -53,12 +60,11 @@ async def create_project(
 async def get_project(
     project_id: int,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    project_service: AsyncProjectService = Depends(get_project_service)
 ):
     """Get project by ID"""
-    project_service = ProjectService(db)
     try:
-        project = project_service.get_project(
+        project = await project_service.get_project(
             project_id=project_id,
             user_id=current_user["user_id"]
         )
@@ -74,12 +80,11 @@ async def update_project(
     project_id: int,
     project_data: ProjectUpdate,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    project_service: AsyncProjectService = Depends(get_project_service)
 ):
     """Update a project"""
-    project_service = ProjectService(db)
     try:
-        updated_project = project_service.update_project(
+        updated_project = await project_service.update_project(
             project_id=project_id,
             update_data=project_data,
             user_id=current_user["user_id"]
@@ -95,17 +100,40 @@ async def update_project(
 async def delete_project(
     project_id: int,
     current_user: dict = Depends(get_current_user_dependency),
-    db: Session = Depends(get_db)
+    project_service: AsyncProjectService = Depends(get_project_service)
 ):
-    """Delete a project"""
-    project_service = ProjectService(db)
+    """
+    Delete a project.
+    
+    The project and its test cases disappear at once; their rows are purged
+    in the background. Follow the returned job at ``/projects/purge-jobs/{id}``.
+    """
     try:
-        success = project_service.delete_project(
+        job = await project_service.delete_project(
             project_id=project_id,
             user_id=current_user["user_id"]
         )
-        if not success:
+        if job is None:
             raise HTTPException(status_code=404, detail="Project not found")
-        return {"message": "Project deleted successfully"}
+        return {"message": "Project deleted successfully", "purge_job": job}
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+
+
+@router.get("/purge-jobs/{job_id}", response_model=PurgeJobResponse)
+async def get_purge_job(
+    job_id: int,
+    current_user: dict = Depends(get_current_user_dependency),
+    project_service: AsyncProjectService = Depends(get_project_service)
+):
+    """Get the progress of a project purge job"""
+    try:
+        job = await project_service.get_purge_job(
+            job_id=job_id,
+            user_id=current_user["user_id"]
+        )
+        if job is None:
+            raise HTTPException(status_code=404, detail="Purge job not found")
+        return job
     except ValueError as e:
         raise HTTPException(status_code=403, detail=str(e))
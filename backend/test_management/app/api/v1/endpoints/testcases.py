@@ -2,45 +2,121 @@
 Test cases endpoints
 """
 
+import io
+import tempfile
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
-from app.database import get_db
+from app.database import get_async_db
 from app.middleware.auth import get_current_user
 from app.models.test_case import (
-    TestCaseCreate, TestCaseUpdate, TestCaseResponse, TestCaseListResponse,
-    TestCaseSearchQuery, TestCaseStatus, TestCasePriority, TestCaseType
+    TestCaseCreate,
+    TestCaseUpdate,
+    TestCaseResponse,
+    TestCaseSearchQuery,
+    TestCaseStatus,
+    TestCasePriority,
+    TestCaseType,
+    TestCaseCountMode,
+    TestCaseSearchResponse,
+    TestCaseBulkStatusUpdate,
+    TestCaseBulkPriorityUpdate,
+    TestCaseBulkTypeUpdate,
+    TestCaseBulkTagsUpdate,
+    TestCaseBulkUpdateResult,
+    TestCaseDataFormat,
+    TestCaseImportResult,
+    TestCaseSummaryListResponse,
+    resolve_test_case_fields,
 )
-from app.services.test_case_service import TestCaseService
+from app.models.similarity import SimilarTestCasesResponse
+from app.services.test_case_service import AsyncTestCaseService, PreconditionFailedError
 from app.models.user import User
+from app.utils.cursor import decode_cursor
+from app.utils.etag import if_match_version, none_match, test_case_etag
+from app.utils.responses import ORJSONModelResponse
+from app.utils.search import build_prefix_tsquery
+from app.utils.test_case_io import (
+    iter_csv_chunks,
+    iter_csv_records,
+    iter_jsonl_records,
+    iter_ndjson_chunks,
+)
 
 router = APIRouter()
 
 
-def get_test_case_service(db: Session = Depends(get_db)) -> TestCaseService:
-    """Dependency injection for TestCaseService"""
-    return TestCaseService(db)
+def get_test_case_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncTestCaseService:
+    """Dependency injection for AsyncTestCaseService"""
+    return AsyncTestCaseService(db)
 
 
-@router.get("/projects/{project_id}/testcases", response_model=TestCaseListResponse)
+@router.get(
+    "/projects/{project_id}/testcases",
+    response_model=TestCaseSummaryListResponse,
+    responses={
+        304: {"description": "The list still matches the weak ETag in If-None-Match"}
+    },
+)
 async def list_testcases(
     project_id: int,
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(
+        None, description="Keyset cursor from a previous page's next_cursor"
+    ),
+    count: TestCaseCountMode = Query(
+        TestCaseCountMode.EXACT,
+        description="Total count mode (exact, estimated or none)",
+    ),
     title: Optional[str] = Query(None, description="Filter by title (contains)"),
     status: Optional[TestCaseStatus] = Query(None, description="Filter by status"),
-    priority: Optional[TestCasePriority] = Query(None, description="Filter by priority"),
+    priority: Optional[TestCasePriority] = Query(
+        None, description="Filter by priority"
+    ),
     type: Optional[TestCaseType] = Query(None, description="Filter by type"),
     tags: Optional[str] = Query(None, description="Filter by tags (comma-separated)"),
     created_by: Optional[int] = Query(None, description="Filter by creator"),
-    created_after: Optional[datetime] = Query(None, description="Filter by creation date (after)"),
-    created_before: Optional[datetime] = Query(None, description="Filter by creation date (before)"),
+    created_after: Optional[datetime] = Query(
+        None, description="Filter by creation date (after)"
+    ),
+    created_before: Optional[datetime] = Query(
+        None, description="Filter by creation date (before)"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated item fields, 'summary' (default) or 'all'"
+    ),
+    include_archived: bool = Query(False, description="Also list archived test cases"),
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
-    test_case_service: TestCaseService = Depends(get_test_case_service)
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service),
 ):
-    """List all test cases for a project with filtering and pagination"""
+    """
+    List all test cases for a project with filtering and pagination.
+    
+    Items carry the summary fields unless ``fields`` asks for others; the full
+    test case is served by ``GET /testcases/{case_id}``.
+    
+    The response carries a **weak** ETag (``W/"..."``) built from the
+    project's change version and the query, and ``If-None-Match`` with it
+    returns 304 while nothing in the project changed. It is weak on purpose:
+    the same version can render slightly different bytes (estimated totals
+    follow planner statistics, and compressed bodies differ from identity
+    ones), so it only promises an equivalent list and cannot be used with
+    ``If-Match`` or byte-range requests.
+    """
+    try:
+        if cursor:
+            decode_cursor(cursor)
+        field_names = resolve_test_case_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     try:
         # Parse tags if provided
         tags_list = None
@@ -51,6 +127,8 @@ async def list_testcases(
         query_params = TestCaseSearchQuery(
             page=page,
             size=size,
+            cursor=cursor,
+            count=count,
             title=title,
             status=status,
             priority=priority,
@@ -58,43 +136,193 @@ async def list_testcases(
             tags=tags_list,
             created_by=created_by,
             created_after=created_after,
-            created_before=created_before
+            created_before=created_before,
+            fields=field_names,
+            include_archived=include_archived
+        )
+        
+        etag = await test_case_service.get_project_test_cases_etag(
+            project_id, current_user.id, query_params
         )
+        if etag and none_match(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
         
-        return test_case_service.get_project_test_cases(project_id, current_user.id, query_params)
+        result = await test_case_service.get_project_test_cases(
+            project_id, current_user.id, query_params
+        )
+        return ORJSONModelResponse(result, headers={"ETag": etag} if etag else None)
     except ValueError as e:
         raise HTTPException(status_code=403, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.post("/projects/{project_id}/testcases", response_model=TestCaseResponse)
+@router.post(
+    "/projects/{project_id}/testcases", response_model=TestCaseResponse, status_code=201
+)
 async def create_testcase(
     project_id: int,
     test_case_data: TestCaseCreate,
     current_user: User = Depends(get_current_user),
-    test_case_service: TestCaseService = Depends(get_test_case_service)
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service)
 ):
     """Create a new test case in a project"""
     try:
-        return test_case_service.create_test_case(test_case_data, project_id, current_user.id)
+        return await test_case_service.create_test_case(
+            test_case_data, project_id, current_user.id
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.get("/projects/{project_id}/testcases/export")
+async def export_testcases(
+    project_id: int,
+    format: TestCaseDataFormat = Query(
+        TestCaseDataFormat.NDJSON, description="Export format (ndjson, jsonl or csv)"
+    ),
+    title: Optional[str] = Query(None, description="Filter by title (contains)"),
+    status: Optional[TestCaseStatus] = Query(None, description="Filter by status"),
+    priority: Optional[TestCasePriority] = Query(
+        None, description="Filter by priority"
+    ),
+    type: Optional[TestCaseType] = Query(None, description="Filter by type"),
+    tags: Optional[str] = Query(None, description="Filter by tags (comma-separated)"),
+    created_by: Optional[int] = Query(None, description="Filter by creator"),
+    created_after: Optional[datetime] = Query(
+        None, description="Filter by creation date (after)"
+    ),
+    created_before: Optional[datetime] = Query(
+        None, description="Filter by creation date (before)"
+    ),
+    current_user: User = Depends(get_current_user),
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service),
+):
+    """Stream every matching test case of a project as NDJSON or CSV"""
+    try:
+        tags_list = None
+        if tags:
+            tags_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
+        
+        query_params = TestCaseSearchQuery(
+            title=title,
+            status=status,
+            priority=priority,
+            type=type,
+            tags=tags_list,
+            created_by=created_by,
+            created_after=created_after,
+            created_before=created_before
+        )
+        
+        batches = await test_case_service.export_test_cases(
+            project_id, current_user.id, query_params
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    
+    async def csv_body():
+        header = True
+        async for rows in batches:
+            for chunk in iter_csv_chunks(rows, header=header):
+                yield chunk
+            header = False
+    
+    async def ndjson_body():
+        async for rows in batches:
+            for chunk in iter_ndjson_chunks(rows):
+                yield chunk
+    
+    if format == TestCaseDataFormat.CSV:
+        body, media_type, extension = csv_body(), "text/csv", "csv"
+    else:
+        body, media_type, extension = ndjson_body(), "application/x-ndjson", "ndjson"
+    
+    filename = f"project-{project_id}-testcases.{extension}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post(
+    "/projects/{project_id}/testcases/import", response_model=TestCaseImportResult
+)
+async def import_testcases(
+    project_id: int,
+    request: Request,
+    format: Optional[TestCaseDataFormat] = Query(
+        None,
+        description="Body format; defaults from Content-Type (text/csv or JSON lines)",
+    ),
+    current_user: User = Depends(get_current_user),
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service),
+):
+    """
+    Bulk import test cases from a JSON-lines or CSV body.
+    
+    The body is streamed to a temporary file instead of being held in memory,
+    then parsed and inserted in batches in a worker thread.
+    """
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        format = (
+            TestCaseDataFormat.CSV
+            if "csv" in content_type
+            else TestCaseDataFormat.JSONL
+        )
+    
+    try:
+        with tempfile.TemporaryFile() as spool:
+            async for chunk in request.stream():
+                spool.write(chunk)
+            spool.seek(0)
+            
+            stream = io.TextIOWrapper(
+                spool, encoding="utf-8-sig", errors="replace", newline=""
+            )
+            if format == TestCaseDataFormat.CSV:
+                records = iter_csv_records(stream)
+            else:
+                records = iter_jsonl_records(stream)
+            return await test_case_service.import_test_cases(
+                project_id, records, current_user.id
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
 @router.get("/testcases/{case_id}", response_model=TestCaseResponse)
 async def get_testcase(
     case_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
-    test_case_service: TestCaseService = Depends(get_test_case_service)
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service)
 ):
-    """Get test case by ID"""
+    """Get test case by ID; If-None-Match is answered from the row version alone"""
     try:
-        test_case = test_case_service.get_test_case(case_id, current_user.id)
+        if if_none_match:
+            version = await test_case_service.get_test_case_version(
+                case_id, current_user.id
+            )
+            if version is None:
+                raise HTTPException(status_code=404, detail="Test case not found")
+            etag = test_case_etag(case_id, version)
+            if none_match(if_none_match, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+        
+        test_case = await test_case_service.get_test_case(case_id, current_user.id)
         if not test_case:
             raise HTTPException(status_code=404, detail="Test case not found")
+        response.headers["ETag"] = test_case_etag(test_case.id, test_case.version)
         return test_case
     except ValueError as e:
         raise HTTPException(status_code=403, detail=str(e))
@@ -108,15 +336,29 @@ async def get_testcase(
 async def update_testcase(
     case_id: int,
     test_case_data: TestCaseUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
-    test_case_service: TestCaseService = Depends(get_test_case_service)
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service)
 ):
-    """Update test case"""
+    """Update test case; with If-Match only if the ETag is still current (else 412)"""
     try:
-        updated_test_case = test_case_service.update_test_case(case_id, test_case_data, current_user.id)
+        expected_version = if_match_version(if_match, case_id) if if_match else None
+    except ValueError as e:
+        raise HTTPException(status_code=412, detail=str(e))
+    
+    try:
+        updated_test_case = await test_case_service.update_test_case(
+            case_id, test_case_data, current_user.id, expected_version
+        )
         if not updated_test_case:
             raise HTTPException(status_code=404, detail="Test case not found")
+        response.headers["ETag"] = test_case_etag(
+            updated_test_case.id, updated_test_case.version
+        )
         return updated_test_case
+    except PreconditionFailedError as e:
+        raise HTTPException(status_code=412, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=403, detail=str(e))
     except HTTPException:
@@ -129,11 +371,11 @@ async def update_testcase(
 async def delete_testcase(
     case_id: int,
     current_user: User = Depends(get_current_user),
-    test_case_service: TestCaseService = Depends(get_test_case_service)
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service)
 ):
     """Delete test case"""
     try:
-        success = test_case_service.delete_test_case(case_id, current_user.id)
+        success = await test_case_service.delete_test_case(case_id, current_user.id)
         if not success:
             raise HTTPException(status_code=404, detail="Test case not found")
         return {"message": "Test case deleted successfully"}
@@ -145,31 +387,96 @@ async def delete_testcase(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.post("/testcases/{case_id}/restore", response_model=TestCaseResponse)
+async def restore_testcase(
+    case_id: int,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service)
+):
+    """Move an archived test case back to its project's test cases"""
+    try:
+        test_case = await test_case_service.restore_test_case(case_id, current_user.id)
+        if not test_case:
+            raise HTTPException(status_code=404, detail="Archived test case not found")
+        response.headers["ETag"] = test_case_etag(test_case.id, test_case.version)
+        return test_case
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
 @router.get("/projects/{project_id}/testcases/stats")
 async def get_testcase_stats(
     project_id: int,
     current_user: User = Depends(get_current_user),
-    test_case_service: TestCaseService = Depends(get_test_case_service)
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service)
 ):
     """Get test case statistics for a project"""
     try:
-        return test_case_service.get_test_case_stats(project_id, current_user.id)
+        return await test_case_service.get_test_case_stats(project_id, current_user.id)
     except ValueError as e:
         raise HTTPException(status_code=403, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.get("/projects/{project_id}/testcases/similar/{case_id}")
+@router.get(
+    "/projects/{project_id}/testcases/search", response_model=TestCaseSearchResponse
+)
+async def search_testcases(
+    project_id: int,
+    q: str = Query(
+        ..., min_length=1, max_length=200, description="Search text (prefix matching)"
+    ),
+    page: int = Query(1, ge=1, description="Page number"),
+    size: int = Query(10, ge=1, le=100, description="Page size"),
+    include_archived: bool = Query(
+        False, description="Also search archived test cases"
+    ),
+    current_user: User = Depends(get_current_user),
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service),
+):
+    """Ranked full-text search over title, description, preconditions and steps"""
+    if not build_prefix_tsquery(q):
+        raise HTTPException(
+            status_code=400, detail="Search text has no searchable terms"
+        )
+    
+    try:
+        return await test_case_service.search_test_cases(
+            project_id, current_user.id, q, page, size, include_archived
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.get(
+    "/projects/{project_id}/testcases/similar/{case_id}",
+    response_model=SimilarTestCasesResponse,
+)
 async def get_similar_testcases(
     project_id: int,
     case_id: int,
+    limit: int = Query(
+        10, ge=1, le=50, description="Maximum number of similar test cases"
+    ),
+    min_similarity: float = Query(
+        0.3, ge=0, le=1, description="Minimum estimated similarity"
+    ),
     current_user: User = Depends(get_current_user),
-    test_case_service: TestCaseService = Depends(get_test_case_service)
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service),
 ):
     """Search for similar test cases"""
     try:
-        similar_test_cases = test_case_service.search_similar_test_cases(case_id, current_user.id)
+        similar_test_cases = await test_case_service.search_similar_test_cases(
+            case_id, current_user.id, limit, min_similarity, project_id=project_id
+        )
         return {"similar_test_cases": similar_test_cases}
     except ValueError as e:
         raise HTTPException(status_code=403, detail=str(e))
@@ -179,16 +486,48 @@ async def get_similar_testcases(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.post(
+    "/projects/{project_id}/testcases/duplicates",
+    response_model=SimilarTestCasesResponse,
+)
+async def find_duplicate_testcases(
+    project_id: int,
+    test_case_data: TestCaseCreate,
+    limit: int = Query(
+        10, ge=1, le=50, description="Maximum number of similar test cases"
+    ),
+    min_similarity: float = Query(
+        0.3, ge=0, le=1, description="Minimum estimated similarity"
+    ),
+    current_user: User = Depends(get_current_user),
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service),
+):
+    """Check a test case for near-duplicates before creating it"""
+    try:
+        similar_test_cases = await test_case_service.find_duplicate_test_cases(
+            project_id, test_case_data, current_user.id, limit, min_similarity
+        )
+        return {"similar_test_cases": similar_test_cases}
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
 @router.get("/projects/{project_id}/testcases/priority/{priority}", response_model=List[TestCaseResponse])
 async def get_testcases_by_priority(
     project_id: int,
     priority: TestCasePriority,
     current_user: User = Depends(get_current_user),
-    test_case_service: TestCaseService = Depends(get_test_case_service)
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service)
 ):
     """Get test cases by priority"""
     try:
-        return test_case_service.get_test_cases_by_priority(project_id, current_user.id, priority)
+        return ORJSONModelResponse(
+            await test_case_service.get_test_cases_by_priority(
+                project_id, current_user.id, priority
+            )
+        )
     except ValueError as e:
         raise HTTPException(status_code=403, detail=str(e))
     except Exception as e:
@@ -200,11 +539,15 @@ async def get_testcases_by_type(
     project_id: int,
     type: TestCaseType,
     current_user: User = Depends(get_current_user),
-    test_case_service: TestCaseService = Depends(get_test_case_service)
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service)
 ):
     """Get test cases by type"""
     try:
-        return test_case_service.get_test_cases_by_type(project_id, current_user.id, type)
+        return ORJSONModelResponse(
+            await test_case_service.get_test_cases_by_type(
+                project_id, current_user.id, type
+            )
+        )
     except ValueError as e:
         raise HTTPException(status_code=403, detail=str(e))
     except Exception as e:
@@ -216,32 +559,101 @@ async def get_testcases_by_status(
     project_id: int,
     status: TestCaseStatus,
     current_user: User = Depends(get_current_user),
-    test_case_service: TestCaseService = Depends(get_test_case_service)
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service)
 ):
     """Get test cases by status"""
     try:
-        return test_case_service.get_test_cases_by_status(project_id, current_user.id, status)
+        return ORJSONModelResponse(
+            await test_case_service.get_test_cases_by_status(
+                project_id, current_user.id, status
+            )
+        )
     except ValueError as e:
         raise HTTPException(status_code=403, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.put("/projects/{project_id}/testcases/bulk/status")
+@router.put(
+    "/projects/{project_id}/testcases/bulk/status",
+    response_model=TestCaseBulkUpdateResult,
+)
 async def bulk_update_testcase_status(
     project_id: int,
-    test_case_ids: List[int],
-    status: TestCaseStatus,
+    bulk_update: TestCaseBulkStatusUpdate,
     current_user: User = Depends(get_current_user),
-    test_case_service: TestCaseService = Depends(get_test_case_service)
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service)
 ):
     """Bulk update test case status"""
     try:
-        results = test_case_service.bulk_update_test_cases_status(
-            project_id, test_case_ids, status, current_user.id
+        return await test_case_service.bulk_update_test_cases_status(
+            project_id, bulk_update.test_case_ids, bulk_update.status, current_user.id
         )
-        return results
     except ValueError as e:
         raise HTTPException(status_code=403, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.put(
+    "/projects/{project_id}/testcases/bulk/priority",
+    response_model=TestCaseBulkUpdateResult,
+)
+async def bulk_update_testcase_priority(
+    project_id: int,
+    bulk_update: TestCaseBulkPriorityUpdate,
+    current_user: User = Depends(get_current_user),
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service)
+):
+    """Bulk update test case priority"""
+    try:
+        return await test_case_service.bulk_update_test_cases_priority(
+            project_id, bulk_update.test_case_ids, bulk_update.priority, current_user.id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.put(
+    "/projects/{project_id}/testcases/bulk/type",
+    response_model=TestCaseBulkUpdateResult,
+)
+async def bulk_update_testcase_type(
+    project_id: int,
+    bulk_update: TestCaseBulkTypeUpdate,
+    current_user: User = Depends(get_current_user),
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service)
+):
+    """Bulk update test case type"""
+    try:
+        return await test_case_service.bulk_update_test_cases_type(
+            project_id, bulk_update.test_case_ids, bulk_update.type, current_user.id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.put(
+    "/projects/{project_id}/testcases/bulk/tags",
+    response_model=TestCaseBulkUpdateResult,
+)
+async def bulk_update_testcase_tags(
+    project_id: int,
+    bulk_update: TestCaseBulkTagsUpdate,
+    current_user: User = Depends(get_current_user),
+    test_case_service: AsyncTestCaseService = Depends(get_test_case_service)
+):
+    """Bulk set, add or remove test case tags"""
+    try:
+        return await test_case_service.bulk_update_test_cases_tags(
+            project_id, bulk_update.test_case_ids, bulk_update.tags,
+            bulk_update.operation, current_user.id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
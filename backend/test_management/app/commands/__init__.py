@@ -0,0 +1 @@
+"""Maintenance commands for Test Management Service (run with ``python -m``)"""
@@ -0,0 +1,89 @@
+"""
+Archive deprecated and long-untouched test cases
+
+Moves test cases that are deprecated or were not updated for
+``TEST_CASE_ARCHIVE_UNTOUCHED_DAYS`` from test_cases to archived_test_cases,
+one transaction per batch in id order, so the working set stays small. Lists
+and searches still reach them with ``include_archived``, and
+``POST /testcases/{id}/restore`` moves one back. Run it periodically::
+    
+    python -m app.commands.archive_test_cases [--untouched-days N] [--batch-size N]
+        [--pause SECONDS]
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.database import get_db_session
+from app.repositories.archive_repository import TestCaseArchiveRepository
+from app.services.similarity_service import SimilarityService
+from core.config import settings
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def archive(
+    db: Session,
+    untouched_days: int = settings.TEST_CASE_ARCHIVE_UNTOUCHED_DAYS,
+    batch_size: int = 1000,
+    pause: float = 0.0,
+    max_batches: Optional[int] = None
+) -> int:
+    """Archive test cases batch by batch (committing each); returns how many moved"""
+    repository = TestCaseArchiveRepository(db)
+    similarity_service = SimilarityService(db)
+    untouched_before = datetime.utcnow() - timedelta(days=untouched_days)
+    
+    archived, last_id, batches = 0, 0, 0
+    while max_batches is None or batches < max_batches:
+        ids = repository.archive_batch(untouched_before, last_id, batch_size)
+        if not ids:
+            break
+        # Archived test cases are no longer duplicate candidates
+        similarity_service.remove_test_cases(ids)
+        db.commit()
+        
+        archived += len(ids)
+        last_id = ids[-1]
+        batches += 1
+        logger.info(f"Archived {archived} test cases (last id {last_id})")
+        if pause:
+            time.sleep(pause)
+    return archived
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--untouched-days",
+        type=int,
+        default=settings.TEST_CASE_ARCHIVE_UNTOUCHED_DAYS,
+        help="Archive test cases not updated for this many days "
+        "(deprecated ones always)",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="Test cases moved per transaction"
+    )
+    parser.add_argument(
+        "--pause", type=float, default=0.0, help="Seconds to sleep between batches"
+    )
+    args = parser.parse_args(argv)
+    
+    db = get_db_session()
+    try:
+        archived = archive(db, args.untouched_days, args.batch_size, args.pause)
+    finally:
+        db.close()
+    
+    print(f"{archived} test case(s) archived")
+
+
+if __name__ == "__main__":
+    main()
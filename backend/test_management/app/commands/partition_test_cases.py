@@ -0,0 +1,285 @@
+"""
+Move test_cases into its hash-partitioned replacement online
+
+Run after database/migrations/optional/test_cases_hash_partitioning.sql has
+created ``test_cases_partitioned`` and the trigger that mirrors every write
+on ``test_cases`` into it. Existing rows are copied in id order, one short
+transaction per batch, so the service keeps serving reads and writes::
+    
+    python -m app.commands.partition_test_cases [--batch-size N] [--pause SECONDS]
+        [--start-id ID]
+
+``--swap`` then locks test_cases, copies or removes whatever still differs,
+checks the row counts and puts the partitioned table in its place (triggers,
+views, sequence ownership and foreign keys referencing test_cases move with
+it). The old table stays as ``test_cases_unpartitioned``::
+    
+    python -m app.commands.partition_test_cases --swap
+"""
+
+import argparse
+import time
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.database import get_db_session
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+SOURCE = "test_cases"
+TARGET = "test_cases_partitioned"
+RETIRED = "test_cases_unpartitioned"
+SYNC_TRIGGER = "test_cases_partition_sync"
+
+_ON_DELETE = {
+    "a": "NO ACTION",
+    "r": "RESTRICT",
+    "c": "CASCADE",
+    "n": "SET NULL",
+    "d": "SET DEFAULT",
+}
+
+
+def copy_columns(db: Session) -> str:
+    """Comma-separated stored (non-generated) columns of test_cases"""
+    return db.execute(
+        text(
+            "SELECT string_agg(quote_ident(column_name), ', ' "
+            "ORDER BY ordinal_position) "
+            "FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = :table "
+            "AND is_generated = 'NEVER'"
+        ),
+        {"table": SOURCE},
+    ).scalar()
+
+
+def copy_batches(
+    db: Session,
+    batch_size: int = 5000,
+    pause: float = 0.0,
+    start_id: int = 0,
+    max_batches: Optional[int] = None
+) -> Tuple[int, int]:
+    """
+    Copy test_cases rows with ``id > start_id`` into the partitioned table.
+    
+    Each batch locks its source rows ``FOR SHARE`` while copying them, so a
+    concurrent update waits for the batch and its trigger then sees the
+    copied row. Rows already mirrored by the trigger are left alone. Returns
+    ``(rows read, last id)``; rerun with ``start_id`` to resume.
+    """
+    columns = copy_columns(db)
+    statement = text(f"""
+        WITH batch AS (
+            SELECT * FROM {SOURCE} WHERE id > :after ORDER BY id LIMIT :limit FOR SHARE
+        ), copied AS (
+            INSERT INTO {TARGET} ({columns}) SELECT {columns} FROM batch
+            ON CONFLICT (project_id, id) DO NOTHING
+        )
+        SELECT count(*), max(id) FROM batch
+    """)
+    
+    total, last_id, batches = 0, start_id, 0
+    while max_batches is None or batches < max_batches:
+        count, batch_last_id = db.execute(
+            statement, {"after": last_id, "limit": batch_size}
+        ).one()
+        db.commit()
+        if not count:
+            break
+        total += count
+        last_id = batch_last_id
+        batches += 1
+        logger.info(f"Copied {total} test cases into {TARGET} (last id {last_id})")
+        if pause:
+            time.sleep(pause)
+    return total, last_id
+
+
+def _reconcile(db: Session, columns: str) -> None:
+    """Make the partitioned copy match test_cases exactly (test_cases must be locked)"""
+    removed = db.execute(text(f"""
+        DELETE FROM {TARGET} AS target WHERE NOT EXISTS (
+            SELECT 1 FROM {SOURCE} AS source
+            WHERE source.project_id = target.project_id AND source.id = target.id
+        )
+    """)).rowcount
+    added = db.execute(text(f"""
+        INSERT INTO {TARGET} ({columns})
+        SELECT {columns} FROM {SOURCE} AS source WHERE NOT EXISTS (
+            SELECT 1 FROM {TARGET} AS target
+            WHERE target.project_id = source.project_id AND target.id = source.id
+        )
+    """)).rowcount
+    logger.info(f"Reconciled {TARGET}: {added} row(s) added, {removed} removed")
+    
+    source_count = db.execute(text(f"SELECT count(*) FROM {SOURCE}")).scalar()
+    target_count = db.execute(text(f"SELECT count(*) FROM {TARGET}")).scalar()
+    if source_count != target_count:
+        raise RuntimeError(
+            f"{TARGET} has {target_count} rows, {SOURCE} has {source_count}"
+        )
+
+
+def _referencing_foreign_keys(db: Session) -> List[Tuple[str, str, str, str]]:
+    """
+    ``(table, constraint, column, on delete)`` of the foreign keys to test_cases
+    
+    Only single-column keys on tables with a project_id column can move.
+    """
+    rows = db.execute(
+        text("""
+            SELECT c.conrelid::regclass::text, quote_ident(c.conname),
+                   quote_ident(a.attname), c.confdeltype,
+                   array_length(c.conkey, 1),
+                   EXISTS (SELECT 1 FROM pg_attribute p
+                           WHERE p.attrelid = c.conrelid
+                             AND p.attname = 'project_id'
+                             AND NOT p.attisdropped)
+            FROM pg_constraint c
+            JOIN pg_attribute a
+              ON a.attrelid = c.conrelid AND a.attnum = c.conkey[1]
+            WHERE c.contype = 'f'
+              AND c.confrelid = CAST(:table AS regclass)
+              AND c.conrelid <> c.confrelid
+        """),
+        {"table": SOURCE},
+    ).all()
+    
+    foreign_keys = []
+    for table, constraint, column, on_delete, width, has_project_id in rows:
+        # Partitioned test_cases is unique on (project_id, id) only
+        if width != 1 or not has_project_id:
+            raise RuntimeError(
+                f"Foreign key {constraint} on {table} cannot reference (project_id, id)"
+            )
+        foreign_keys.append((table, constraint, column, _ON_DELETE[on_delete]))
+    return foreign_keys
+
+
+def swap(db: Session) -> List[str]:
+    """
+    Replace test_cases by the partitioned table in one transaction.
+    
+    Returns the foreign key constraints recreated ``NOT VALID``; they are
+    validated afterwards without blocking writes.
+    """
+    columns = copy_columns(db)
+    db.execute(text(f"LOCK TABLE {SOURCE}, {TARGET} IN ACCESS EXCLUSIVE MODE"))
+    _reconcile(db, columns)
+    
+    # Collected while the names still point at the old table
+    triggers = (
+        db.execute(
+            text(
+                "SELECT pg_get_triggerdef(oid) FROM pg_trigger "
+                "WHERE tgrelid = CAST(:table AS regclass) "
+                "AND NOT tgisinternal AND tgname <> :sync"
+            ),
+            {"table": SOURCE, "sync": SYNC_TRIGGER},
+        )
+        .scalars()
+        .all()
+    )
+    views = db.execute(
+        text("""
+            SELECT DISTINCT view.oid::regclass::text, pg_get_viewdef(view.oid)
+            FROM pg_depend dependency
+            JOIN pg_rewrite rule ON rule.oid = dependency.objid
+            JOIN pg_class view ON view.oid = rule.ev_class
+            WHERE dependency.refobjid = CAST(:table AS regclass)
+              AND view.oid <> CAST(:table AS regclass)
+        """),
+        {"table": SOURCE},
+    ).all()
+    foreign_keys = _referencing_foreign_keys(db)
+    sequence = db.execute(
+        text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": SOURCE}
+    ).scalar()
+    
+    db.execute(text(f"DROP TRIGGER {SYNC_TRIGGER} ON {SOURCE}"))
+    for table, constraint, _, _ in foreign_keys:
+        db.execute(text(f"ALTER TABLE {table} DROP CONSTRAINT {constraint}"))
+    
+    db.execute(text(f"ALTER TABLE {SOURCE} RENAME TO {RETIRED}"))
+    db.execute(text(f"ALTER TABLE {TARGET} RENAME TO {SOURCE}"))
+    if sequence:
+        # Otherwise dropping the retired table would drop the shared id sequence
+        db.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {SOURCE}.id"))
+    
+    # Catalog-generated DDL goes to the driver as is (no bind parameter parsing)
+    connection = db.connection()
+    for definition in triggers:
+        connection.exec_driver_sql(definition)
+    for view, definition in views:
+        connection.exec_driver_sql(f"CREATE OR REPLACE VIEW {view} AS {definition}")
+    for table, constraint, column, on_delete in foreign_keys:
+        db.execute(
+            text(
+                f"ALTER TABLE {table} ADD CONSTRAINT {constraint} "
+                f"FOREIGN KEY (project_id, {column}) "
+                f"REFERENCES {SOURCE} (project_id, id) ON DELETE {on_delete} NOT VALID"
+            )
+        )
+    db.commit()
+    logger.info(
+        f"Swapped {SOURCE} for the hash-partitioned table; old rows kept in {RETIRED}"
+    )
+    
+    for table, constraint, _, _ in foreign_keys:
+        db.execute(text(f"ALTER TABLE {table} VALIDATE CONSTRAINT {constraint}"))
+        db.commit()
+    db.execute(text(f"ANALYZE {SOURCE}"))
+    db.commit()
+    return [constraint for _, constraint, _, _ in foreign_keys]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=5000, help="Rows copied per transaction"
+    )
+    parser.add_argument(
+        "--pause", type=float, default=0.0, help="Seconds to sleep between batches"
+    )
+    parser.add_argument(
+        "--start-id",
+        type=int,
+        default=0,
+        help="Resume the copy after this test case ID",
+    )
+    parser.add_argument(
+        "--swap",
+        action="store_true",
+        help="Reconcile and replace test_cases by the partitioned table",
+    )
+    args = parser.parse_args(argv)
+    
+    db = get_db_session()
+    try:
+        if args.swap:
+            validated = swap(db)
+            print(
+                "test_cases is now hash-partitioned by project_id; "
+                f"foreign keys moved: {validated}"
+            )
+        else:
+            copied, last_id = copy_batches(
+                db, args.batch_size, args.pause, args.start_id
+            )
+            print(
+                f"{copied} test case(s) copied (last id {last_id}); "
+                "run with --swap when done"
+            )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Purge soft-deleted test cases and projects in the background
+
+Deletes only mark rows (``deleted_at``); this worker removes them in bounded
+batches, one short transaction per batch with a pause in between, so a
+project with 100k test cases never holds one huge transaction or starves
+other writers. Soft-deleted test cases go first, then project purge jobs in
+queue order (progress visible at ``GET /projects/purge-jobs/{id}``). Several
+workers may run side by side. Run it as a long-lived process::
+    
+    python -m app.commands.purge_deleted [--batch-size N] [--pause SECONDS]
+        [--interval SECONDS] [--once]
+"""
+
+import argparse
+import time
+from typing import List, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.database import get_db_session
+from app.repositories.purge_repository import PurgeRepository
+from core.config import settings
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def purge(
+    db: Session,
+    batch_size: int = settings.PURGE_BATCH_SIZE,
+    pause: float = settings.PURGE_PAUSE_SECONDS,
+    max_batches: Optional[int] = None
+) -> Tuple[int, int]:
+    """
+    Purge batch by batch (committing each) until nothing is left.
+    
+    Returns how many test cases and projects were purged.
+    """
+    repository = PurgeRepository(db)
+    
+    test_cases, projects, batches = 0, 0, 0
+    while max_batches is None or batches < max_batches:
+        purged = repository.purge_test_cases_batch(batch_size)
+        if purged:
+            db.commit()
+            test_cases += purged
+            logger.info(f"Purged {test_cases} soft-deleted test cases")
+        else:
+            job = repository.next_project_job()
+            if job is None:
+                db.commit()
+                break
+            
+            job_id, project_id = job.id, job.project_id
+            try:
+                done = repository.purge_project_batch(job, batch_size)
+                db.commit()
+            except SQLAlchemyError as e:
+                db.rollback()
+                logger.error(f"Purge job {job_id} (project {project_id}) failed: {e}")
+                repository.fail_job(job_id, str(e))
+                db.commit()
+                continue
+            
+            if done:
+                projects += 1
+                logger.info(
+                    f"Purge job {job_id} completed: project {project_id} removed"
+                )
+        
+        batches += 1
+        if pause:
+            time.sleep(pause)
+    return test_cases, projects
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--batch-size", type=int, default=settings.PURGE_BATCH_SIZE,
+                        help="Rows hard-deleted per transaction")
+    parser.add_argument("--pause", type=float, default=settings.PURGE_PAUSE_SECONDS,
+                        help="Seconds to sleep between batches")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=settings.PURGE_POLL_INTERVAL_SECONDS,
+        help="Seconds to wait for new work once everything is purged",
+    )
+    parser.add_argument(
+        "--once", action="store_true", help="Exit once everything is purged"
+    )
+    args = parser.parse_args(argv)
+    
+    db = get_db_session()
+    try:
+        while True:
+            test_cases, projects = purge(db, args.batch_size, args.pause)
+            if test_cases or projects:
+                print(f"{test_cases} test case(s) and {projects} project(s) purged")
+            if args.once:
+                break
+            time.sleep(args.interval)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
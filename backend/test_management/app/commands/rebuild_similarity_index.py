@@ -0,0 +1,86 @@
+"""
+Backfill or rebuild the test case similarity index
+
+Signatures and LSH buckets are maintained when test cases are created,
+updated or imported, so test cases that existed before the index (V5) have
+none and never show up as duplicate candidates. This command indexes them in
+id order, one transaction per batch with an optional pause in between. By
+default only test cases without a signature are indexed; ``--all``
+recomputes every entry (e.g. after changing the MinHash parameters)::
+    
+    python -m app.commands.rebuild_similarity_index [--project-id ID ...] [--all]
+        [--batch-size N] [--pause SECONDS]
+"""
+
+import argparse
+import time
+from typing import List, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from app.database import get_db_session
+from app.repositories.similarity_repository import SimilarityRepository
+from app.services.similarity_service import SimilarityService
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def rebuild(
+    db: Session,
+    project_ids: Optional[Sequence[int]] = None,
+    missing_only: bool = True,
+    batch_size: int = 1000,
+    pause: float = 0.0,
+    max_batches: Optional[int] = None
+) -> int:
+    """Index test cases batch by batch (committing each); returns how many"""
+    repository = SimilarityRepository(db)
+    similarity_service = SimilarityService(db)
+    
+    indexed, last_id, batches = 0, 0, 0
+    while max_batches is None or batches < max_batches:
+        contents = repository.contents_batch(
+            last_id, batch_size, project_ids, missing_only
+        )
+        if not contents:
+            break
+        similarity_service.index_contents(contents)
+        db.commit()
+        
+        indexed += len(contents)
+        last_id = contents[-1][0]
+        batches += 1
+        logger.info(f"Indexed {indexed} test cases (last id {last_id})")
+        if pause:
+            time.sleep(pause)
+    return indexed
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--project-id", type=int, action="append", dest="project_ids",
+                        help="Project to index (repeatable; default: all projects)")
+    parser.add_argument("--all", action="store_true",
+                        help="Recompute every entry, not only missing ones")
+    parser.add_argument("--batch-size", type=int, default=1000,
+                        help="Test cases indexed per transaction")
+    parser.add_argument("--pause", type=float, default=0.0,
+                        help="Seconds to sleep between batches")
+    args = parser.parse_args(argv)
+    
+    db = get_db_session()
+    try:
+        indexed = rebuild(
+            db, args.project_ids, not args.all, args.batch_size, args.pause
+        )
+    finally:
+        db.close()
+    
+    print(f"{indexed} test case(s) indexed")
+
+
+if __name__ == "__main__":
+    main()
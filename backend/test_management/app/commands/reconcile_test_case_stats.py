@@ -0,0 +1,73 @@
+"""
+Reconcile per-project test case counters with the test_cases table
+
+Counters are maintained transactionally, but writes that bypass the service
+(manual SQL, restores, seeding) make them drift. This command recounts each
+project and rewrites the counters of projects that drifted::
+    
+    python -m app.commands.reconcile_test_case_stats [--project-id ID ...] [--dry-run]
+"""
+
+import argparse
+from typing import Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.database import get_db_session
+from app.repositories.stat_counter_repository import TestCaseStatsRepository
+from app.repositories.test_case_repository import TestCaseRepository
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def reconcile(
+    db: Session, project_ids: Optional[Iterable[int]] = None, dry_run: bool = False
+) -> List[int]:
+    """Rebuild the counters of drifted projects (one transaction each); returns IDs"""
+    stats_repository = TestCaseStatsRepository(db)
+    test_case_repository = TestCaseRepository(db)
+    
+    drifted = []
+    for project_id in (
+        project_ids if project_ids is not None else stats_repository.project_ids()
+    ):
+        counted = stats_repository.get(project_id)
+        actual = test_case_repository.get_stats(project_id)
+        db.rollback()
+        if counted == actual:
+            continue
+        
+        drifted.append(project_id)
+        logger.warning(
+            f"Test case counters of project {project_id} drifted: {counted} != {actual}"
+        )
+        if not dry_run:
+            stats_repository.rebuild(project_id)
+            db.commit()
+    return drifted
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--project-id", type=int, action="append", dest="project_ids",
+                        help="Project to reconcile (repeatable; default: all projects)")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Only report drifted projects"
+    )
+    args = parser.parse_args(argv)
+    
+    db = get_db_session()
+    try:
+        drifted = reconcile(db, args.project_ids, args.dry_run)
+    finally:
+        db.close()
+    
+    action = "found" if args.dry_run else "rebuilt"
+    print(f"{len(drifted)} project(s) with drifted counters {action}: {drifted}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,23 +3,86 @@ Database connection and session management for Test Management Service
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
+from app.db_pool import instrument_engine, pool_options
+from app.db_routing import RoutingSession
 from core.config import settings
 
-# Create database engine
+# Async drivers for the synchronous DATABASE_URL dialects
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """Return the asyncio-driver form of a database URL"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend in ASYNC_DRIVERS and parsed.drivername != ASYNC_DRIVERS[backend]:
+        parsed = parsed.set(drivername=ASYNC_DRIVERS[backend])
+    return parsed.render_as_string(hide_password=False)
+
+
+# Create database engine; pooling is configured in core.config (see app.db_pool)
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,  # Log SQL queries in debug mode
-    pool_pre_ping=True,   # Check connections before use
-    pool_recycle=300,     # Recycle connections after 5 minutes
+    **pool_options(settings.DATABASE_URL, is_async=False)
 )
+instrument_engine(engine, "sync")
+
+# Read replica engines; sessions route opted-in reads to them (see app.db_routing)
+replica_engines = []
+for index, replica_url in enumerate(settings.DATABASE_REPLICA_URLS):
+    replica_engine = create_engine(
+        replica_url, echo=settings.DEBUG, **pool_options(replica_url, is_async=False)
+    )
+    instrument_engine(replica_engine, f"replica{index}")
+    replica_engines.append(replica_engine)
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    class_=RoutingSession,
+    replicas=replica_engines,
+)
+
+# Create async engine (asyncpg) for the request path
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=settings.DEBUG,
+    **pool_options(ASYNC_DATABASE_URL, is_async=True)
+)
+instrument_engine(async_engine.sync_engine, "async")
+
+async_replica_engines = []
+for index, replica_url in enumerate(settings.DATABASE_REPLICA_URLS):
+    replica_url = to_async_url(replica_url)
+    replica_engine = create_async_engine(
+        replica_url, echo=settings.DEBUG, **pool_options(replica_url, is_async=True)
+    )
+    instrument_engine(replica_engine.sync_engine, f"async_replica{index}")
+    async_replica_engines.append(replica_engine)
+
+# Create async session factory; objects stay usable after commit
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    replicas=[replica.sync_engine for replica in async_replica_engines],
+    autoflush=False,
+    expire_on_commit=False
+)
 
 # Base class for SQLAlchemy models
 Base = declarative_base()
@@ -45,6 +108,22 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency yielding an AsyncSession for one request.
+    
+    The session is the request's unit of work: async service write calls
+    commit it once (``AsyncService._write``), before the response is sent;
+    anything left uncommitted when the request fails is rolled back.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+
+
 def init_db() -> None:
     """Initialize database tables"""
     # Import all models here to ensure they are registered
@@ -59,4 +138,13 @@ def get_db_session() -> Session:
 
 def close_db() -> None:
     """Close database connections"""
-    engine.dispose()
\ No newline at end of file
+    engine.dispose()
+    for replica in replica_engines:
+        replica.dispose()
+
+
+async def close_async_db() -> None:
+    """Close async database connections"""
+    await async_engine.dispose()
+    for replica in async_replica_engines:
+        await replica.dispose()
@@ -0,0 +1,183 @@
+"""
+Instrumented connection pools and engine pool options
+"""
+
+import time
+from typing import Any, Dict, Iterable, List, Tuple
+from uuid import uuid4
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+from core.config import settings
+from core.metrics import registry
+
+# Pool pre-ping strategies (settings.DB_POOL_PRE_PING)
+PRE_PING_ALWAYS = "always"
+PRE_PING_IDLE = "idle"
+PRE_PING_NEVER = "never"
+
+CONNECTION_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 10, 15, 20, 30, 50, 75, 100)
+
+checkout_wait_seconds = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    ["pool"],
+)
+checked_out_at_checkout = registry.histogram(
+    "db_pool_checked_out_connections_at_checkout",
+    "Connections in use right after a checkout",
+    ["pool"],
+    buckets=CONNECTION_COUNT_BUCKETS,
+)
+overflow_at_checkout = registry.histogram(
+    "db_pool_overflow_connections_at_checkout",
+    "Overflow connections open right after a checkout",
+    ["pool"],
+    buckets=CONNECTION_COUNT_BUCKETS,
+)
+checkout_timeouts = registry.counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after DB_POOL_TIMEOUT",
+    ["pool"],
+)
+pre_pings = registry.counter(
+    "db_pool_pre_pings_total", "Liveness pings issued on checkout", ["pool"]
+)
+
+_pools: List["InstrumentedPoolMixin"] = []
+
+
+class InstrumentedPoolMixin:
+    """Time checkouts and sample pool occupancy into the metrics registry"""
+    
+    metrics_name = "default"
+    
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            checkout_timeouts.inc(pool=self.metrics_name)
+            raise
+        
+        checkout_wait_seconds.observe(
+            time.perf_counter() - start, pool=self.metrics_name
+        )
+        if isinstance(self, QueuePool):
+            checked_out_at_checkout.observe(self.checkedout(), pool=self.metrics_name)
+            overflow_at_checkout.observe(
+                max(0, self.overflow()), pool=self.metrics_name
+            )
+        return connection
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class InstrumentedNullPool(InstrumentedPoolMixin, NullPool):
+    pass
+
+
+def _pool_gauge(read) -> Iterable[Tuple[Tuple[str, ...], float]]:
+    for pool in _pools:
+        if isinstance(pool, QueuePool):
+            yield (pool.metrics_name,), read(pool)
+
+
+registry.gauge_callback("db_pool_size", "Configured pool size", ["pool"],
+                        lambda: _pool_gauge(lambda pool: pool.size()))
+registry.gauge_callback(
+    "db_pool_checked_out_connections",
+    "Connections currently in use",
+    ["pool"],
+    lambda: _pool_gauge(lambda pool: pool.checkedout()),
+)
+registry.gauge_callback(
+    "db_pool_overflow_connections",
+    "Overflow connections currently open",
+    ["pool"],
+    lambda: _pool_gauge(lambda pool: max(0, pool.overflow())),
+)
+
+
+def pool_options(url: str, is_async: bool) -> Dict[str, Any]:
+    """
+    ``create_engine`` keyword arguments for the configured pooling mode.
+    
+    In PgBouncer (transaction pooling) mode PgBouncer owns the pool, so the
+    engine opens a connection per checkout and asyncpg stops caching prepared
+    statements, which do not survive a server connection switch.
+    """
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    
+    if settings.DB_PGBOUNCER_MODE:
+        options: Dict[str, Any] = {"poolclass": InstrumentedNullPool}
+        if is_async:
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+        return options
+    
+    return {
+        "poolclass": (
+            InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool
+        ),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING == PRE_PING_ALWAYS,
+    }
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """Name the engine's pool for metrics and install the idle pre-ping"""
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedPoolMixin):
+        return
+    
+    pool.metrics_name = name
+    _pools.append(pool)
+    
+    if settings.DB_POOL_PRE_PING == PRE_PING_IDLE and isinstance(pool, QueuePool):
+        _install_idle_pre_ping(engine, name)
+
+
+def _install_idle_pre_ping(engine: Engine, name: str) -> None:
+    """
+    Ping only connections that sat idle in the pool longer than
+    DB_POOL_PRE_PING_IDLE_SECONDS, instead of on every checkout.
+    """
+    dialect = engine.dialect
+    idle_seconds = settings.DB_POOL_PRE_PING_IDLE_SECONDS
+    
+    @event.listens_for(engine.pool, "checkin")
+    def _record_checkin(dbapi_connection, connection_record) -> None:
+        connection_record.info["checked_in_at"] = time.monotonic()
+    
+    @event.listens_for(engine.pool, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy) -> None:
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        
+        pre_pings.inc(pool=name)
+        try:
+            alive = dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            alive = False
+            if not dialect.is_disconnect(e, dbapi_connection, None):
+                raise
+        if not alive:
+            # The pool discards the connection and retries with a fresh one
+            raise exc.DisconnectionError("Idle connection failed pre-ping")
@@ -0,0 +1,85 @@
+"""
+Read-replica routing for SQLAlchemy sessions
+"""
+
+import random
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Generator, List, Optional, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_REPLICA_READS_KEY = "replica_reads"
+_PRIMARY_READS_KEY = "primary_reads"
+_STICKY_PRIMARY_KEY = "sticky_primary"
+
+
+class RoutingSession(Session):
+    """
+    Session that sends opted-in reads to a read replica.
+    
+    Reads go to a random replica only inside ``replica_reads()`` (or a
+    ``@replica_read`` repository method) and only until the session writes:
+    after a flush or a DML statement every later query of the session stays on
+    the primary, so a request always reads its own writes. Flushes and DML
+    always use the primary, and so does everything inside ``primary_reads()``.
+    """
+    
+    def __init__(
+        self, *args: Any, replicas: Optional[List[Engine]] = None, **kwargs: Any
+    ):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas or []
+    
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.replicas and not self._flushing:
+            if clause is not None and getattr(clause, "is_dml", False):
+                self.info[_STICKY_PRIMARY_KEY] = True
+            elif (
+                self.info.get(_REPLICA_READS_KEY)
+                and not self.info.get(_STICKY_PRIMARY_KEY)
+                and not self.info.get(_PRIMARY_READS_KEY)
+            ):
+                return random.choice(self.replicas)
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _stick_to_primary(session: Session, flush_context) -> None:
+    session.info[_STICKY_PRIMARY_KEY] = True
+
+
+@contextmanager
+def replica_reads(session: Any) -> Generator[None, None, None]:
+    """Allow queries issued in this block to use a replica (Session or AsyncSession)"""
+    info = session.info
+    info[_REPLICA_READS_KEY] = info.get(_REPLICA_READS_KEY, 0) + 1
+    try:
+        yield
+    finally:
+        info[_REPLICA_READS_KEY] -= 1
+
+
+@contextmanager
+def primary_reads(session: Any) -> Generator[None, None, None]:
+    """Keep queries issued in this block on the primary, even replica-safe ones"""
+    info = session.info
+    info[_PRIMARY_READS_KEY] = info.get(_PRIMARY_READS_KEY, 0) + 1
+    try:
+        yield
+    finally:
+        info[_PRIMARY_READS_KEY] -= 1
+
+
+def replica_read(method: F) -> F:
+    """Mark a repository read method (using ``self.db``) as replica-safe"""
+    @wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        with replica_reads(self.db):
+            return method(self, *args, **kwargs)
+    
+    return wrapper
@@ -2,20 +2,31 @@
 JWT authentication middleware for Test Management Service
 """
 
-from typing import Optional, Dict, Any
+import time
+import uuid
+from typing import Optional, Dict, Any, Tuple
 from fastapi import HTTPException, status, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 
-from app.database import get_db
-from app.services.project_service import ProjectService
+from app.database import get_async_db, get_db_session
+from app.models.user import UserResponse
+from app.services.project_service import AsyncProjectService
 from app.services.user_service import UserService
+from core.cache import TTLCache
 from core.config import settings
+from core.revocation import revocation_list
 
 security = HTTPBearer()
 
+# Verified claims and resolved user per raw token, so that authenticated
+# requests skip signature verification and the user lookup on a hit
+token_cache = TTLCache(settings.AUTH_CACHE_MAX_SIZE, settings.AUTH_CACHE_TTL_SECONDS)
+
 class JWTBearer:
     """JWT token validation and extraction"""
     
@@ -28,7 +39,9 @@ class JWTBearer:
         """Create JWT access token"""
         to_encode = data.copy()
         expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
-        to_encode.update({"exp": expire})
+        to_encode.update(
+            {"exp": expire, "iat": datetime.utcnow(), "jti": uuid.uuid4().hex}
+        )
         
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
         return encoded_jwt
@@ -41,72 +54,151 @@ class JWTBearer:
         except JWTError:
             return None
     
-    def get_current_user(
-        credentials: HTTPAuthorizationCredentials = Depends(security),
-        db: Session = Depends(get_db)
-    ) -> Dict[str, Any]:
-        """Get current user from JWT token"""
-        token = credentials.credentials
+    def authenticate(
+        self, token: str, db: Optional[Session] = None
+    ) -> Tuple[Dict[str, Any], UserResponse]:
+        """
+        Return the verified claims and user of a token.
+        
+        Hits in the token cache skip decoding and the user query; a database
+        session is only opened (unless one is given) on a miss. Revocations
+        are checked on every call.
+        """
+        cached = token_cache.get(token)
+        if cached is None:
+            claims, user = self._verify_and_load(token, db)
+            ttl = min(settings.AUTH_CACHE_TTL_SECONDS, claims["exp"] - time.time())
+            if ttl > 0:
+                token_cache.set(token, (claims, user), ttl)
+        else:
+            claims, user = cached
+        
+        if revocation_list.is_revoked(claims.get("jti"), user.id):
+            raise self.reject_revoked(token)
+        
+        return claims, user
+    
+    def _verify_and_load(
+        self, token: str, db: Optional[Session]
+    ) -> Tuple[Dict[str, Any], UserResponse]:
+        """Decode the token and resolve its user from the database"""
         payload = self.verify_token(token)
         
         if payload is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+            raise self._unauthorized("Invalid authentication credentials")
         
         user_id: int = payload.get("user_id")
         username: str = payload.get("username")
         email: str = payload.get("email")
         
-        if user_id is None or username is None or email is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token payload",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        if user_id is None or username is None or email is None or "exp" not in payload:
+            raise self._unauthorized("Invalid token payload")
         
         # Verify user exists in database
-        user_service = UserService(db)
-        user = user_service.get_user_by_id(user_id)
+        session = db if db is not None else get_db_session()
+        try:
+            user = UserService(session).get_user_by_id(user_id)
+        finally:
+            if db is None:
+                session.close()
         
         if user is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+            raise self._unauthorized("User not found")
+        
+        if not user.is_active:
+            raise self._unauthorized("User is disabled")
         
+        return payload, user
+    
+    def revoke_token(self, token: str) -> None:
+        """Revoke a token (logout) until it expires"""
+        payload = self.verify_token(token)
+        token_cache.delete(token)
+        if payload and payload.get("jti"):
+            revocation_list.revoke_token(payload["jti"], payload["exp"])
+    
+    def get_current_user(
+        self, credentials: HTTPAuthorizationCredentials
+    ) -> Dict[str, Any]:
+        """Get current user from JWT token"""
+        claims, user = self.authenticate(credentials.credentials)
         return {
-            "user_id": user_id,
-            "username": username,
-            "email": email
+            "user_id": user.id,
+            "username": claims["username"],
+            "email": claims["email"]
         }
+    
+    def reject_revoked(self, token: str) -> HTTPException:
+        """Forget a revoked token and return the error to raise"""
+        token_cache.delete(token)
+        return self._unauthorized("Token has been revoked")
+    
+    @staticmethod
+    def _unauthorized(detail: str) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=detail,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+jwt_bearer = JWTBearer()
+
+
+async def _authenticate(token: str) -> Tuple[Dict[str, Any], UserResponse]:
+    """
+    Authenticate on the loop for cache hits, in a worker thread otherwise.
+    
+    A cache hit only reads local revocation state; confirming a Bloom filter
+    hit against Redis also moves to a worker thread.
+    """
+    cached = token_cache.get(token)
+    if cached is None:
+        return await run_in_threadpool(jwt_bearer.authenticate, token)
+    
+    claims, user = cached
+    jti = claims.get("jti")
+    revoked = revocation_list.check_local(jti, user.id)
+    if revoked is None:
+        revoked = await run_in_threadpool(revocation_list.is_revoked, jti, user.id)
+    if revoked:
+        raise jwt_bearer.reject_revoked(token)
+    return claims, user
 
 
 # Dependency to get current authenticated user
 async def get_current_user_dependency(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> Dict[str, Any]:
     """Dependency function to get current user"""
-    jwt_bearer = JWTBearer()
-    return jwt_bearer.get_current_user(credentials, db)
+    claims, user = await _authenticate(credentials.credentials)
+    return {
+        "user_id": user.id,
+        "username": claims["username"],
+        "email": claims["email"]
+    }
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> UserResponse:
+    """Dependency function to get the current user model"""
+    _, user = await _authenticate(credentials.credentials)
+    return user
 
 
 def require_project_access(project_id: int):
     """Decorator to require project access"""
-    def project_access_dependency(
+    async def project_access_dependency(
         current_user: Dict[str, Any] = Depends(get_current_user_dependency),
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
     ):
         user_id = current_user["user_id"]
-        project_service = ProjectService(db)
+        project_service = AsyncProjectService(db)
         
         try:
             # This will raise an exception if user doesn't have access
-            project_service.get_project(project_id, user_id)
+            await project_service.get_project(project_id, user_id)
             return current_user
         except ValueError as e:
             raise HTTPException(
@@ -114,4 +206,4 @@ def require_project_access(project_id: int):
                 detail=str(e)
             )
     
-    return project_access_dependency
\ No newline at end of file
+    return project_access_dependency
@@ -0,0 +1,215 @@
+"""
+Response compression middleware for Test Management Service
+
+Compresses responses with brotli (when the ``brotli`` package is installed)
+or gzip, chosen from ``Accept-Encoding``. Only allowlisted content types are
+compressed, and buffered bodies below a minimum size are sent as they are.
+
+Streaming responses (exports) are compressed chunk by chunk with a sync
+flush after every chunk, so the client can decode each chunk as soon as it
+arrives instead of waiting for the compressor to fill its window. Strong
+ETags of compressed responses get the content coding appended (see
+``app.utils.etag``), since the bytes differ from the identity response. The
+suffix goes on whenever an encoding was negotiated, including 304s and
+bodies below the minimum size, so a revalidated response carries the tag
+the client stored.
+"""
+
+import zlib
+from typing import Iterable, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.etag import encoded_etag
+from core.metrics import registry
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+compression_bytes = registry.counter(
+    "http_compression_bytes_total",
+    "Response body bytes before (identity) and after compression, by encoding",
+    ("encoding", "stage"),
+)
+
+
+def choose_encoding(accept_encoding: str, encodings: Iterable[str]) -> Optional[str]:
+    """First of ``encodings`` (in server preference) the client accepts with q > 0"""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    
+    for encoding in encodings:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+class _Compressor:
+    """Incremental compressor of one response body"""
+    
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._zlib = zlib.compressobj(
+                gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+            )
+    
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        """Compress a chunk; ``flush`` makes everything so far decodable"""
+        if self.encoding == "br":
+            return self._brotli.process(data) + (self._brotli.flush() if flush else b"")
+        return self._zlib.compress(data) + (
+            self._zlib.flush(zlib.Z_SYNC_FLUSH) if flush else b""
+        )
+    
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing allowlisted responses with brotli or gzip"""
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        content_types: Iterable[str] = ("application/json",),
+        gzip_level: int = 5,
+        brotli_quality: int = 4,
+        encodings: Optional[Iterable[str]] = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = tuple(
+            content_type.lower() for content_type in content_types
+        )
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        available = ("br", "gzip") if brotli is not None else ("gzip",)
+        self.encodings: Tuple[str, ...] = tuple(
+            encoding for encoding in (encodings or available) if encoding in available
+        )
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = choose_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self.encodings
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        await self.app(scope, receive, _CompressingSend(self, encoding, send))
+    
+    def compressible(self, headers: Headers) -> bool:
+        """Whether a response with these headers may be compressed"""
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return content_type in self.content_types
+
+
+class _CompressingSend:
+    """``send`` wrapper that holds the response start until the first body chunk"""
+    
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+    
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            self.passthrough = not self.middleware.compressible(
+                Headers(raw=message["headers"])
+            )
+            if self.passthrough:
+                # A 304 has no content type; it stands for the encoded 200
+                if message["status"] == 304:
+                    headers = MutableHeaders(raw=message["headers"])
+                    self._tag(headers)
+                    message["headers"] = headers.raw
+                await self.send(message)
+            return
+        
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+        
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        
+        if self.start is not None:
+            start, self.start = self.start, None
+            # A buffered body too small to be worth it goes out as it is
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                headers = MutableHeaders(raw=start["headers"])
+                self._tag(headers)
+                start["headers"] = headers.raw
+                await self.send(start)
+                await self.send(message)
+                return
+            
+            self.compressor = _Compressor(
+                self.encoding,
+                self.middleware.gzip_level,
+                self.middleware.brotli_quality,
+            )
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = self.encoding
+            del headers["Content-Length"]
+            self._tag(headers)
+            if not more_body:
+                data = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(data))
+                start["headers"] = headers.raw
+                self._count(len(body), len(data))
+                await self.send(start)
+                await self.send({"type": "http.response.body", "body": data})
+                return
+            start["headers"] = headers.raw
+            await self.send(start)
+        
+        # Streaming: flush every chunk so it can be decoded on arrival
+        data = self.compressor.compress(body, flush=more_body)
+        if not more_body:
+            data += self.compressor.finish()
+        self._count(len(body), len(data))
+        await self.send(
+            {"type": "http.response.body", "body": data, "more_body": more_body}
+        )
+    
+    def _tag(self, headers: MutableHeaders) -> None:
+        """Name the negotiated representation: suffix a strong ETag, vary on it"""
+        headers.add_vary_header("Accept-Encoding")
+        if "etag" in headers:
+            headers["ETag"] = encoded_etag(headers["etag"], self.encoding)
+    
+    def _count(self, identity: int, compressed: int) -> None:
+        compression_bytes.inc(identity, encoding=self.encoding, stage="identity")
+        compression_bytes.inc(compressed, encoding=self.encoding, stage="compressed")
@@ -0,0 +1,63 @@
+"""
+Archived test case data models for Test Management Service
+"""
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    String,
+    Text,
+    literal_column,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
+
+from app.models.test_case import Base, TestCasePriority, TestCaseStatus, TestCaseType
+
+
+class ArchivedTestCaseDB(Base):
+    """
+    SQLAlchemy model for archived_test_cases table (V9).
+    
+    Cold storage for deprecated and long-untouched test cases, moved out of
+    ``test_cases`` by ``app.commands.archive_test_cases``. Rows keep their ID
+    and every column of ``TestCaseDB`` but ``deleted_at``, so lists and
+    searches can union them back in and a restore moves them back as they were.
+    """
+    __tablename__ = "archived_test_cases"
+    __table_args__ = (
+        Index(
+            'idx_archived_test_cases_project_created', 'project_id', 'created_at', 'id'
+        ),
+        Index('idx_archived_test_cases_tags', 'tags', postgresql_using='gin'),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    project_id = Column(Integer, nullable=False)
+    created_by = Column(Integer, nullable=False)
+    updated_by = Column(Integer, nullable=True)
+    title = Column(String(200), nullable=False)
+    description = Column(Text, nullable=True)
+    status = Column(Enum(TestCaseStatus), nullable=False)
+    priority = Column(Enum(TestCasePriority), nullable=False)
+    type = Column(Enum(TestCaseType), nullable=False)
+    preconditions = Column(Text, nullable=True)
+    steps = Column(JSON().with_variant(JSONB(), 'postgresql'), nullable=False)
+    expected_results = Column(
+        JSON().with_variant(JSONB(), 'postgresql'), nullable=False
+    )
+    estimated_duration = Column(Integer, nullable=True)
+    tags = Column(ARRAY(Text).with_variant(JSON(), 'sqlite'), nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    version = Column(Integer, nullable=False)
+    archived_at = Column(DateTime, nullable=False)
+
+
+# Same generated search document as TEST_CASE_SEARCH_VECTOR (V9 copies the column)
+ARCHIVED_TEST_CASE_SEARCH_VECTOR = literal_column(
+    "archived_test_cases.search_vector", TSVECTOR
+)
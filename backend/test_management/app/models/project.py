@@ -5,8 +5,7 @@ Project data models for Test Management Service
 from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field, validator
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, DateTime, func
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -66,14 +65,14 @@ class ProjectDB(Base):
     description = Column(Text, nullable=True)
     status = Column(String(20), nullable=False, default='active', index=True)
     created_by = Column(Integer, nullable=False, index=True)
-    created_at = Column(DateTime, nullable=False, server_default='now()')
-    updated_at = Column(DateTime, nullable=False, server_default='now()', onupdate='now()')
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+    # Soft delete (V10): hidden at once, purged with its test cases by a purge job
+    deleted_at = Column(DateTime, nullable=True)
     
-    # Relationships
-    creator = relationship("User", foreign_keys=[created_by])
-    test_cases = relationship("TestCase", back_populates="project")
-    test_plans = relationship("TestPlan", back_populates="project")
-    user_mappings = relationship("UserProjectMapping", back_populates="project")
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class ProjectResponse(BaseModel):
@@ -0,0 +1,68 @@
+"""
+Purge job data models for Test Management Service
+"""
+
+import enum
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, text
+
+from app.models.project import Base
+
+
+class PurgeJobStatus(str, enum.Enum):
+    """Purge job status enumeration"""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class PurgeJobDB(Base):
+    """
+    SQLAlchemy model for purge_jobs table (V10).
+    
+    Deleting a project only soft-deletes it and queues a job; the purge worker
+    (``app.commands.purge_deleted``) hard-deletes its test cases in bounded
+    batches and finally the project row, recording its progress here.
+    """
+    __tablename__ = "purge_jobs"
+    __table_args__ = (
+        # The worker only looks for unfinished jobs
+        Index(
+            'idx_purge_jobs_open',
+            'id',
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    project_id = Column(Integer, nullable=False, index=True)
+    requested_by = Column(Integer, nullable=False)
+    status = Column(String(20), nullable=False, default=PurgeJobStatus.PENDING.value)
+    test_cases_total = Column(Integer, nullable=False, default=0)
+    test_cases_purged = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    completed_at = Column(DateTime, nullable=True)
+
+
+class PurgeJobResponse(BaseModel):
+    """Purge job status response model for API"""
+    id: int
+    project_id: int
+    status: PurgeJobStatus
+    test_cases_total: int
+    test_cases_purged: int
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    updated_at: datetime
+    completed_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
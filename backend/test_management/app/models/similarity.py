@@ -0,0 +1,45 @@
+"""
+Similarity index data models for Test Management Service
+"""
+
+from typing import List
+
+from pydantic import BaseModel, Field
+from sqlalchemy import JSON, BigInteger, Column, DateTime, Index, Integer, func
+
+from app.models.test_case import Base, TestCaseResponse
+
+
+class TestCaseSignatureDB(Base):
+    """SQLAlchemy model for test_case_signatures table (MinHash per test case)"""
+    __tablename__ = "test_case_signatures"
+    
+    test_case_id = Column(Integer, primary_key=True)
+    project_id = Column(Integer, nullable=False, index=True)
+    signature = Column(JSON, nullable=False)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now())
+
+
+class TestCaseLSHBucketDB(Base):
+    """SQLAlchemy model for test_case_lsh_buckets table (one row per LSH band)"""
+    __tablename__ = "test_case_lsh_buckets"
+    __table_args__ = (
+        Index('idx_test_case_lsh_buckets_lookup', 'project_id', 'band', 'bucket'),
+    )
+    
+    test_case_id = Column(Integer, primary_key=True)
+    band = Column(Integer, primary_key=True)
+    project_id = Column(Integer, nullable=False)
+    bucket = Column(BigInteger, nullable=False)
+
+
+class SimilarTestCaseResponse(TestCaseResponse):
+    """Test case with its estimated similarity to the probe"""
+    similarity: float = Field(
+        ..., ge=0, le=1, description="Estimated Jaccard similarity"
+    )
+
+
+class SimilarTestCasesResponse(BaseModel):
+    """Similar test cases response model"""
+    similar_test_cases: List[SimilarTestCaseResponse]
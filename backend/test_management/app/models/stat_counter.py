@@ -0,0 +1,23 @@
+"""
+Per-project test case statistics data models for Test Management Service
+"""
+
+from sqlalchemy import Column, Integer, String
+
+from app.models.test_case import Base
+
+
+class TestCaseStatCounterDB(Base):
+    """
+    SQLAlchemy model for test_case_stat_counters table (V7).
+    
+    One counter per project and ``(dimension, value)``: the total
+    (``'total', ''``) and one per status, priority, type and creator. Counters
+    are adjusted in the same transaction as every test case write.
+    """
+    __tablename__ = "test_case_stat_counters"
+    
+    project_id = Column(Integer, primary_key=True)
+    dimension = Column(String(20), primary_key=True)
+    value = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
@@ -3,10 +3,23 @@ Test case data models for Test Management Service
 """
 
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field, validator, conlist
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum
-from sqlalchemy.orm import relationship
+from functools import lru_cache
+from typing import Optional, List, Tuple, Type
+from pydantic import BaseModel, Field, create_model, validator
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Text,
+    DateTime,
+    Enum,
+    Index,
+    JSON,
+    literal_column,
+    text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
 from sqlalchemy.ext.declarative import declarative_base
 import enum
 
@@ -39,6 +52,27 @@ class TestCaseType(str, enum.Enum):
     AUTOMATED = "automated"
 
 
+class TestCaseCountMode(str, enum.Enum):
+    """How the total of a test case list is computed"""
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+class TestCaseTagsOperation(str, enum.Enum):
+    """How bulk tag updates combine with existing tags"""
+    SET = "set"
+    ADD = "add"
+    REMOVE = "remove"
+
+
+class TestCaseDataFormat(str, enum.Enum):
+    """Bulk import/export formats (NDJSON and JSONL are both JSON lines)"""
+    NDJSON = "ndjson"
+    JSONL = "jsonl"
+    CSV = "csv"
+
+
 class TestCaseBase(BaseModel):
     """Base test case model with common fields"""
     title: str = Field(..., min_length=1, max_length=200, description="Test case title")
@@ -124,73 +158,111 @@ class TestCase(TestCaseBase):
 class TestCaseDB(Base):
     """SQLAlchemy model for test_cases table"""
     __tablename__ = "test_cases"
+    __table_args__ = (
+        # Tag filters are array containment queries (tags @> ARRAY[...])
+        Index('idx_test_cases_tags', 'tags', postgresql_using='gin'),
+        # List queries (V8): equality filters first, then the (created_at, id) sort
+        # key, so a backward index scan returns the newest page without a sort.
+        # Partial on live rows (V11): every ORM query carries deleted_at IS NULL
+        Index(
+            'idx_test_cases_project_created',
+            'project_id',
+            'created_at',
+            'id',
+            postgresql_where=text('deleted_at IS NULL'),
+        ),
+        Index(
+            'idx_test_cases_project_status_created',
+            'project_id',
+            'status',
+            'created_at',
+            'id',
+            postgresql_where=text('deleted_at IS NULL'),
+        ),
+        Index(
+            'idx_test_cases_project_priority_created',
+            'project_id',
+            'priority',
+            'created_at',
+            'id',
+            postgresql_where=text('deleted_at IS NULL'),
+        ),
+        Index(
+            'idx_test_cases_project_type_created',
+            'project_id',
+            'type',
+            'created_at',
+            'id',
+            postgresql_where=text('deleted_at IS NULL'),
+        ),
+        Index(
+            'idx_test_cases_project_creator_created',
+            'project_id',
+            'created_by',
+            'created_at',
+            'id',
+            postgresql_where=text('deleted_at IS NULL'),
+        ),
+        # Exports and ID lookups within a project (ORDER BY id); complete, as the
+        # purge worker and archive moves batch by it without deleted_at criteria
+        Index('idx_test_cases_project_id_id', 'project_id', 'id'),
+        # Unscoped newest-first listing (get_all without a project)
+        Index('idx_test_cases_created_at', 'created_at'),
+        # Soft-deleted rows waiting for the purge worker (V10)
+        Index(
+            'idx_test_cases_deleted',
+            'id',
+            postgresql_where=text('deleted_at IS NOT NULL'),
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, nullable=False, index=True)
+    project_id = Column(Integer, nullable=False)
     created_by = Column(Integer, nullable=False, index=True)
-    updated_by = Column(Integer, nullable=True, index=True)
-    title = Column(String(200), nullable=False, index=True)
+    updated_by = Column(Integer, nullable=True)
+    title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
-    status = Column(Enum(TestCaseStatus), nullable=False, default=TestCaseStatus.ACTIVE, index=True)
-    priority = Column(Enum(TestCasePriority), nullable=False, default=TestCasePriority.MEDIUM, index=True)
-    type = Column(Enum(TestCaseType), nullable=False, default=TestCaseType.FUNCTIONAL, index=True)
+    status = Column(Enum(TestCaseStatus), nullable=False, default=TestCaseStatus.ACTIVE)
+    priority = Column(
+        Enum(TestCasePriority), nullable=False, default=TestCasePriority.MEDIUM
+    )
+    type = Column(Enum(TestCaseType), nullable=False, default=TestCaseType.FUNCTIONAL)
     preconditions = Column(Text, nullable=True)
-    steps = Column(Text, nullable=True)  # JSON string format
-    expected_results = Column(Text, nullable=True)  # JSON string format
+    steps = Column(
+        JSON().with_variant(JSONB(), 'postgresql'), nullable=False, default=list
+    )
+    expected_results = Column(
+        JSON().with_variant(JSONB(), 'postgresql'), nullable=False, default=list
+    )
     estimated_duration = Column(Integer, nullable=True)
-    tags = Column(Text, nullable=True)  # JSON string format
-    created_at = Column(DateTime, nullable=False, server_default='now()')
-    updated_at = Column(DateTime, nullable=False, server_default='now()', onupdate='now()')
-    
-    # Relationships
-    project = relationship("ProjectDB", back_populates="test_cases")
-    creator = relationship("UserDB", foreign_keys=[created_by], back_populates="test_cases")
-    updater = relationship("UserDB", foreign_keys=[updated_by], back_populates="updated_test_cases")
-    
-    def get_steps_list(self) -> List[str]:
-        """Get steps as list from JSON string"""
-        import json
-        if self.steps:
-            try:
-                return json.loads(self.steps)
-            except json.JSONDecodeError:
-                return []
-        return []
-    
-    def get_expected_results_list(self) -> List[str]:
-        """Get expected results as list from JSON string"""
-        import json
-        if self.expected_results:
-            try:
-                return json.loads(self.expected_results)
-            except json.JSONDecodeError:
-                return []
-        return []
-    
-    def get_tags_list(self) -> List[str]:
-        """Get tags as list from JSON string"""
-        import json
-        if self.tags:
-            try:
-                return json.loads(self.tags)
-            except json.JSONDecodeError:
-                return []
-        return []
-    
-    def set_steps_list(self, steps: List[str]) -> None:
-        """Set steps from list to JSON string"""
-        import json
-        self.steps = json.dumps(steps)
-    
-    def set_expected_results_list(self, results: List[str]) -> None:
-        """Set expected results from list to JSON string"""
-        import json
-        self.expected_results = json.dumps(results)
-    
-    def set_tags_list(self, tags: List[str]) -> None:
-        """Set tags from list to JSON string"""
-        import json
-        self.tags = json.dumps(tags)
+    tags = Column(
+        ARRAY(Text).with_variant(JSON(), 'sqlite'), nullable=True, default=list
+    )
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+    # Row version (V2/V6): ETags and optimistic concurrency
+    # (UPDATE ... WHERE version = ?)
+    version = Column(Integer, nullable=False, default=1, server_default='1')
+    # Soft delete (V10): set rows are hidden from every ORM query (see
+    # app.repositories.soft_delete) and hard-deleted by app.commands.purge_deleted
+    deleted_at = Column(DateTime, nullable=True)
+    
+    # Server defaults come back through INSERT ... RETURNING instead of a refresh.
+    # Rows are identified by (project_id, id), so ORM UPDATE/DELETE statements carry
+    # the partition key of a hash-partitioned table (database/migrations/optional)
+    __mapper_args__ = {
+        "version_id_col": version,
+        "eager_defaults": True,
+        "primary_key": [project_id, id],
+    }
+
+
+# Weighted search document maintained by PostgreSQL as a stored generated column
+# (see V4__test_cases_search_document.sql). It is not mapped on TestCaseDB so
+# that non-PostgreSQL test databases can still create the table.
+TEST_CASE_SEARCH_VECTOR = literal_column("test_cases.search_vector", TSVECTOR)
 
 
 class TestCaseResponse(TestCaseBase):
@@ -201,14 +273,122 @@ class TestCaseResponse(TestCaseBase):
     created_at: datetime
     updated_at: datetime
     updated_by: Optional[int] = None
+    version: int = 1
     
     class Config:
         from_attributes = True
 
 
+# TestCaseResponse fields and their columns, in the same order: list endpoints
+# select these and zip each row tuple into a response dict
+TEST_CASE_RESPONSE_FIELDS = tuple(TestCaseResponse.model_fields)
+TEST_CASE_RESPONSE_COLUMNS = tuple(
+    getattr(TestCaseDB, name) for name in TEST_CASE_RESPONSE_FIELDS
+)
+
+
 class TestCaseListResponse(BaseModel):
     """Test case list response model"""
     test_cases: List[TestCaseResponse]
+    total: Optional[int] = None
+    total_is_estimate: bool = Field(
+        False, description="Whether total is a planner estimate"
+    )
+    page: int
+    size: int
+    has_next: bool
+    has_prev: bool
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor of the next page (keyset pagination)"
+    )
+
+
+class TestCaseSummaryResponse(BaseModel):
+    """Test case list item without the heavy text columns (default list projection)"""
+    title: str
+    status: TestCaseStatus
+    priority: TestCasePriority
+    type: TestCaseType
+    estimated_duration: Optional[int] = None
+    tags: Optional[List[str]] = None
+    id: int
+    project_id: int
+    created_by: int
+    created_at: datetime
+    updated_at: datetime
+    updated_by: Optional[int] = None
+    version: int = 1
+
+
+class TestCaseSummaryListResponse(TestCaseListResponse):
+    """Test case list response model with summary items"""
+    test_cases: List[TestCaseSummaryResponse]
+
+
+TEST_CASE_SUMMARY_FIELDS = tuple(TestCaseSummaryResponse.model_fields)
+# Always returned: the row identity and its keyset pagination key
+TEST_CASE_REQUIRED_FIELDS = ("id", "created_at")
+TEST_CASE_FIELD_SETS = {
+    "summary": TEST_CASE_SUMMARY_FIELDS,
+    "all": TEST_CASE_RESPONSE_FIELDS,
+}
+
+
+def resolve_test_case_fields(value: Optional[str]) -> List[str]:
+    """
+    Parse a ``fields=`` parameter into response field names, in response order.
+    
+    ``summary`` (the default) and ``all`` expand to their field sets; ``id``
+    and ``created_at`` are always included. Raises ValueError on unknown fields.
+    """
+    names = set(TEST_CASE_REQUIRED_FIELDS)
+    for name in (value or "summary").split(","):
+        name = name.strip()
+        if name in TEST_CASE_FIELD_SETS:
+            names.update(TEST_CASE_FIELD_SETS[name])
+        elif name:
+            names.add(name)
+    
+    unknown = names.difference(TEST_CASE_RESPONSE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return [name for name in TEST_CASE_RESPONSE_FIELDS if name in names]
+
+
+@lru_cache(maxsize=128)
+def projected_list_model(fields: Tuple[str, ...]) -> Type[TestCaseListResponse]:
+    """List response model whose items have exactly ``fields`` (resolved field names)"""
+    if fields == TEST_CASE_RESPONSE_FIELDS:
+        return TestCaseListResponse
+    if fields == TEST_CASE_SUMMARY_FIELDS:
+        return TestCaseSummaryListResponse
+    
+    item_model = create_model(
+        "TestCaseProjection",
+        **{
+            name: (field.annotation, field)
+            for name, field in TestCaseResponse.model_fields.items()
+            if name in fields
+        },
+    )
+    return create_model(
+        "TestCaseProjectionListResponse",
+        __base__=TestCaseListResponse,
+        test_cases=(List[item_model], ...),
+    )
+
+
+class TestCaseSearchResult(TestCaseResponse):
+    """Ranked full-text search hit"""
+    rank: float = Field(..., description="Relevance rank (higher is better)")
+    highlight: Optional[str] = Field(
+        None, description="Matching snippet with <mark> highlights"
+    )
+
+
+class TestCaseSearchResponse(BaseModel):
+    """Full-text search response model"""
+    results: List[TestCaseSearchResult]
     total: int
     page: int
     size: int
@@ -216,10 +396,76 @@ class TestCaseListResponse(BaseModel):
     has_prev: bool
 
 
+class TestCaseBulkUpdate(BaseModel):
+    """Base model for set-based bulk updates"""
+    test_case_ids: List[int] = Field(
+        ..., min_length=1, max_length=10000, description="Test case IDs"
+    )
+
+
+class TestCaseBulkStatusUpdate(TestCaseBulkUpdate):
+    """Bulk status update request"""
+    status: TestCaseStatus
+
+
+class TestCaseBulkPriorityUpdate(TestCaseBulkUpdate):
+    """Bulk priority update request"""
+    priority: TestCasePriority
+
+
+class TestCaseBulkTypeUpdate(TestCaseBulkUpdate):
+    """Bulk type update request"""
+    type: TestCaseType
+
+
+class TestCaseBulkTagsUpdate(TestCaseBulkUpdate):
+    """Bulk tags update request"""
+    tags: List[str] = Field(..., description="Tags to set, add or remove")
+    operation: TestCaseTagsOperation = Field(
+        TestCaseTagsOperation.SET, description="Tag operation"
+    )
+    
+    @validator('tags')
+    def validate_tags(cls, v):
+        if len(v) > 20:
+            raise ValueError("Maximum 20 tags allowed")
+        return v
+
+
+class TestCaseBulkUpdateResult(BaseModel):
+    """Per-request report of a bulk update"""
+    success: int
+    failed: int
+    updated_ids: List[int]
+    errors: List[str]
+
+
+class TestCaseImportError(BaseModel):
+    """Error of a single import row"""
+    row: int = Field(..., description="1-based data row number")
+    error: str
+
+
+class TestCaseImportResult(BaseModel):
+    """Bulk import report"""
+    imported: int
+    failed: int
+    errors: List[TestCaseImportError]
+    errors_truncated: bool = Field(
+        False, description="Whether more errors occurred than are listed"
+    )
+
+
 class TestCaseSearchQuery(BaseModel):
     """Test case search query parameters"""
     page: int = Field(1, ge=1, description="Page number")
     size: int = Field(10, ge=1, le=100, description="Page size")
+    cursor: Optional[str] = Field(
+        None, description="Keyset cursor; when set, page is ignored"
+    )
+    count: TestCaseCountMode = Field(
+        TestCaseCountMode.EXACT, description="Total count mode"
+    )
     title: Optional[str] = Field(None, description="Filter by title (contains)")
     status: Optional[TestCaseStatus] = Field(None, description="Filter by status")
     priority: Optional[TestCasePriority] = Field(None, description="Filter by priority")
@@ -228,9 +474,18 @@ class TestCaseSearchQuery(BaseModel):
     created_by: Optional[int] = Field(None, description="Filter by creator")
     created_after: Optional[datetime] = Field(None, description="Filter by creation date (after)")
     created_before: Optional[datetime] = Field(None, description="Filter by creation date (before)")
+    fields: List[str] = Field(
+        default_factory=lambda: list(TEST_CASE_SUMMARY_FIELDS),
+        description="Response fields of list items",
+    )
+    include_archived: bool = Field(False, description="Also list archived test cases")
     
     @validator('tags')
     def validate_tags(cls, v):
         if v is not None and len(v) > 10:
             raise ValueError("Maximum 10 tags filter allowed")
-        return v
\ No newline at end of file
+        return v
+    
+    @validator('fields')
+    def validate_fields(cls, v):
+        return resolve_test_case_fields(",".join(v))
@@ -5,8 +5,7 @@ User data models for Test Management Service
 from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field, EmailStr
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, func
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -54,14 +53,12 @@ class UserDB(Base):
     full_name = Column(String(100), nullable=True)
     avatar_url = Column(String(500), nullable=True)
     is_active = Column(Boolean, nullable=False, default=True)
-    created_at = Column(DateTime, nullable=False, server_default='now()')
-    updated_at = Column(DateTime, nullable=False, server_default='now()', onupdate='now()')
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    )
     
-    # Relationships
-    created_projects = relationship("ProjectDB", foreign_keys="ProjectDB.created_by", back_populates="creator")
-    test_cases = relationship("TestCase", back_populates="creator")
-    test_plans = relationship("TestPlan", back_populates="creator")
-    user_mappings = relationship("UserProjectMapping", back_populates="user")
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class UserResponse(BaseModel):
@@ -86,9 +83,5 @@ class UserProjectMappingDB(Base):
     user_id = Column(Integer, nullable=False, index=True)
     project_id = Column(Integer, nullable=False, index=True)
     role_id = Column(Integer, nullable=False)
-    joined_at = Column(DateTime, nullable=False, server_default='now()')
+    joined_at = Column(DateTime, nullable=False, server_default=func.now())
     is_active = Column(Boolean, nullable=False, default=True)
-    
-    # Relationships
-    user = relationship("UserDB", back_populates="user_mappings")
-    project = relationship("ProjectDB", back_populates="user_mappings")
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""
+Project access decision cache
+
+Decisions are memoized per session (one session per request) in
+``Session.info`` and shared between requests through a TTL cache keyed by
+``(user_id, project_id)``. ORM writes to ``projects`` or
+``user_project_mapping`` invalidate the affected entries once the writing
+transaction commits: in this process at once, and in every other instance
+through the ``access:invalidations`` Redis stream (``core.invalidation_bus``),
+within about ``ACCESS_CACHE_SYNC_INTERVAL_SECONDS``. If Redis is unreachable,
+other instances may keep a revoked decision for up to
+``ACCESS_CACHE_TTL_SECONDS``.
+"""
+
+from typing import Callable, List, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app.models.project import ProjectDB
+from app.models.user import UserProjectMappingDB
+from core.cache import TTLCache
+from core.config import settings
+from core.invalidation_bus import InvalidationBus
+
+_MEMO_KEY = "project_access"
+_PENDING_KEY = "project_access_invalidations"
+
+project_access_cache = TTLCache(
+    settings.ACCESS_CACHE_MAX_SIZE, settings.ACCESS_CACHE_TTL_SECONDS
+)
+
+
+def _apply_published(project_ids: List[str]) -> None:
+    """Drop decisions of projects changed by other service instances"""
+    for project_id in set(project_ids):
+        invalidate_project_access(int(project_id))
+
+
+access_invalidations = InvalidationBus(
+    settings.REDIS_URL,
+    "access:invalidations",
+    _apply_published,
+    sync_interval_seconds=settings.ACCESS_CACHE_SYNC_INTERVAL_SECONDS,
+)
+
+
+def get_project_access(
+    session: Session,
+    user_id: int,
+    project_id: int,
+    resolve: Callable[[], bool]
+) -> bool:
+    """Return the cached access decision, calling resolve() on a miss"""
+    access_invalidations.start()
+    key = (user_id, project_id)
+    memo = session.info.setdefault(_MEMO_KEY, {})
+    if key in memo:
+        return memo[key]
+    
+    allowed = project_access_cache.get(key)
+    if allowed is None:
+        allowed = resolve()
+        project_access_cache.set(key, allowed)
+    
+    memo[key] = allowed
+    return allowed
+
+
+def invalidate_project_access(project_id: int, user_id: Optional[int] = None) -> None:
+    """Drop cached decisions for a project, or for one user on it"""
+    if user_id is None:
+        project_access_cache.delete_where(lambda key: key[1] == project_id)
+    else:
+        project_access_cache.delete((user_id, project_id))
+
+
+def _queue_invalidation(target, project_id: Optional[int]) -> None:
+    """Remember a changed project until the session's transaction ends"""
+    if project_id is None:
+        return
+    
+    session = object_session(target)
+    if session is None:
+        invalidate_project_access(project_id)
+        access_invalidations.publish([project_id])
+        return
+    session.info.setdefault(_PENDING_KEY, set()).add(project_id)
+
+
+@event.listens_for(ProjectDB, "after_insert")
+@event.listens_for(ProjectDB, "after_update")
+@event.listens_for(ProjectDB, "after_delete")
+def _project_changed(mapper, connection, target) -> None:
+    _queue_invalidation(target, target.id)
+
+
+@event.listens_for(UserProjectMappingDB, "after_insert")
+@event.listens_for(UserProjectMappingDB, "after_update")
+@event.listens_for(UserProjectMappingDB, "after_delete")
+def _mapping_changed(mapper, connection, target) -> None:
+    # A mapping may have been moved between users, so drop the whole project
+    _queue_invalidation(target, target.project_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_invalidations(session: Session) -> None:
+    """
+    Invalidate after commit so that other requests cannot re-cache the old
+    decision in between
+    """
+    pending: Set[int] = session.info.pop(_PENDING_KEY, set())
+    if not pending:
+        return
+    
+    session.info.pop(_MEMO_KEY, None)
+    for project_id in pending:
+        invalidate_project_access(project_id)
+    access_invalidations.publish(pending)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _rollback_invalidations(session: Session, previous_transaction) -> None:
+    # Decisions resolved after the flush may have seen rolled-back rows
+    _apply_invalidations(session)
@@ -0,0 +1,117 @@
+"""
+Test case archive repository: moves between test_cases and archived_test_cases
+
+Moves are set-based (one SELECT ... FOR UPDATE, one INSERT, one DELETE per
+batch), keep the row's ID, adjust the per-project counters and invalidate
+the project's cached responses, all in the caller's transaction.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import delete, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.archived_test_case import ArchivedTestCaseDB
+from app.models.test_case import TestCaseDB, TestCaseStatus
+from app.repositories.cache_invalidation import mark_project_changed
+from app.repositories.stat_counter_repository import (
+    StatDeltas,
+    add_test_case,
+    apply_stat_deltas,
+)
+
+HOT = TestCaseDB.__table__
+COLD = ArchivedTestCaseDB.__table__
+
+
+class TestCaseArchiveRepository:
+    """Repository class for archiving and restoring test cases"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def archive_batch(
+        self, untouched_before: datetime, after_id: int = 0, batch_size: int = 1000
+    ) -> List[int]:
+        """
+        Move the next batch of archivable test cases (``id > after_id``).
+        
+        Deprecated test cases and test cases not updated since
+        ``untouched_before`` are archivable; soft-deleted ones are left to
+        the purge worker. Rows locked by a writer are skipped and picked up
+        by a later run. Returns the moved IDs in ascending order; does not
+        commit.
+        """
+        rows = (
+            self.db.execute(
+                select(*[HOT.c[name] for name in COLD.c.keys() if name in HOT.c])
+                .where(
+                    HOT.c.id > after_id,
+                    HOT.c.deleted_at.is_(None),
+                    or_(
+                        HOT.c.status == TestCaseStatus.DEPRECATED,
+                        HOT.c.updated_at < untouched_before,
+                    ),
+                )
+                .order_by(HOT.c.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            .mappings()
+            .all()
+        )
+        if not rows:
+            return []
+        
+        archived_at = datetime.utcnow()
+        self.db.execute(
+            insert(COLD), [{**row, "archived_at": archived_at} for row in rows]
+        )
+        # IDs are unique; the project IDs let a partitioned test_cases prune the delete
+        self.db.execute(delete(HOT).where(
+            HOT.c.project_id.in_({row["project_id"] for row in rows}),
+            HOT.c.id.in_([row["id"] for row in rows]),
+        ))
+        self._count(rows, sign=-1)
+        return [row["id"] for row in rows]
+    
+    def get_project_id(self, test_case_id: int) -> Optional[int]:
+        """Project of an archived test case, None if it is not archived"""
+        return self.db.execute(
+            select(COLD.c.project_id).where(COLD.c.id == test_case_id)
+        ).scalar()
+    
+    def restore(self, test_case_id: int, project_id: int) -> bool:
+        """
+        Move an archived test case back into test_cases. Does not commit.
+        
+        The version is bumped so ETags issued before the case was archived
+        do not match the restored row.
+        """
+        row = (
+            self.db.execute(
+                select(COLD)
+                .where(COLD.c.project_id == project_id, COLD.c.id == test_case_id)
+                .with_for_update()
+            )
+            .mappings()
+            .first()
+        )
+        if row is None:
+            return False
+        
+        values = {name: row[name] for name in HOT.columns.keys() if name in row}
+        values.update(version=row["version"] + 1, updated_at=datetime.utcnow())
+        self.db.execute(insert(HOT), [values])
+        self.db.execute(delete(COLD).where(COLD.c.id == test_case_id))
+        self._count([values], sign=1)
+        return True
+    
+    def _count(self, rows, sign: int) -> None:
+        """Adjust the counters and cached responses of the moved rows' projects"""
+        deltas = StatDeltas()
+        for row in rows:
+            add_test_case(deltas, row["project_id"], row, sign=sign)
+            mark_project_changed(self.db, row["project_id"])
+        apply_stat_deltas(self.db.connection(), deltas)
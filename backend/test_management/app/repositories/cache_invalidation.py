@@ -0,0 +1,61 @@
+"""
+Response cache invalidation for test case writes
+
+ORM writes to ``test_cases`` and the set-based bulk statements (which report
+their project through ``mark_project_changed``) queue the affected project
+IDs in ``Session.info``; their response cache versions are bumped once the
+writing transaction commits. Plain sessions (imports, commands) bump them
+synchronously in the commit hook; sessions behind an ``AsyncSession`` hand
+them to ``apply_committed_invalidations``, which bumps them with the async
+Redis client so the commit never blocks the event loop.
+"""
+
+from typing import Set
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_session
+from sqlalchemy.orm import Session, object_session
+
+from app.models.test_case import TestCaseDB
+from core.response_cache import response_cache
+
+_PENDING_KEY = "response_cache_invalidations"
+_COMMITTED_KEY = "response_cache_committed_invalidations"
+
+
+def mark_project_changed(session: Session, project_id: int) -> None:
+    """Invalidate a project's cached responses when the session commits"""
+    session.info.setdefault(_PENDING_KEY, set()).add(project_id)
+
+
+@event.listens_for(TestCaseDB, "after_insert")
+@event.listens_for(TestCaseDB, "after_update")
+@event.listens_for(TestCaseDB, "after_delete")
+def _test_case_changed(mapper, connection, target) -> None:
+    # Mapper events only fire while a Session flushes the target
+    mark_project_changed(object_session(target), target.project_id)
+
+
+async def apply_committed_invalidations(db: AsyncSession) -> None:
+    """Bump the versions of the projects changed by the session's last commits"""
+    committed: Set[int] = db.sync_session.info.pop(_COMMITTED_KEY, set())
+    if committed:
+        await response_cache.bump_projects_async(committed)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_invalidations(session: Session) -> None:
+    pending: Set[int] = session.info.pop(_PENDING_KEY, set())
+    if not pending:
+        return
+    if async_session(session) is not None:
+        session.info.setdefault(_COMMITTED_KEY, set()).update(pending)
+    else:
+        response_cache.bump_projects(pending)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_invalidations(session: Session, previous_transaction) -> None:
+    # Nothing was written; cached reads never run inside a writing transaction
+    if not session.in_transaction():
+        session.info.pop(_PENDING_KEY, None)
@@ -6,9 +6,13 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
+from sqlalchemy.sql import func
 
 from app.models.project import ProjectDB, Project, ProjectCreate, ProjectUpdate
 from app.models.user import UserDB
+from app.db_routing import replica_read
+from app.repositories import soft_delete  # noqa: F401 (hides soft-deleted rows)
+from app.repositories.access_cache import get_project_access
 
 
 class ProjectRepository:
@@ -26,8 +30,7 @@ class ProjectRepository:
             created_by=created_by
         )
         self.db.add(db_project)
-        self.db.commit()
-        self.db.refresh(db_project)
+        self.db.flush()
         return db_project
     
     def get_by_id(self, project_id: int) -> Optional[ProjectDB]:
@@ -38,6 +41,7 @@ class ProjectRepository:
         """Get project by name"""
         return self.db.query(ProjectDB).filter(ProjectDB.name == name).first()
     
+    @replica_read
     def get_all(
         self, 
         skip: int = 0, 
@@ -56,6 +60,7 @@ class ProjectRepository:
         
         return query.offset(skip).limit(limit).all()
     
+    @replica_read
     def count(
         self, 
         status: Optional[str] = None, 
@@ -72,6 +77,18 @@ class ProjectRepository:
         
         return query.count()
     
+    @replica_read
+    def get_status_counts(self, created_by: Optional[int] = None) -> Dict[str, int]:
+        """Count projects per status with a single GROUP BY query"""
+        query = self.db.query(ProjectDB.status, func.count(ProjectDB.id))
+        
+        if created_by:
+            query = query.filter(ProjectDB.created_by == created_by)
+        
+        return {
+            status: count for status, count in query.group_by(ProjectDB.status).all()
+        }
+    
     def update(self, project_id: int, update_data: ProjectUpdate) -> Optional[ProjectDB]:
         """Update a project"""
         db_project = self.get_by_id(project_id)
@@ -83,40 +100,63 @@ class ProjectRepository:
             setattr(db_project, field, value)
         
         db_project.updated_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(db_project)
+        self.db.flush()
         return db_project
     
     def delete(self, project_id: int) -> bool:
-        """Delete a project"""
+        """
+        Soft-delete a project; its test cases are hidden with it.
+        
+        Only the project row is written here. The rows are removed later, in
+        batches, by a purge job (see PurgeRepository). Does not commit.
+        """
         db_project = self.get_by_id(project_id)
         if not db_project:
             return False
         
-        self.db.delete(db_project)
-        self.db.commit()
+        db_project.deleted_at = db_project.updated_at = datetime.utcnow()
+        self.db.flush()
         return True
     
     def user_has_access(self, user_id: int, project_id: int) -> bool:
-        """Check if user has access to a project"""
-        # Check if user is the creator
-        project = self.get_by_id(project_id)
-        if not project:
+        """Check if user has access to a project (cached, see access_cache)"""
+        return get_project_access(
+            self.db,
+            user_id,
+            project_id,
+            lambda: self._resolve_access(user_id, project_id),
+        )
+    
+    def _resolve_access(self, user_id: int, project_id: int) -> bool:
+        """Uncached access decision"""
+        # Check if user is the creator; only the owner column is loaded
+        created_by = (
+            self.db.query(ProjectDB.created_by)
+            .filter(ProjectDB.id == project_id)
+            .scalar()
+        )
+        if created_by is None:
             return False
         
-        if project.created_by == user_id:
+        if created_by == user_id:
             return True
         
         # Check if user is mapped to the project (this would be implemented later)
         # For now, only creators have access
         return False
     
-    def get_user_projects(self, user_id: int, skip: int = 0, limit: int = 100) -> List[ProjectDB]:
-        """Get all projects created by a user"""
-        return (
-            self.db.query(ProjectDB)
-            .filter(ProjectDB.created_by == user_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
\ No newline at end of file
+    @replica_read
+    def get_user_projects(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None
+    ) -> List[ProjectDB]:
+        """Get all projects created by a user, optionally with one status"""
+        query = self.db.query(ProjectDB).filter(ProjectDB.created_by == user_id)
+        
+        if status:
+            query = query.filter(ProjectDB.status == status)
+        
+        return query.offset(skip).limit(limit).all()
@@ -0,0 +1,129 @@
+"""
+Purge repository: hard-deletes soft-deleted rows in bounded batches
+
+Each batch is one ``DELETE ... WHERE id IN (SELECT ... ORDER BY id LIMIT n)``
+against the tables themselves, so it never loads objects and locks at most
+``batch_size`` rows. Counters and cached responses were already adjusted
+when the rows were soft-deleted.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.models.archived_test_case import ArchivedTestCaseDB
+from app.models.project import ProjectDB
+from app.models.purge_job import PurgeJobDB, PurgeJobStatus
+from app.models.stat_counter import TestCaseStatCounterDB
+from app.models.test_case import TestCaseDB
+
+TEST_CASES = TestCaseDB.__table__
+ARCHIVED_TEST_CASES = ArchivedTestCaseDB.__table__
+PROJECTS = ProjectDB.__table__
+STAT_COUNTERS = TestCaseStatCounterDB.__table__
+
+OPEN_STATUSES = (PurgeJobStatus.PENDING.value, PurgeJobStatus.RUNNING.value)
+
+
+class PurgeRepository:
+    """Repository class for purge jobs and batched hard deletes"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def create_project_job(self, project_id: int, requested_by: int) -> PurgeJobDB:
+        """Queue the purge of a soft-deleted project. Does not commit."""
+        total = sum(
+            self.db.execute(
+                select(func.count()).where(table.c.project_id == project_id)
+            ).scalar()
+            for table in (TEST_CASES, ARCHIVED_TEST_CASES)
+        )
+        job = PurgeJobDB(
+            project_id=project_id, requested_by=requested_by, test_cases_total=total
+        )
+        self.db.add(job)
+        self.db.flush()
+        return job
+    
+    def get_job(self, job_id: int) -> Optional[PurgeJobDB]:
+        """Get purge job by ID"""
+        return self.db.get(PurgeJobDB, job_id)
+    
+    def next_project_job(self) -> Optional[PurgeJobDB]:
+        """
+        Lock the oldest unfinished job for this transaction.
+        
+        Jobs locked by another worker are skipped, so several workers can
+        run side by side.
+        """
+        return self.db.execute(
+            select(PurgeJobDB)
+            .where(PurgeJobDB.status.in_(OPEN_STATUSES))
+            .order_by(PurgeJobDB.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        ).scalar()
+    
+    def purge_test_cases_batch(self, batch_size: int = 1000) -> int:
+        """Hard-delete the next batch of soft-deleted test cases. Does not commit."""
+        batch = (
+            select(TEST_CASES.c.id)
+            .where(TEST_CASES.c.deleted_at.is_not(None))
+            .order_by(TEST_CASES.c.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        return self.db.execute(
+            delete(TEST_CASES).where(TEST_CASES.c.id.in_(batch))
+        ).rowcount
+    
+    def purge_project_batch(self, job: PurgeJobDB, batch_size: int = 1000) -> bool:
+        """
+        Run one step of a project purge job and record its progress. Does not commit.
+        
+        A step deletes up to ``batch_size`` of the project's test cases (then
+        its archived ones); once none are left, the project row itself and its
+        counters. Returns True when the job is complete.
+        """
+        now = datetime.utcnow()
+        job.started_at = job.started_at or now
+        job.updated_at = now
+        
+        for table in (TEST_CASES, ARCHIVED_TEST_CASES):
+            batch = (
+                select(table.c.id)
+                .where(table.c.project_id == job.project_id)
+                .order_by(table.c.id)
+                .limit(batch_size)
+            )
+            deleted = self.db.execute(
+                delete(table).where(
+                    table.c.project_id == job.project_id, table.c.id.in_(batch)
+                )
+            ).rowcount
+            if deleted:
+                job.status = PurgeJobStatus.RUNNING.value
+                job.test_cases_purged += deleted
+                self.db.flush()
+                return False
+        
+        self.db.execute(
+            delete(STAT_COUNTERS).where(STAT_COUNTERS.c.project_id == job.project_id)
+        )
+        self.db.execute(delete(PROJECTS).where(PROJECTS.c.id == job.project_id))
+        job.status = PurgeJobStatus.COMPLETED.value
+        job.completed_at = now
+        self.db.flush()
+        return True
+    
+    def fail_job(self, job_id: int, error: str) -> None:
+        """Mark a job failed so workers stop retrying it. Does not commit."""
+        job = self.get_job(job_id)
+        if job is not None:
+            job.status = PurgeJobStatus.FAILED.value
+            job.error = error
+            job.updated_at = datetime.utcnow()
+            self.db.flush()
@@ -0,0 +1,158 @@
+"""
+Similarity index repository for data access operations
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, desc, insert, select, tuple_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.models.similarity import TestCaseLSHBucketDB, TestCaseSignatureDB
+from app.models.test_case import TestCaseDB
+
+
+class SimilarityRepository:
+    """Repository class for the MinHash/LSH similarity index"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def upsert(self, entries: Sequence[Tuple[int, int, List[int], List[int]]]) -> None:
+        """
+        Replace the index entries of several test cases.
+        
+        Each entry is ``(test_case_id, project_id, signature, band_hashes)``.
+        Rows are written with multi-row inserts; the caller commits.
+        """
+        if not entries:
+            return
+        
+        self.remove([test_case_id for test_case_id, _, _, _ in entries])
+        
+        now = datetime.utcnow()
+        self.db.execute(insert(TestCaseSignatureDB), [
+            {
+                'test_case_id': test_case_id,
+                'project_id': project_id,
+                'signature': signature,
+                'updated_at': now,
+            }
+            for test_case_id, project_id, signature, _ in entries
+        ])
+        
+        buckets = [
+            {
+                'test_case_id': test_case_id,
+                'band': band,
+                'project_id': project_id,
+                'bucket': bucket,
+            }
+            for test_case_id, project_id, _, band_hashes in entries
+            for band, bucket in enumerate(band_hashes)
+        ]
+        if buckets:
+            self.db.execute(insert(TestCaseLSHBucketDB), buckets)
+    
+    def remove(self, test_case_ids: Iterable[int]) -> None:
+        """Remove test cases from the index"""
+        test_case_ids = list(test_case_ids)
+        if not test_case_ids:
+            return
+        
+        self.db.execute(
+            delete(TestCaseLSHBucketDB).where(
+                TestCaseLSHBucketDB.test_case_id.in_(test_case_ids)
+            )
+        )
+        self.db.execute(
+            delete(TestCaseSignatureDB).where(
+                TestCaseSignatureDB.test_case_id.in_(test_case_ids)
+            )
+        )
+    
+    def contents_batch(
+        self,
+        after_id: int = 0,
+        batch_size: int = 1000,
+        project_ids: Optional[Sequence[int]] = None,
+        missing_only: bool = True
+    ) -> List[Tuple[int, int, str, Optional[List[str]], Optional[List[str]]]]:
+        """
+        Next ``(id, project_id, title, steps, expected_results)`` batch of test
+        cases in id order, for (re)building the index.
+        
+        With ``missing_only``, only test cases without a signature are returned.
+        """
+        query = (
+            select(
+                TestCaseDB.id,
+                TestCaseDB.project_id,
+                TestCaseDB.title,
+                TestCaseDB.steps,
+                TestCaseDB.expected_results,
+            )
+            .where(TestCaseDB.id > after_id)
+            .order_by(TestCaseDB.id)
+            .limit(batch_size)
+        )
+        if project_ids:
+            query = query.where(TestCaseDB.project_id.in_(project_ids))
+        if missing_only:
+            query = query.where(
+                ~select(TestCaseSignatureDB.test_case_id)
+                .where(TestCaseSignatureDB.test_case_id == TestCaseDB.id)
+                .exists()
+            )
+        return [tuple(row) for row in self.db.execute(query)]
+    
+    def find_candidates(
+        self,
+        project_id: int,
+        band_hashes: Sequence[int],
+        exclude_ids: Iterable[int] = (),
+        limit: int = 200
+    ) -> Dict[int, List[int]]:
+        """
+        Find test cases sharing at least one LSH bucket with the probe.
+        
+        Candidates are ordered by the number of shared bands (an index-only
+        lookup on (project_id, band, bucket)) and returned with their stored
+        signatures for exact re-ranking.
+        """
+        if not band_hashes:
+            return {}
+        
+        shared = func.count(TestCaseLSHBucketDB.band)
+        query = (
+            self.db.query(TestCaseLSHBucketDB.test_case_id)
+            .filter(
+                TestCaseLSHBucketDB.project_id == project_id,
+                tuple_(TestCaseLSHBucketDB.band, TestCaseLSHBucketDB.bucket).in_(
+                    list(enumerate(band_hashes))
+                ),
+            )
+        )
+        exclude_ids = list(exclude_ids)
+        if exclude_ids:
+            query = query.filter(TestCaseLSHBucketDB.test_case_id.notin_(exclude_ids))
+        
+        candidate_ids = [
+            row.test_case_id
+            for row in query.group_by(TestCaseLSHBucketDB.test_case_id)
+            .order_by(desc(shared))
+            .limit(limit)
+            .all()
+        ]
+        if not candidate_ids:
+            return {}
+        
+        rows = (
+            self.db.query(
+                TestCaseSignatureDB.test_case_id, TestCaseSignatureDB.signature
+            )
+            .filter(TestCaseSignatureDB.test_case_id.in_(candidate_ids))
+            .all()
+        )
+        return {test_case_id: signature for test_case_id, signature in rows}
@@ -0,0 +1,30 @@
+"""
+Soft delete visibility
+
+Deleted projects and test cases keep their rows (``deleted_at`` set) until the
+purge worker (``app.commands.purge_deleted``) removes them. Every ORM SELECT,
+UPDATE and DELETE run through a Session gets ``deleted_at IS NULL`` criteria
+for both models, so they disappear from lists, lookups, searches, counts and
+writes as soon as the deleting transaction commits. Core statements against
+the tables themselves (archive moves, the purge worker) are not filtered.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from app.models.project import ProjectDB
+from app.models.test_case import TestCaseDB
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _hide_deleted(state: ORMExecuteState) -> None:
+    if not (state.is_select or state.is_update or state.is_delete):
+        return
+    state.statement = state.statement.options(
+        with_loader_criteria(
+            TestCaseDB, lambda cls: cls.deleted_at.is_(None), include_aliases=True
+        ),
+        with_loader_criteria(
+            ProjectDB, lambda cls: cls.deleted_at.is_(None), include_aliases=True
+        ),
+    )
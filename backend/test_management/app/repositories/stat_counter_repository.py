@@ -0,0 +1,194 @@
+"""
+Per-project test case counters
+
+Counters live in ``test_case_stat_counters`` and are adjusted in the writing
+transaction: ORM inserts, updates and deletes of ``TestCaseDB`` through mapper
+events, set-based bulk statements by passing their deltas to
+``apply_stat_deltas``. Deltas are applied as ``INSERT ... ON CONFLICT DO
+UPDATE SET count = count + delta`` in key order, so concurrent writers never
+lose an increment or deadlock on each other's counter rows.
+"""
+
+import enum
+from collections import Counter
+from typing import Any, Dict, List, Mapping
+
+from sqlalchemy import delete, event, inspect, select, union
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.db_routing import replica_read
+from app.models.stat_counter import TestCaseStatCounterDB
+from app.models.test_case import (
+    TestCaseDB,
+    TestCasePriority,
+    TestCaseStatus,
+    TestCaseType,
+)
+
+TOTAL_KEY = ("total", "")
+COUNTED_DIMENSIONS = ("status", "priority", "type", "created_by")
+
+# (project_id, dimension, value) -> count delta
+StatDeltas = Counter
+
+
+def _stat_value(value: Any) -> str:
+    """Normalize a column value (enum member, name, value or creator ID) for counters"""
+    if isinstance(value, enum.Enum):
+        return value.value
+    return str(value).lower()
+
+
+def add_test_case(
+    deltas: StatDeltas, project_id: int, values: Mapping[str, Any], sign: int = 1
+) -> None:
+    """Count one test case with these column values in (sign=1) or out (sign=-1)"""
+    deltas[(project_id,) + TOTAL_KEY] += sign
+    for dimension in COUNTED_DIMENSIONS:
+        deltas[(project_id, dimension, _stat_value(values[dimension]))] += sign
+
+
+def move_test_case(
+    deltas: StatDeltas, project_id: int, dimension: str, old: Any, new: Any
+) -> None:
+    """Move one test case between two values of a dimension"""
+    old, new = _stat_value(old), _stat_value(new)
+    if old != new:
+        deltas[(project_id, dimension, old)] -= 1
+        deltas[(project_id, dimension, new)] += 1
+
+
+def apply_stat_deltas(connection: Connection, deltas: StatDeltas) -> None:
+    """Add the deltas to their counters in the connection's transaction"""
+    rows = [
+        {
+            "project_id": project_id,
+            "dimension": dimension,
+            "value": value,
+            "count": count,
+        }
+        for (project_id, dimension, value), count in sorted(deltas.items())
+        if count
+    ]
+    if not rows:
+        return
+    
+    table = TestCaseStatCounterDB.__table__
+    insert = pg_insert if connection.dialect.name == "postgresql" else sqlite_insert
+    stmt = insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.project_id, table.c.dimension, table.c.value],
+        set_={"count": table.c.count + stmt.excluded["count"]},
+    )
+    connection.execute(stmt, rows)
+
+
+class TestCaseStatsRepository:
+    """Repository class for per-project test case counters"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    @replica_read
+    def get(self, project_id: int) -> Dict[str, Any]:
+        """
+        Get all test case distributions of a project from its counters.
+        
+        Same shape as ``TestCaseRepository.get_stats``; reads only the
+        project's counter rows (one primary key range), whatever its size.
+        """
+        stats: Dict[str, Any] = {
+            'total': 0,
+            'status': {status.value: 0 for status in TestCaseStatus},
+            'priority': {priority.value: 0 for priority in TestCasePriority},
+            'type': {type_.value: 0 for type_ in TestCaseType},
+            'created_by': {},
+        }
+        rows = self.db.execute(
+            select(
+                TestCaseStatCounterDB.dimension,
+                TestCaseStatCounterDB.value,
+                TestCaseStatCounterDB.count,
+            ).where(TestCaseStatCounterDB.project_id == project_id)
+        )
+        for dimension, value, count in rows:
+            if (dimension, value) == TOTAL_KEY:
+                stats['total'] = count
+            elif dimension == 'created_by':
+                if count:
+                    stats['created_by'][int(value)] = count
+            elif value in stats[dimension]:
+                stats[dimension][value] = count
+        return stats
+    
+    def rebuild(self, project_id: int) -> Dict[str, Any]:
+        """
+        Recompute a project's counters from ``test_cases``. Does not commit.
+        
+        The counters are deleted first, so writers committing during the
+        rebuild either block on the deleted rows or are seen by the recount.
+        """
+        from app.repositories.test_case_repository import TestCaseRepository
+        
+        self.db.execute(
+            delete(TestCaseStatCounterDB).where(
+                TestCaseStatCounterDB.project_id == project_id
+            )
+        )
+        stats = TestCaseRepository(self.db).get_stats(project_id)
+        
+        deltas = StatDeltas()
+        deltas[(project_id,) + TOTAL_KEY] = stats['total']
+        for dimension in COUNTED_DIMENSIONS:
+            for value, count in stats[dimension].items():
+                deltas[(project_id, dimension, _stat_value(value))] = count
+        apply_stat_deltas(self.db.connection(), deltas)
+        return stats
+    
+    def project_ids(self) -> List[int]:
+        """IDs of all projects that have test cases or counters"""
+        stmt = union(
+            select(TestCaseDB.project_id).distinct(),
+            select(TestCaseStatCounterDB.project_id).distinct(),
+        )
+        return sorted(project_id for (project_id,) in self.db.execute(stmt))
+
+
+def _values(test_case: TestCaseDB) -> Dict[str, Any]:
+    return {
+        dimension: getattr(test_case, dimension) for dimension in COUNTED_DIMENSIONS
+    }
+
+
+@event.listens_for(TestCaseDB, "after_insert")
+def _count_inserted(mapper, connection, target) -> None:
+    deltas = StatDeltas()
+    add_test_case(deltas, target.project_id, _values(target))
+    apply_stat_deltas(connection, deltas)
+
+
+@event.listens_for(TestCaseDB, "after_delete")
+def _count_deleted(mapper, connection, target) -> None:
+    deltas = StatDeltas()
+    add_test_case(deltas, target.project_id, _values(target), sign=-1)
+    apply_stat_deltas(connection, deltas)
+
+
+@event.listens_for(TestCaseDB, "after_update")
+def _count_updated(mapper, connection, target) -> None:
+    state = inspect(target)
+    deltas = StatDeltas()
+    for dimension in COUNTED_DIMENSIONS:
+        history = state.attrs[dimension].history
+        if history.added and history.deleted:
+            move_test_case(
+                deltas,
+                target.project_id,
+                dimension,
+                history.deleted[0],
+                history.added[0],
+            )
+    apply_stat_deltas(connection, deltas)
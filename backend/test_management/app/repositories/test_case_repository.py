@@ -2,15 +2,58 @@
 Test case repository for data access operations
 """
 
-from typing import List, Optional, Dict, Any
+import enum
+import json
+from typing import List, Optional, Dict, Any, Iterator, Sequence, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy import (
+    and_,
+    or_,
+    exists,
+    desc,
+    select,
+    insert,
+    update,
+    Text,
+    tuple_,
+    literal,
+    literal_column,
+    null,
+    cast,
+    String,
+    union_all,
+)
 from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import ARRAY
 
-from app.models.test_case import TestCaseDB, TestCase, TestCaseCreate, TestCaseUpdate, TestCaseSearchQuery, TestCaseStatus, TestCasePriority, TestCaseType
+from app.models.test_case import (
+    TestCaseDB,
+    TestCaseCreate,
+    TestCaseUpdate,
+    TestCaseSearchQuery,
+    TestCaseStatus,
+    TestCasePriority,
+    TestCaseType,
+    TestCaseCountMode,
+    TestCaseTagsOperation,
+    TEST_CASE_SEARCH_VECTOR,
+)
 from app.models.user import UserDB
-
+from app.models.archived_test_case import (
+    ArchivedTestCaseDB,
+    ARCHIVED_TEST_CASE_SEARCH_VECTOR,
+)
+from app.db_routing import replica_read
+from app.repositories import soft_delete  # noqa: F401 (hides soft-deleted rows)
+from app.repositories.cache_invalidation import mark_project_changed
+from app.repositories.stat_counter_repository import (
+    COUNTED_DIMENSIONS,
+    StatDeltas,
+    add_test_case,
+    apply_stat_deltas,
+    move_test_case,
+)
 
 class TestCaseRepository:
     """Repository class for test case data access operations"""
@@ -29,97 +72,356 @@ class TestCaseRepository:
             priority=test_case_data.priority,
             type=test_case_data.type,
             preconditions=test_case_data.preconditions,
+            steps=test_case_data.steps,
+            expected_results=test_case_data.expected_results,
             estimated_duration=test_case_data.estimated_duration,
+            tags=test_case_data.tags or [],
         )
         
-        # Handle list fields (convert to JSON strings)
-        if test_case_data.steps:
-            db_test_case.set_steps_list(test_case_data.steps)
-        if test_case_data.expected_results:
-            db_test_case.set_expected_results_list(test_case_data.expected_results)
-        if test_case_data.tags:
-            db_test_case.set_tags_list(test_case_data.tags)
-        
         self.db.add(db_test_case)
-        self.db.commit()
-        self.db.refresh(db_test_case)
+        self.db.flush()
         return db_test_case
     
-    def get_by_id(self, test_case_id: int) -> Optional[TestCaseDB]:
-        """Get test case by ID"""
-        return self.db.query(TestCaseDB).filter(TestCaseDB.id == test_case_id).first()
+    def bulk_create(
+        self,
+        test_cases_data: List[TestCaseCreate],
+        project_id: int,
+        created_by: int
+    ) -> List[int]:
+        """
+        Insert many test cases with multi-row ``INSERT ... RETURNING id``.
+        
+        Returned IDs are in the order of ``test_cases_data``. Does not commit.
+        """
+        if not test_cases_data:
+            return []
+        
+        now = datetime.utcnow()
+        rows = [
+            {
+                'project_id': project_id,
+                'created_by': created_by,
+                'title': data.title,
+                'description': data.description,
+                'status': data.status,
+                'priority': data.priority,
+                'type': data.type,
+                'preconditions': data.preconditions,
+                'steps': data.steps,
+                'expected_results': data.expected_results,
+                'estimated_duration': data.estimated_duration,
+                'tags': data.tags or [],
+                'created_at': now,
+                'updated_at': now,
+            }
+            for data in test_cases_data
+        ]
+        stmt = insert(TestCaseDB).returning(TestCaseDB.id, sort_by_parameter_order=True)
+        mark_project_changed(self.db, project_id)
+        ids = list(self.db.execute(stmt, rows).scalars())
+        
+        deltas = StatDeltas()
+        for row in rows:
+            add_test_case(deltas, project_id, row)
+        apply_stat_deltas(self.db.connection(), deltas)
+        return ids
+    
+    def get_by_id(
+        self, test_case_id: int, project_id: Optional[int] = None
+    ) -> Optional[TestCaseDB]:
+        """
+        Get test case by ID.
+        
+        Pass ``project_id`` whenever the caller knows it: on a table
+        partitioned by project (see database/migrations/optional) the lookup
+        then touches a single partition instead of probing all of them.
+        """
+        query = self.db.query(TestCaseDB).filter(TestCaseDB.id == test_case_id)
+        if project_id is not None:
+            query = query.filter(TestCaseDB.project_id == project_id)
+        return query.first()
+    
+    def get_version(self, test_case_id: int) -> Optional[Tuple[int, int]]:
+        """Get ``(project_id, version)`` of a test case without loading the row"""
+        row = self.db.execute(
+            select(TestCaseDB.project_id, TestCaseDB.version).where(
+                TestCaseDB.id == test_case_id
+            )
+        ).first()
+        return tuple(row) if row else None
     
     def get_by_id_and_project(self, test_case_id: int, project_id: int) -> Optional[TestCaseDB]:
         """Get test case by ID and project ID (for access control)"""
-        return self.db.query(TestCaseDB).filter(
-            and_(TestCaseDB.id == test_case_id, TestCaseDB.project_id == project_id)
-        ).first()
+        return self.get_by_id(test_case_id, project_id)
     
+    @replica_read
     def get_by_project(
         self, 
         project_id: int,
         skip: int = 0, 
         limit: int = 100,
-        query_params: Optional[TestCaseSearchQuery] = None
-    ) -> tuple[List[TestCaseDB], int]:
-        """Get test cases for a project with optional filters"""
-        query = self.db.query(TestCaseDB).filter(TestCaseDB.project_id == project_id)
-        total_query = self.db.query(TestCaseDB).filter(TestCaseDB.project_id == project_id)
-        
-        # Apply filters
-        if query_params:
-            if query_params.title:
-                query = query.filter(TestCaseDB.title.contains(query_params.title))
-                total_query = total_query.filter(TestCaseDB.title.contains(query_params.title))
-            
-            if query_params.status:
-                query = query.filter(TestCaseDB.status == query_params.status)
-                total_query = total_query.filter(TestCaseDB.status == query_params.status)
-            
-            if query_params.priority:
-                query = query.filter(TestCaseDB.priority == query_params.priority)
-                total_query = total_query.filter(TestCaseDB.priority == query_params.priority)
-            
-            if query_params.type:
-                query = query.filter(TestCaseDB.type == query_params.type)
-                total_query = total_query.filter(TestCaseDB.type == query_params.type)
-            
-            if query_params.created_by:
-                query = query.filter(TestCaseDB.created_by == query_params.created_by)
-                total_query = total_query.filter(TestCaseDB.created_by == query_params.created_by)
-            
-            if query_params.created_after:
-                query = query.filter(TestCaseDB.created_at >= query_params.created_after)
-                total_query = total_query.filter(TestCaseDB.created_at >= query_params.created_after)
-            
-            if query_params.created_before:
-                query = query.filter(TestCaseDB.created_at <= query_params.created_before)
-                total_query = total_query.filter(TestCaseDB.created_at <= query_params.created_before)
-            
-            # Tag filtering
-            if query_params.tags:
-                for tag in query_params.tags:
-                    query = query.filter(TestCaseDB.tags.contains(f'"{tag}"'))
-                    total_query = total_query.filter(TestCaseDB.tags.contains(f'"{tag}"'))
+        query_params: Optional[TestCaseSearchQuery] = None,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        count_mode: TestCaseCountMode = TestCaseCountMode.EXACT,
+        columns: Optional[Sequence] = None
+    ) -> tuple[List[Any], Optional[int], bool]:
+        """
+        Get test cases for a project with optional filters.
+        
+        Rows are ordered by ``(created_at, id)`` descending. When ``cursor`` is
+        given, the page starts right after that sort key (keyset pagination)
+        and ``skip`` is ignored. With ``columns``, plain row tuples of those
+        columns are returned instead of ``TestCaseDB`` objects.
+        
+        Returns ``(test_cases, total, total_is_estimate)``. Exact totals of
+        offset pages come from a ``count(*) OVER ()`` window in the page query
+        itself; estimated totals come from the PostgreSQL planner and fall back
+        to an exact count on other dialects.
+        
+        With ``query_params.include_archived`` and ``columns``, archived test
+        cases are listed together with the working set.
+        """
+        if query_params is not None and query_params.include_archived and columns:
+            return self._get_by_project_with_archive(
+                project_id, skip, limit, query_params, cursor, count_mode, columns
+            )
+        
+        query = self._filtered_query(project_id, query_params)
+        total = None
+        total_is_estimate = False
+        
+        if count_mode == TestCaseCountMode.ESTIMATED:
+            total = self.estimate_count(query)
+            total_is_estimate = total is not None
+            if total is None:
+                count_mode = TestCaseCountMode.EXACT
+        
+        page_query = query.with_entities(*columns) if columns else query
+        if cursor is not None:
+            created_at, test_case_id = cursor
+            page_query = page_query.filter(
+                tuple_(TestCaseDB.created_at, TestCaseDB.id)
+                < tuple_(created_at, test_case_id)
+            )
+            skip = 0
+        
+        # The window total only covers the full filtered set when no cursor narrows it
+        window_total = count_mode == TestCaseCountMode.EXACT and cursor is None
+        if window_total:
+            page_query = page_query.add_columns(func.count(TestCaseDB.id).over())
         
         # Apply pagination and ordering
-        query = query.order_by(desc(TestCaseDB.created_at))
-        test_cases = query.offset(skip).limit(limit).all()
-        total = total_query.count()
+        page_query = page_query.order_by(
+            desc(TestCaseDB.created_at), desc(TestCaseDB.id)
+        )
+        rows = page_query.offset(skip).limit(limit).all()
+        
+        if window_total:
+            test_cases = [row[:-1] if columns else row[0] for row in rows]
+            if rows:
+                total = rows[0][-1]
+            else:
+                # Past the last page the window has nothing to report
+                total = query.count() if skip else 0
+        else:
+            test_cases = rows
+            if count_mode == TestCaseCountMode.EXACT:
+                total = query.count()
+        
+        return test_cases, total, total_is_estimate
+    
+    def _get_by_project_with_archive(
+        self,
+        project_id: int,
+        skip: int,
+        limit: int,
+        query_params: TestCaseSearchQuery,
+        cursor: Optional[Tuple[datetime, int]],
+        count_mode: TestCaseCountMode,
+        columns: Sequence
+    ) -> tuple[List[tuple], Optional[int], bool]:
+        """``get_by_project`` over the union of test_cases and archived_test_cases"""
+        names = [column.key for column in columns]
+        rows = union_all(*[
+            self._filtered_query(project_id, query_params, model)
+            .with_entities(
+                *[getattr(model, name) for name in names],
+                model.created_at.label('sort_created_at'),
+                model.id.label('sort_id')
+            )
+            .statement
+            for model in (TestCaseDB, ArchivedTestCaseDB)
+        ]).subquery()
+        count_query = select(func.count()).select_from(rows)
+        total = None
+        total_is_estimate = False
+        
+        if count_mode == TestCaseCountMode.ESTIMATED:
+            total = self.estimate_count(select(rows))
+            total_is_estimate = total is not None
+            if total is None:
+                count_mode = TestCaseCountMode.EXACT
+        
+        page_query = select(*[rows.c[name] for name in names])
+        if cursor is not None:
+            page_query = page_query.where(
+                tuple_(rows.c.sort_created_at, rows.c.sort_id) < tuple_(*cursor)
+            )
+            skip = 0
+        
+        window_total = count_mode == TestCaseCountMode.EXACT and cursor is None
+        if window_total:
+            page_query = page_query.add_columns(func.count().over())
+        
+        page_query = page_query.order_by(
+            desc(rows.c.sort_created_at), desc(rows.c.sort_id)
+        )
+        page = self.db.execute(page_query.offset(skip).limit(limit)).all()
+        
+        if window_total:
+            test_cases = [tuple(row[:-1]) for row in page]
+            if page:
+                total = page[0][-1]
+            else:
+                total = self.db.execute(count_query).scalar() if skip else 0
+        else:
+            test_cases = [tuple(row) for row in page]
+            if count_mode == TestCaseCountMode.EXACT:
+                total = self.db.execute(count_query).scalar()
+        
+        return test_cases, total, total_is_estimate
+    
+    def estimate_count(self, query) -> Optional[int]:
+        """
+        Get the planner's row estimate for a query (or select) without executing it.
+        
+        Only available on PostgreSQL; returns None elsewhere.
+        """
+        bind = self.db.get_bind()
+        if bind.dialect.name != 'postgresql':
+            return None
+        
+        statement = getattr(query, "statement", query)
+        sql = statement.compile(
+            dialect=bind.dialect, compile_kwargs={"literal_binds": True}
+        )
+        plan = (
+            self.db.connection()
+            .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+            .scalar()
+        )
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    
+    def _filtered_query(
+        self,
+        project_id: int,
+        query_params: Optional[TestCaseSearchQuery] = None,
+        model=TestCaseDB
+    ):
+        """Build the project query on ``model``'s table with the search filters"""
+        query = self.db.query(model).filter(model.project_id == project_id)
+        
+        if not query_params:
+            return query
+        
+        if query_params.title:
+            query = query.filter(model.title.contains(query_params.title))
+        
+        if query_params.status:
+            query = query.filter(model.status == query_params.status)
+        
+        if query_params.priority:
+            query = query.filter(model.priority == query_params.priority)
+        
+        if query_params.type:
+            query = query.filter(model.type == query_params.type)
+        
+        if query_params.created_by:
+            query = query.filter(model.created_by == query_params.created_by)
+        
+        if query_params.created_after:
+            query = query.filter(model.created_at >= query_params.created_after)
+        
+        if query_params.created_before:
+            query = query.filter(model.created_at <= query_params.created_before)
+        
+        if query_params.tags:
+            query = query.filter(self._has_tags(model, query_params.tags))
+        
+        return query
+    
+    def _has_tags(self, model, tags: List[str]):
+        """
+        Criterion: the row carries every one of ``tags``.
+        
+        PostgreSQL tests array containment (``tags @> ARRAY[...]``), served by
+        the GIN index on tags. SQLite stores tags as a JSON array and has no
+        containment operator, so each tag becomes an ``EXISTS`` over
+        ``json_each(tags)``.
+        """
+        if self.db.get_bind().dialect.name == 'postgresql':
+            return model.tags.contains(tags)
+        
+        criteria = []
+        for tag in tags:
+            elements = func.json_each(model.tags).table_valued('value')
+            criteria.append(
+                exists(select(1).select_from(elements).where(elements.c.value == tag))
+            )
+        return and_(*criteria)
+    
+    def export_statement(
+        self,
+        project_id: int,
+        columns: Sequence,
+        query_params: Optional[TestCaseSearchQuery] = None,
+        batch_size: int = 1000
+    ):
+        """Select filtered test case ``columns`` by id, batch_size rows at a time"""
+        return (
+            self._filtered_query(project_id, query_params)
+            .with_entities(*columns)
+            .order_by(TestCaseDB.id)
+            .statement
+            .execution_options(yield_per=batch_size)
+        )
+    
+    def iter_by_project(
+        self,
+        project_id: int,
+        columns: Sequence,
+        query_params: Optional[TestCaseSearchQuery] = None,
+        batch_size: int = 1000
+    ) -> Iterator[tuple]:
+        """
+        Stream filtered test case rows as plain tuples of ``columns``.
         
-        return test_cases, total
+        Rows are fetched ``batch_size`` at a time from a server-side cursor and
+        never enter the identity map, so memory stays flat for any project size.
+        """
+        stmt = self.export_statement(project_id, columns, query_params, batch_size)
+        for row in self.db.execute(stmt):
+            yield tuple(row)
     
+    @replica_read
     def get_all(
         self, 
         skip: int = 0, 
         limit: int = 100,
+        project_id: Optional[int] = None,
         status: Optional[TestCaseStatus] = None,
         priority: Optional[TestCasePriority] = None,
         type: Optional[TestCaseType] = None,
-        created_by: Optional[int] = None
-    ) -> List[TestCaseDB]:
-        """Get all test cases with optional filters"""
-        query = self.db.query(TestCaseDB)
+        created_by: Optional[int] = None,
+        columns: Optional[Sequence] = None
+    ) -> List[Any]:
+        """Get all test cases with optional filters (``columns`` row tuples if given)"""
+        query = self.db.query(*columns) if columns else self.db.query(TestCaseDB)
+        
+        if project_id:
+            query = query.filter(TestCaseDB.project_id == project_id)
         
         if status:
             query = query.filter(TestCaseDB.status == status)
@@ -135,6 +437,7 @@ class TestCaseRepository:
         
         return query.order_by(desc(TestCaseDB.created_at)).offset(skip).limit(limit).all()
     
+    @replica_read
     def count(
         self, 
         project_id: Optional[int] = None,
@@ -163,44 +466,169 @@ class TestCaseRepository:
         
         return query.count()
     
-    def update(self, test_case_id: int, update_data: TestCaseUpdate) -> Optional[TestCaseDB]:
+    def update(
+        self,
+        test_case_id: int,
+        update_data: TestCaseUpdate,
+        project_id: Optional[int] = None
+    ) -> Optional[TestCaseDB]:
         """Update a test case"""
-        db_test_case = self.get_by_id(test_case_id)
+        db_test_case = self.get_by_id(test_case_id, project_id)
         if not db_test_case:
             return None
         
         update_dict = update_data.dict(exclude_unset=True)
         
-        # Handle list fields (convert to JSON strings)
-        if 'steps' in update_dict and update_dict['steps'] is not None:
-            db_test_case.set_steps_list(update_dict['steps'])
-            del update_dict['steps']
-        
-        if 'expected_results' in update_dict and update_dict['expected_results'] is not None:
-            db_test_case.set_expected_results_list(update_dict['expected_results'])
-            del update_dict['expected_results']
+        # List fields map to native JSONB/array columns; a null list means "leave as is"
+        for field in ('steps', 'expected_results', 'tags'):
+            if field in update_dict and update_dict[field] is None:
+                del update_dict[field]
         
-        if 'tags' in update_dict and update_dict['tags'] is not None:
-            db_test_case.set_tags_list(update_dict['tags'])
-            del update_dict['tags']
-        
-        # Update other fields
         for field, value in update_dict.items():
             setattr(db_test_case, field, value)
         
         db_test_case.updated_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(db_test_case)
+        self.db.flush()
         return db_test_case
     
-    def delete(self, test_case_id: int) -> bool:
-        """Delete a test case"""
-        db_test_case = self.get_by_id(test_case_id)
-        if not db_test_case:
+    def bulk_update(
+        self,
+        project_id: int,
+        test_case_ids: List[int],
+        values: Dict[str, Any],
+        updated_by: Optional[int] = None
+    ) -> List[int]:
+        """
+        Update many test cases of a project with one set-based statement.
+        
+        Runs a single ``UPDATE ... WHERE project_id = ? AND id IN (...)
+        RETURNING id`` in one transaction and returns the IDs that matched.
+        """
+        if not test_case_ids:
+            return []
+        
+        # Lock the rows and read the counted values they are about to lose
+        counted = [name for name in ('status', 'priority', 'type') if name in values]
+        old_values = {}
+        if counted:
+            old_values = {
+                row[0]: row[1:]
+                for row in self.db.execute(
+                    select(
+                        TestCaseDB.id, *[getattr(TestCaseDB, name) for name in counted]
+                    )
+                    .where(
+                        TestCaseDB.project_id == project_id,
+                        TestCaseDB.id.in_(test_case_ids),
+                    )
+                    .with_for_update()
+                )
+            }
+        
+        stmt = (
+            update(TestCaseDB)
+            .where(
+                TestCaseDB.project_id == project_id, TestCaseDB.id.in_(test_case_ids)
+            )
+            .values(
+                **values,
+                updated_by=updated_by,
+                updated_at=datetime.utcnow(),
+                version=TestCaseDB.version + 1,
+            )
+            .returning(TestCaseDB.id)
+            .execution_options(synchronize_session=False)
+        )
+        mark_project_changed(self.db, project_id)
+        updated_ids = list(self.db.execute(stmt).scalars())
+        
+        deltas = StatDeltas()
+        for test_case_id in updated_ids:
+            for name, old in zip(counted, old_values.get(test_case_id, ())):
+                move_test_case(deltas, project_id, name, old, values[name])
+        apply_stat_deltas(self.db.connection(), deltas)
+        return updated_ids
+    
+    def bulk_update_tags(
+        self,
+        project_id: int,
+        test_case_ids: List[int],
+        tags: List[str],
+        operation: TestCaseTagsOperation,
+        updated_by: Optional[int] = None
+    ) -> List[int]:
+        """Set, add or remove tags on many test cases with one statement"""
+        if operation == TestCaseTagsOperation.SET:
+            return self.bulk_update(
+                project_id, test_case_ids, {'tags': tags}, updated_by
+            )
+        
+        if self.db.get_bind().dialect.name != 'postgresql':
+            return self._bulk_update_tags_fallback(
+                project_id, test_case_ids, tags, operation, updated_by
+            )
+        
+        # Array functions keep the statement set-based: array_remove drops a tag,
+        # array_append after array_remove adds it without duplicating
+        expression = func.coalesce(TestCaseDB.tags, cast([], ARRAY(Text)))
+        for tag in tags:
+            expression = func.array_remove(expression, tag)
+            if operation == TestCaseTagsOperation.ADD:
+                expression = func.array_append(expression, tag)
+        
+        return self.bulk_update(
+            project_id, test_case_ids, {'tags': expression}, updated_by
+        )
+    
+    def _bulk_update_tags_fallback(
+        self,
+        project_id: int,
+        test_case_ids: List[int],
+        tags: List[str],
+        operation: TestCaseTagsOperation,
+        updated_by: Optional[int] = None
+    ) -> List[int]:
+        """Tag add/remove for databases without array functions (row by row)"""
+        test_cases = self.get_by_ids(project_id, test_case_ids)
+        for test_case in test_cases:
+            current = [tag for tag in (test_case.tags or []) if tag not in tags]
+            test_case.tags = (
+                current + tags if operation == TestCaseTagsOperation.ADD else current
+            )
+            test_case.updated_by = updated_by
+            test_case.updated_at = datetime.utcnow()
+        self.db.flush()
+        return [test_case.id for test_case in test_cases]
+    
+    def delete(self, test_case_id: int, project_id: Optional[int] = None) -> bool:
+        """
+        Soft-delete a test case with one ``UPDATE ... RETURNING`` statement.
+        
+        The row is hidden at once (see soft_delete) and hard-deleted later by
+        the purge worker; its counters are decremented now and its version is
+        bumped so outstanding ETags no longer match. Does not commit.
+        """
+        now = datetime.utcnow()
+        stmt = (
+            update(TestCaseDB)
+            .where(TestCaseDB.id == test_case_id)
+            .values(deleted_at=now, updated_at=now, version=TestCaseDB.version + 1)
+            .returning(
+                TestCaseDB.project_id,
+                *[getattr(TestCaseDB, name) for name in COUNTED_DIMENSIONS],
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if project_id is not None:
+            stmt = stmt.where(TestCaseDB.project_id == project_id)
+        row = self.db.execute(stmt).first()
+        if row is None:
             return False
         
-        self.db.delete(db_test_case)
-        self.db.commit()
+        mark_project_changed(self.db, row.project_id)
+        deltas = StatDeltas()
+        add_test_case(deltas, row.project_id, row._mapping, sign=-1)
+        apply_stat_deltas(self.db.connection(), deltas)
         return True
     
     def user_has_access(self, user_id: int, project_id: int) -> bool:
@@ -211,38 +639,276 @@ class TestCaseRepository:
         project_repo = ProjectRepository(self.db)
         return project_repo.user_has_access(user_id, project_id)
     
+    @replica_read
     def get_project_test_cases_count(self, project_id: int) -> Dict[str, int]:
         """Get count of test cases by status for a project"""
-        counts = {}
-        for status in TestCaseStatus:
-            counts[status.value] = self.count(project_id=project_id, status=status)
-        return counts
+        return self._count_by(project_id, TestCaseDB.status, TestCaseStatus)
     
+    @replica_read
     def get_priority_distribution(self, project_id: int) -> Dict[str, int]:
         """Get count of test cases by priority for a project"""
-        counts = {}
-        for priority in TestCasePriority:
-            counts[priority.value] = self.count(project_id=project_id, priority=priority)
-        return counts
+        return self._count_by(project_id, TestCaseDB.priority, TestCasePriority)
     
+    @replica_read
     def get_type_distribution(self, project_id: int) -> Dict[str, int]:
         """Get count of test cases by type for a project"""
-        counts = {}
-        for type_ in TestCaseType:
-            counts[type_.value] = self.count(project_id=project_id, type=type_)
+        return self._count_by(project_id, TestCaseDB.type, TestCaseType)
+    
+    def _count_by(self, project_id: int, column, enum_cls) -> Dict[str, int]:
+        """Count test cases of a project grouped by one enum column (single query)"""
+        counts = {member.value: 0 for member in enum_cls}
+        rows = (
+            self.db.query(column, func.count(TestCaseDB.id))
+            .filter(TestCaseDB.project_id == project_id)
+            .group_by(column)
+            .all()
+        )
+        for value, count in rows:
+            counts[self._enum_value(value)] = count
         return counts
     
-    def search_similar_test_cases(self, project_id: int, title: str, exclude_id: Optional[int] = None) -> List[TestCaseDB]:
-        """Search for similar test cases by title"""
-        query = self.db.query(TestCaseDB).filter(TestCaseDB.project_id == project_id)
+    @replica_read
+    def get_stats(self, project_id: int) -> Dict[str, Any]:
+        """
+        Get all test case distributions for a project in one round trip.
+        
+        On PostgreSQL this is a single ``GROUP BY GROUPING SETS`` scan; other
+        dialects fall back to a ``UNION ALL`` of grouped selects, which is still
+        one statement.
+        """
+        dimensions = [
+            ('status', TestCaseDB.status),
+            ('priority', TestCaseDB.priority),
+            ('type', TestCaseDB.type),
+            ('created_by', TestCaseDB.created_by),
+        ]
+        
+        if self.db.get_bind().dialect.name == 'postgresql':
+            rows = self._stats_grouping_sets(project_id, dimensions)
+        else:
+            rows = self._stats_union_all(project_id, dimensions)
+        
+        stats: Dict[str, Any] = {
+            'total': 0,
+            'status': {status.value: 0 for status in TestCaseStatus},
+            'priority': {priority.value: 0 for priority in TestCasePriority},
+            'type': {type_.value: 0 for type_ in TestCaseType},
+            'created_by': {},
+        }
+        for dimension, value, count in rows:
+            if dimension is None:
+                stats['total'] = count
+            elif dimension == 'created_by':
+                stats['created_by'][value] = count
+            else:
+                stats[dimension][self._enum_value(value)] = count
+        return stats
+    
+    def _stats_grouping_sets(self, project_id: int, dimensions) -> List[tuple]:
+        """Run the stats query as one GROUPING SETS aggregate (PostgreSQL)"""
+        columns = [column for _, column in dimensions]
+        query = (
+            self.db.query(
+                *columns,
+                *[func.grouping(column) for column in columns],
+                func.count(TestCaseDB.id),
+            )
+            .filter(TestCaseDB.project_id == project_id)
+            .group_by(func.grouping_sets(*columns, literal_column('()')))
+        )
+        
+        rows = []
+        for row in query.all():
+            values = row[:len(columns)]
+            grouped = row[len(columns):2 * len(columns)]
+            count = row[-1]
+            # GROUPING(col) is 0 for the column this row is grouped by
+            dimension = None
+            value = None
+            for (name, _), is_rolled_up, column_value in zip(
+                dimensions, grouped, values
+            ):
+                if not is_rolled_up:
+                    dimension, value = name, column_value
+                    break
+            rows.append((dimension, value, count))
+        return rows
+    
+    def _stats_union_all(self, project_id: int, dimensions) -> List[tuple]:
+        """Run the stats query as one UNION ALL statement (portable fallback)"""
+        selects = [
+            select(
+                literal(name).label('dimension'),
+                cast(column, String).label('value'),
+                func.count(TestCaseDB.id).label('count'),
+            )
+            .where(TestCaseDB.project_id == project_id)
+            .group_by(column)
+            for name, column in dimensions
+        ]
+        selects.append(
+            select(
+                null().label('dimension'),
+                null().label('value'),
+                func.count(TestCaseDB.id).label('count'),
+            ).where(TestCaseDB.project_id == project_id)
+        )
+        
+        rows = []
+        for dimension, value, count in self.db.execute(union_all(*selects)).all():
+            if dimension == 'created_by':
+                value = int(value)
+            rows.append((dimension, value, count))
+        return rows
+    
+    @staticmethod
+    def _enum_value(value: Any) -> str:
+        """Normalize an enum column value (member, name or value) to its value"""
+        if isinstance(value, enum.Enum):
+            return value.value
+        return str(value).lower()
+    
+    @replica_read
+    def search(
+        self,
+        project_id: int,
+        tsquery: str,
+        skip: int = 0,
+        limit: int = 10,
+        include_archived: bool = False
+    ) -> tuple[List[tuple[Any, float, Optional[str]]], int]:
+        """
+        Ranked full-text search over a project's test cases.
+        
+        Matching and ranking run in PostgreSQL against the GIN-indexed
+        ``search_vector`` document; highlighting is computed only for the
+        returned page. Returns ``([(test_case, rank, highlight)], total)``.
+        With ``include_archived``, archived test cases are ranked together
+        with the working set and come back as ``ArchivedTestCaseDB`` rows.
+        """
+        if self.db.get_bind().dialect.name != 'postgresql':
+            return self._search_fallback(
+                project_id, tsquery, skip, limit, include_archived
+            )
+        
+        query = func.to_tsquery('simple', tsquery)
+        sources = self._search_sources(include_archived)
+        candidates = [
+            select(
+                model.id.label('id'),
+                func.ts_rank_cd(search_vector, query).label('rank'),
+                literal(source).label('source'),
+            )
+            .where(
+                model.project_id == project_id,
+                search_vector.op('@@')(query),
+            )
+            for source, (model, search_vector) in enumerate(sources)
+        ]
+        candidates = (
+            candidates[0] if len(candidates) == 1 else union_all(*candidates)
+        ).subquery()
         
-        if exclude_id:
-            query = query.filter(TestCaseDB.id != exclude_id)
+        matches = (
+            select(candidates, func.count().over().label('total'))
+            .order_by(candidates.c.rank.desc(), candidates.c.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .subquery()
+        )
         
-        # Simple similarity search - contains words from title
-        words = title.lower().split()
-        for word in words:
-            if len(word) > 2:  # Skip very short words
-                query = query.or_(TestCaseDB.title.contains(word))
+        rows = []
+        for source, (model, _) in enumerate(sources):
+            document = (
+                func.coalesce(model.title, '') + ' ' +
+                func.coalesce(model.description, '') + ' ' +
+                func.coalesce(model.preconditions, '')
+            )
+            highlight = func.ts_headline(
+                'simple',
+                document,
+                query,
+                'StartSel=<mark>, StopSel=</mark>, '
+                'MaxFragments=2, MaxWords=20, MinWords=5',
+            )
+            rows.extend(
+                self.db.query(model, matches.c.rank, highlight, matches.c.total)
+                .join(
+                    matches, and_(model.id == matches.c.id, matches.c.source == source)
+                )
+                .all()
+            )
+        rows.sort(key=lambda row: (row[1], row[0].id), reverse=True)
         
-        return query.order_by(desc(TestCaseDB.created_at)).limit(10).all()
\ No newline at end of file
+        total = (
+            rows[0][3]
+            if rows
+            else (self._search_count(project_id, query, sources) if skip else 0)
+        )
+        return [
+            (test_case, float(rank_), highlight_)
+            for test_case, rank_, highlight_, _ in rows
+        ], total
+    
+    @staticmethod
+    def _search_sources(include_archived: bool) -> List[tuple]:
+        """``(model, search_vector)`` of the tables a search covers"""
+        sources = [(TestCaseDB, TEST_CASE_SEARCH_VECTOR)]
+        if include_archived:
+            sources.append((ArchivedTestCaseDB, ARCHIVED_TEST_CASE_SEARCH_VECTOR))
+        return sources
+    
+    def _search_count(self, project_id: int, query, sources: List[tuple]) -> int:
+        """Count full-text matches (used when the requested page is empty)"""
+        return sum(
+            self.db.query(func.count(model.id))
+            .filter(
+                model.project_id == project_id,
+                search_vector.op('@@')(query),
+            )
+            .scalar()
+            for model, search_vector in sources
+        )
+    
+    def _search_fallback(
+        self,
+        project_id: int,
+        tsquery: str,
+        skip: int,
+        limit: int,
+        include_archived: bool = False
+    ) -> tuple[List[tuple[Any, float, Optional[str]]], int]:
+        """Unranked substring search for databases without full-text search"""
+        models = [model for model, _ in self._search_sources(include_archived)]
+        test_cases, total = [], 0
+        for model in models:
+            query = self.db.query(model).filter(model.project_id == project_id)
+            for term in tsquery.replace(':*', '').split(' & '):
+                query = query.filter(or_(
+                    model.title.ilike(f"%{term}%"),
+                    model.description.ilike(f"%{term}%"),
+                ))
+            
+            total += query.count()
+            if len(models) == 1:
+                test_cases = (
+                    query.order_by(desc(model.id)).offset(skip).limit(limit).all()
+                )
+            else:
+                # Merged below: each table contributes up to the end of the page
+                test_cases.extend(
+                    query.order_by(desc(model.id)).limit(skip + limit).all()
+                )
+        
+        if len(models) > 1:
+            test_cases.sort(key=lambda test_case: test_case.id, reverse=True)
+            test_cases = test_cases[skip:skip + limit]
+        return [(test_case, 0.0, None) for test_case in test_cases], total
+    
+    def get_by_ids(self, project_id: int, test_case_ids: List[int]) -> List[TestCaseDB]:
+        """Get several test cases of a project by ID (order not guaranteed)"""
+        if not test_case_ids:
+            return []
+        return self.db.query(TestCaseDB).filter(
+            and_(TestCaseDB.project_id == project_id, TestCaseDB.id.in_(test_case_ids))
+        ).all()
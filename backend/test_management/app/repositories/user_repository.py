@@ -27,8 +27,7 @@ class UserRepository:
             is_active=user_data.is_active
         )
         self.db.add(db_user)
-        self.db.commit()
-        self.db.refresh(db_user)
+        self.db.flush()
         return db_user
     
     def get_by_id(self, user_id: int) -> Optional[UserDB]:
@@ -75,8 +74,7 @@ class UserRepository:
         for field, value in update_dict.items():
             setattr(db_user, field, value)
         
-        self.db.commit()
-        self.db.refresh(db_user)
+        self.db.flush()
         return db_user
     
     def delete(self, user_id: int) -> bool:
@@ -86,7 +84,7 @@ class UserRepository:
             return False
         
         db_user.is_active = False
-        self.db.commit()
+        self.db.flush()
         return True
     
     def authenticate(self, email: str, password: str) -> Optional[UserDB]:
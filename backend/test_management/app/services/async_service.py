@@ -0,0 +1,48 @@
+"""
+Base class for async service variants
+"""
+
+from typing import Any, Callable, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.repositories.cache_invalidation import apply_committed_invalidations
+
+T = TypeVar("T")
+
+
+class AsyncService:
+    """
+    Async variant of a synchronous service bound to an AsyncSession.
+    
+    Calls run the synchronous service through ``AsyncSession.run_sync``: the
+    repository code is shared, but every query is awaited on the asyncpg
+    driver, so the event loop is never blocked by the database.
+    
+    The request's session is its unit of work: synchronous services and
+    repositories only flush, and write calls commit once through ``_write``.
+    """
+    
+    service_class: Callable[[Session], Any]
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Run a method of the synchronous service on the async session"""
+        return await self.db.run_sync(
+            lambda session: getattr(self.service_class(session), method)(
+                *args, **kwargs
+            )
+        )
+    
+    async def _write(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a write method of the synchronous service and commit the
+        request's transaction, then invalidate the cached responses it changed
+        """
+        result = await self._call(method, *args, **kwargs)
+        await self.db.commit()
+        await apply_committed_invalidations(self.db)
+        return result
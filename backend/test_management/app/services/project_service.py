@@ -7,9 +7,12 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 
 from app.repositories.project_repository import ProjectRepository
+from app.repositories.purge_repository import PurgeRepository
 from app.repositories.user_repository import UserRepository
 from app.models.project import Project, ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListResponse
+from app.models.purge_job import PurgeJobResponse
 from app.models.user import User
+from app.services.async_service import AsyncService
 
 
 class ProjectService:
@@ -19,6 +22,7 @@ class ProjectService:
         self.db = db
         self.project_repository = ProjectRepository(db)
         self.user_repository = UserRepository(db)
+        self.purge_repository = PurgeRepository(db)
     
     def create_project(self, project_data: ProjectCreate, user_id: int) -> ProjectResponse:
         """Create a new project"""
@@ -49,11 +53,14 @@ class ProjectService:
         self, 
         user_id: int, 
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        status: Optional[str] = None
     ) -> ProjectListResponse:
-        """Get all projects for a user"""
-        projects = self.project_repository.get_user_projects(user_id, skip, limit)
-        total = self.project_repository.count(created_by=user_id)
+        """Get all projects for a user, optionally with one status"""
+        projects = self.project_repository.get_user_projects(
+            user_id, skip, limit, status
+        )
+        total = self.project_repository.count(status=status, created_by=user_id)
         
         project_responses = [ProjectResponse.from_orm(project) for project in projects]
         
@@ -71,8 +78,10 @@ class ProjectService:
         user_id: int
     ) -> Optional[ProjectResponse]:
         """Update a project"""
-        # Check user access
+        # Check user access; a missing project is reported as not found
         if not self.project_repository.user_has_access(user_id, project_id):
+            if self.project_repository.get_by_id(project_id) is None:
+                return None
             raise ValueError("Access denied")
         
         # Update project
@@ -82,23 +91,97 @@ class ProjectService:
         
         return ProjectResponse.from_orm(db_project)
     
-    def delete_project(self, project_id: int, user_id: int) -> bool:
-        """Delete a project"""
-        # Check user access
+    def delete_project(
+        self, project_id: int, user_id: int
+    ) -> Optional[PurgeJobResponse]:
+        """
+        Soft-delete a project and queue the purge of its rows.
+        
+        Returns the purge job, or None if the project does not exist.
+        """
+        # Check user access; a missing project is reported as not found
         if not self.project_repository.user_has_access(user_id, project_id):
+            if self.project_repository.get_by_id(project_id) is None:
+                return None
+            raise ValueError("Access denied")
+        
+        if not self.project_repository.delete(project_id):
+            return None
+        
+        job = self.purge_repository.create_project_job(project_id, user_id)
+        return PurgeJobResponse.from_orm(job)
+    
+    def get_purge_job(self, job_id: int, user_id: int) -> Optional[PurgeJobResponse]:
+        """Get the progress of a purge job requested by the user"""
+        job = self.purge_repository.get_job(job_id)
+        if not job:
+            return None
+        
+        if job.requested_by != user_id:
             raise ValueError("Access denied")
         
-        return self.project_repository.delete(project_id)
+        return PurgeJobResponse.from_orm(job)
     
     def get_project_stats(self, user_id: int) -> Dict[str, Any]:
         """Get project statistics for a user"""
-        total_projects = self.project_repository.count(created_by=user_id)
-        active_projects = self.project_repository.count(created_by=user_id, status='active')
-        inactive_projects = self.project_repository.count(created_by=user_id, status='inactive')
+        status_counts = self.project_repository.get_status_counts(created_by=user_id)
+        total_projects = sum(status_counts.values())
+        active_projects = status_counts.get('active', 0)
+        inactive_projects = status_counts.get('inactive', 0)
         
         return {
             'total_projects': total_projects,
             'active_projects': active_projects,
             'inactive_projects': inactive_projects,
             'archived_projects': total_projects - active_projects - inactive_projects
-        }
\ No newline at end of file
+        }
+
+
+class AsyncProjectService(AsyncService):
+    """Async variant of ProjectService"""
+    
+    service_class = ProjectService
+    
+    async def create_project(
+        self, project_data: ProjectCreate, user_id: int
+    ) -> ProjectResponse:
+        """Create a new project"""
+        return await self._write("create_project", project_data, user_id)
+    
+    async def get_project(
+        self, project_id: int, user_id: int
+    ) -> Optional[ProjectResponse]:
+        """Get project by ID with user access check"""
+        return await self._call("get_project", project_id, user_id)
+    
+    async def get_user_projects(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None
+    ) -> ProjectListResponse:
+        """Get all projects for a user, optionally with one status"""
+        return await self._call("get_user_projects", user_id, skip, limit, status)
+    
+    async def update_project(
+        self, project_id: int, update_data: ProjectUpdate, user_id: int
+    ) -> Optional[ProjectResponse]:
+        """Update a project"""
+        return await self._write("update_project", project_id, update_data, user_id)
+    
+    async def delete_project(
+        self, project_id: int, user_id: int
+    ) -> Optional[PurgeJobResponse]:
+        """Soft-delete a project and queue the purge of its rows"""
+        return await self._write("delete_project", project_id, user_id)
+    
+    async def get_purge_job(
+        self, job_id: int, user_id: int
+    ) -> Optional[PurgeJobResponse]:
+        """Get the progress of a purge job requested by the user"""
+        return await self._call("get_purge_job", job_id, user_id)
+    
+    async def get_project_stats(self, user_id: int) -> Dict[str, Any]:
+        """Get project statistics for a user"""
+        return await self._call("get_project_stats", user_id)
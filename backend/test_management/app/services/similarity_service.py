@@ -0,0 +1,96 @@
+"""
+Similarity service for near-duplicate detection of test cases
+"""
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.repositories.similarity_repository import SimilarityRepository
+from app.utils import minhash
+
+
+class SimilarityService:
+    """
+    MinHash/LSH similarity engine over title, steps and expected results.
+    
+    Signatures are maintained incrementally whenever test cases are created,
+    updated or imported. Lookups only touch test cases that share an LSH
+    bucket with the probe, so their cost does not grow with project size.
+    """
+    
+    DEFAULT_TOP_K = 10
+    DEFAULT_MIN_SIMILARITY = 0.3
+    
+    def __init__(self, db: Session):
+        self.db = db
+        self.similarity_repository = SimilarityRepository(db)
+    
+    @staticmethod
+    def compute_signature(
+        title: str,
+        steps: Optional[Sequence[str]] = None,
+        expected_results: Optional[Sequence[str]] = None
+    ) -> List[int]:
+        """Compute the MinHash signature of a test case's content"""
+        parts = [title or ""]
+        parts.extend(str(step) for step in steps or [])
+        parts.extend(str(result) for result in expected_results or [])
+        return minhash.signature(minhash.shingles(parts))
+    
+    def index_test_cases(self, test_cases: Iterable) -> None:
+        """Create or refresh the index entries of persisted test cases"""
+        self.index_contents(
+            (
+                test_case.id,
+                test_case.project_id,
+                test_case.title,
+                test_case.steps,
+                test_case.expected_results,
+            )
+            for test_case in test_cases
+        )
+    
+    def index_contents(
+        self,
+        contents: Iterable[
+            Tuple[int, int, str, Optional[Sequence[str]], Optional[Sequence[str]]]
+        ],
+    ) -> None:
+        """Index ``(id, project_id, title, steps, expected_results)`` tuples"""
+        entries = []
+        for test_case_id, project_id, title, steps, expected_results in contents:
+            signature = self.compute_signature(title, steps, expected_results)
+            entries.append(
+                (test_case_id, project_id, signature, minhash.band_hashes(signature))
+            )
+        self.similarity_repository.upsert(entries)
+    
+    def remove_test_cases(self, test_case_ids: Iterable[int]) -> None:
+        """Drop test cases from the index"""
+        self.similarity_repository.remove(test_case_ids)
+    
+    def find_similar(
+        self,
+        project_id: int,
+        signature: List[int],
+        exclude_ids: Iterable[int] = (),
+        top_k: int = DEFAULT_TOP_K,
+        min_similarity: float = DEFAULT_MIN_SIMILARITY
+    ) -> List[Tuple[int, float]]:
+        """Return up to top_k ``(test_case_id, similarity)`` pairs, best first"""
+        candidates = self.similarity_repository.find_candidates(
+            project_id, minhash.band_hashes(signature), exclude_ids
+        )
+        
+        scored = [
+            (test_case_id, minhash.similarity(signature, candidate_signature))
+            for test_case_id, candidate_signature in candidates.items()
+        ]
+        scored = [
+            (test_case_id, score)
+            for test_case_id, score in scored
+            if score >= min_similarity
+        ]
+        scored.sort(key=lambda item: (-item[1], -item[0]))
+        return scored[:top_k]
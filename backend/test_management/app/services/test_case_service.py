@@ -2,28 +2,97 @@
 Test case service for business logic operations
 """
 
-from typing import List, Optional, Dict, Any
+from functools import lru_cache, partial
+from typing import (
+    List,
+    Optional,
+    Dict,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Tuple,
+)
 from datetime import datetime
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
+from app.database import get_db_session
+from app.db_routing import primary_reads, replica_reads
 from app.repositories.test_case_repository import TestCaseRepository
+from app.repositories.archive_repository import TestCaseArchiveRepository
+from app.repositories.stat_counter_repository import TestCaseStatsRepository
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.user_repository import UserRepository
 from app.models.test_case import (
-    TestCase, TestCaseCreate, TestCaseUpdate, TestCaseResponse, 
-    TestCaseListResponse, TestCaseSearchQuery, TestCaseStatus, TestCasePriority, TestCaseType
+    TestCase,
+    TestCaseDB,
+    TestCaseCreate,
+    TestCaseUpdate,
+    TestCaseResponse,
+    TestCaseListResponse,
+    TestCaseSearchQuery,
+    TestCaseStatus,
+    TestCasePriority,
+    TestCaseType,
+    TestCaseSearchResult,
+    TestCaseSearchResponse,
+    TestCaseTagsOperation,
+    TEST_CASE_RESPONSE_COLUMNS,
+    TEST_CASE_RESPONSE_FIELDS,
+    projected_list_model,
 )
+from app.models.similarity import SimilarTestCaseResponse
 from app.models.user import User
+from app.services.async_service import AsyncService
+from app.services.similarity_service import SimilarityService
+from app.utils.cursor import decode_cursor, encode_cursor
+from app.utils.etag import list_etag
+from app.utils.search import build_prefix_tsquery
+from app.utils.test_case_io import EXPORT_FIELDS, ImportRecord
+from core.response_cache import cache_requests, response_cache
+
+
+class PreconditionFailedError(ValueError):
+    """A conditional update's If-Match version is no longer current"""
+
+
+_TEST_CASE_ADAPTER = TypeAdapter(Optional[TestCaseResponse])
+_TEST_CASES_ADAPTER = TypeAdapter(List[TestCaseResponse])
+
+
+@lru_cache(maxsize=128)
+def _list_adapter(fields: Tuple[str, ...]) -> TypeAdapter:
+    """Adapter for cached list responses with these item fields"""
+    return TypeAdapter(projected_list_model(fields))
+
+
+def _test_case_responses(rows: Iterable[Tuple]) -> List[TestCaseResponse]:
+    """Validate rows of ``TEST_CASE_RESPONSE_COLUMNS`` as one batch"""
+    return _TEST_CASES_ADAPTER.validate_python(
+        [dict(zip(TEST_CASE_RESPONSE_FIELDS, row)) for row in rows]
+    )
 
 
 class TestCaseService:
     """Service class for test case business logic"""
     
+    IMPORT_BATCH_SIZE = 1000
+    MAX_REPORTED_IMPORT_ERRORS = 1000
+    
     def __init__(self, db: Session):
         self.db = db
         self.test_case_repository = TestCaseRepository(db)
+        self.test_case_stats_repository = TestCaseStatsRepository(db)
+        self.test_case_archive_repository = TestCaseArchiveRepository(db)
         self.project_repository = ProjectRepository(db)
         self.user_repository = UserRepository(db)
+        self.similarity_service = SimilarityService(db)
     
     def create_test_case(self, test_case_data: TestCaseCreate, project_id: int, user_id: int) -> TestCaseResponse:
         """Create a new test case"""
@@ -43,6 +112,9 @@ class TestCaseService:
         # Create test case
         db_test_case = self.test_case_repository.create(test_case_data, project_id, user_id)
         
+        # Keep the similarity index in sync
+        self.similarity_service.index_test_cases([db_test_case])
+        
         # Convert to response model
         return TestCaseResponse.from_orm(db_test_case)
     
@@ -58,6 +130,22 @@ class TestCaseService:
         
         return TestCaseResponse.from_orm(test_case)
     
+    def get_test_case_version(self, test_case_id: int, user_id: int) -> Optional[int]:
+        """Get the current version of a test case (for ETags) without loading it"""
+        row = self.test_case_repository.get_version(test_case_id)
+        if row is None:
+            return None
+        
+        project_id, version = row
+        if not self.project_repository.user_has_access(user_id, project_id):
+            raise ValueError("Access denied")
+        return version
+    
+    def check_project_access(self, project_id: int, user_id: int) -> None:
+        """Raise ValueError unless the user can access the project"""
+        if not self.project_repository.user_has_access(user_id, project_id):
+            raise ValueError("Access denied")
+    
     def get_project_test_cases(
         self, 
         project_id: int, 
@@ -73,37 +161,54 @@ class TestCaseService:
         if query_params is None:
             query_params = TestCaseSearchQuery(page=1, size=10)
         
-        # Calculate skip value
-        skip = (query_params.page - 1) * query_params.size
+        # Keyset mode seeks past the cursor; offset mode skips whole pages
+        cursor = decode_cursor(query_params.cursor) if query_params.cursor else None
+        skip = 0 if cursor else (query_params.page - 1) * query_params.size
         
-        # Get test cases with filters
-        test_cases, total = self.test_case_repository.get_by_project(
-            project_id, skip, query_params.size, query_params
-        )
+        # Only the requested columns are selected; heavy text stays in the table
+        fields = tuple(query_params.fields)
         
-        # Convert to response models
-        test_case_responses = [TestCaseResponse.from_orm(test_case) for test_case in test_cases]
+        # Fetch one extra row to learn whether another page exists without counting
+        rows, total, total_is_estimate = self.test_case_repository.get_by_project(
+            project_id, skip, query_params.size + 1, query_params,
+            cursor=cursor,
+            count_mode=query_params.count,
+            columns=[getattr(TestCaseDB, name) for name in fields]
+        )
+        has_next = len(rows) > query_params.size
+        test_cases = [dict(zip(fields, row)) for row in rows[:query_params.size]]
         
-        # Calculate pagination info
-        has_next = skip + query_params.size < total
-        has_prev = query_params.page > 1
+        next_cursor = None
+        if has_next:
+            last = test_cases[-1]
+            next_cursor = encode_cursor(last['created_at'], last['id'])
         
-        return TestCaseListResponse(
-            test_cases=test_case_responses,
+        # One validation for the whole page, against a model with exactly these fields
+        return projected_list_model(fields).model_validate(dict(
+            test_cases=test_cases,
             total=total,
+            total_is_estimate=total_is_estimate,
             page=query_params.page,
             size=query_params.size,
             has_next=has_next,
-            has_prev=has_prev
-        )
+            has_prev=cursor is not None or query_params.page > 1,
+            next_cursor=next_cursor
+        ))
     
     def update_test_case(
         self, 
         test_case_id: int, 
         update_data: TestCaseUpdate, 
-        user_id: int
+        user_id: int,
+        expected_version: Optional[int] = None
     ) -> Optional[TestCaseResponse]:
-        """Update a test case"""
+        """
+        Update a test case.
+        
+        With ``expected_version`` (from If-Match) the update only applies to
+        that version; the UPDATE is conditional on the version it read, so a
+        concurrent write is detected without holding a lock.
+        """
         # Get existing test case
         test_case = self.test_case_repository.get_by_id(test_case_id)
         if not test_case:
@@ -113,63 +218,129 @@ class TestCaseService:
         if not self.project_repository.user_has_access(user_id, test_case.project_id):
             raise ValueError("Access denied")
         
+        if expected_version is not None and test_case.version != expected_version:
+            raise PreconditionFailedError("Test case was modified by another request")
+        
         # Update test case
-        db_test_case = self.test_case_repository.update(test_case_id, update_data)
+        try:
+            db_test_case = self.test_case_repository.update(
+                test_case_id, update_data, test_case.project_id
+            )
+        except StaleDataError:
+            self.db.rollback()
+            raise PreconditionFailedError("Test case was modified by another request")
         if not db_test_case:
             return None
         
+        # Re-index only when the compared content changed
+        if update_data.dict(exclude_unset=True).keys() & {
+            'title',
+            'steps',
+            'expected_results',
+        }:
+            self.similarity_service.index_test_cases([db_test_case])
+        
         return TestCaseResponse.from_orm(db_test_case)
     
     def delete_test_case(self, test_case_id: int, user_id: int) -> bool:
-        """Delete a test case"""
-        # Get existing test case
-        test_case = self.test_case_repository.get_by_id(test_case_id)
-        if not test_case:
+        """Soft-delete a test case (the purge worker removes the row later)"""
+        # Only the owning project is needed; the row itself is not loaded
+        found = self.test_case_repository.get_version(test_case_id)
+        if not found:
             return False
+        project_id, _ = found
         
         # Check user access to project
-        if not self.project_repository.user_has_access(user_id, test_case.project_id):
+        if not self.project_repository.user_has_access(user_id, project_id):
             raise ValueError("Access denied")
         
-        return self.test_case_repository.delete(test_case_id)
+        self.similarity_service.remove_test_cases([test_case_id])
+        return self.test_case_repository.delete(test_case_id, project_id)
     
-    def get_test_case_stats(self, project_id: int, user_id: int) -> Dict[str, Any]:
-        """Get test case statistics for a project"""
+    def restore_test_case(
+        self, test_case_id: int, user_id: int
+    ) -> Optional[TestCaseResponse]:
+        """Move an archived test case back to the project's working set"""
+        project_id = self.test_case_archive_repository.get_project_id(test_case_id)
+        if project_id is None:
+            return None
+        
         # Check user access to project
         if not self.project_repository.user_has_access(user_id, project_id):
             raise ValueError("Access denied")
         
-        # Get status distribution
-        status_counts = self.test_case_repository.get_project_test_cases_count(project_id)
-        
-        # Get priority distribution
-        priority_counts = self.test_case_repository.get_priority_distribution(project_id)
-        
-        # Get type distribution
-        type_counts = self.test_case_repository.get_type_distribution(project_id)
+        if not self.test_case_archive_repository.restore(test_case_id, project_id):
+            return None
         
-        # Get total count
-        total_count = self.test_case_repository.count(project_id=project_id)
+        test_case = self.test_case_repository.get_by_id(test_case_id, project_id)
+        self.similarity_service.index_test_cases([test_case])
+        return TestCaseResponse.from_orm(test_case)
+    
+    def get_test_case_stats(self, project_id: int, user_id: int) -> Dict[str, Any]:
+        """Get test case statistics for a project"""
+        # Check user access to project
+        if not self.project_repository.user_has_access(user_id, project_id):
+            raise ValueError("Access denied")
         
-        # Get counts by creator
-        from collections import defaultdict
-        creator_counts = defaultdict(int)
-        all_test_cases = self.test_case_repository.get_all(project_id=project_id)
-        for test_case in all_test_cases:
-            creator_counts[test_case.created_by] += 1
+        # Counters are maintained with every write; no scan of test_cases
+        stats = self.test_case_stats_repository.get(project_id)
         
         return {
-            'total_test_cases': total_count,
-            'status_distribution': status_counts,
-            'priority_distribution': priority_counts,
-            'type_distribution': type_counts,
-            'creator_distribution': dict(creator_counts)
+            'total_test_cases': stats['total'],
+            'status_distribution': stats['status'],
+            'priority_distribution': stats['priority'],
+            'type_distribution': stats['type'],
+            'creator_distribution': stats['created_by']
         }
     
-    def search_similar_test_cases(self, test_case_id: int, user_id: int) -> List[TestCaseResponse]:
-        """Search for similar test cases"""
+    def search_test_cases(
+        self,
+        project_id: int,
+        user_id: int,
+        query: str,
+        page: int = 1,
+        size: int = 10,
+        include_archived: bool = False
+    ) -> TestCaseSearchResponse:
+        """Full-text search of a project's test cases, ranked by relevance"""
+        # Check user access to project
+        if not self.project_repository.user_has_access(user_id, project_id):
+            raise ValueError("Access denied")
+        
+        skip = (page - 1) * size
+        hits, total = self.test_case_repository.search(
+            project_id, build_prefix_tsquery(query), skip, size, include_archived
+        )
+        
+        results = [
+            TestCaseSearchResult(
+                **TestCaseResponse.from_orm(test_case).dict(),
+                rank=rank,
+                highlight=highlight
+            )
+            for test_case, rank, highlight in hits
+        ]
+        
+        return TestCaseSearchResponse(
+            results=results,
+            total=total,
+            page=page,
+            size=size,
+            has_next=skip + size < total,
+            has_prev=page > 1
+        )
+    
+    def search_similar_test_cases(
+        self,
+        test_case_id: int,
+        user_id: int,
+        top_k: int = SimilarityService.DEFAULT_TOP_K,
+        min_similarity: float = SimilarityService.DEFAULT_MIN_SIMILARITY,
+        project_id: Optional[int] = None
+    ) -> List[SimilarTestCaseResponse]:
+        """Search for the most similar test cases of an existing test case"""
         # Get existing test case
-        test_case = self.test_case_repository.get_by_id(test_case_id)
+        test_case = self.test_case_repository.get_by_id(test_case_id, project_id)
         if not test_case:
             raise ValueError("Test case not found")
         
@@ -177,13 +348,60 @@ class TestCaseService:
         if not self.project_repository.user_has_access(user_id, test_case.project_id):
             raise ValueError("Access denied")
         
-        # Search for similar test cases
-        similar_test_cases = self.test_case_repository.search_similar_test_cases(
-            test_case.project_id, test_case.title, test_case_id
+        signature = self.similarity_service.compute_signature(
+            test_case.title, test_case.steps, test_case.expected_results
+        )
+        return self._similar_test_cases(
+            test_case.project_id, signature, [test_case_id], top_k, min_similarity
+        )
+    
+    def find_duplicate_test_cases(
+        self,
+        project_id: int,
+        test_case_data: TestCaseCreate,
+        user_id: int,
+        top_k: int = SimilarityService.DEFAULT_TOP_K,
+        min_similarity: float = SimilarityService.DEFAULT_MIN_SIMILARITY
+    ) -> List[SimilarTestCaseResponse]:
+        """Find existing test cases that a not-yet-created test case would duplicate"""
+        # Check user access to project
+        if not self.project_repository.user_has_access(user_id, project_id):
+            raise ValueError("Access denied")
+        
+        signature = self.similarity_service.compute_signature(
+            test_case_data.title, test_case_data.steps, test_case_data.expected_results
+        )
+        return self._similar_test_cases(
+            project_id, signature, [], top_k, min_similarity
+        )
+    
+    def _similar_test_cases(
+        self,
+        project_id: int,
+        signature: List[int],
+        exclude_ids: List[int],
+        top_k: int,
+        min_similarity: float
+    ) -> List[SimilarTestCaseResponse]:
+        """Look up similar test cases and load them in score order"""
+        scored = self.similarity_service.find_similar(
+            project_id, signature, exclude_ids, top_k, min_similarity
         )
+        test_cases = {
+            test_case.id: test_case
+            for test_case in self.test_case_repository.get_by_ids(
+                project_id, [test_case_id for test_case_id, _ in scored]
+            )
+        }
         
-        # Convert to response models
-        return [TestCaseResponse.from_orm(test_case) for test_case in similar_test_cases]
+        return [
+            SimilarTestCaseResponse(
+                **TestCaseResponse.from_orm(test_cases[test_case_id]).dict(),
+                similarity=score
+            )
+            for test_case_id, score in scored
+            if test_case_id in test_cases
+        ]
     
     def get_test_cases_by_priority(self, project_id: int, user_id: int, priority: TestCasePriority) -> List[TestCaseResponse]:
         """Get test cases by priority"""
@@ -192,13 +410,14 @@ class TestCaseService:
             raise ValueError("Access denied")
         
         # Get test cases by priority
-        test_cases = self.test_case_repository.get_all(
+        rows = self.test_case_repository.get_all(
             project_id=project_id, 
-            priority=priority
+            priority=priority,
+            columns=TEST_CASE_RESPONSE_COLUMNS
         )
         
-        # Convert to response models
-        return [TestCaseResponse.from_orm(test_case) for test_case in test_cases]
+        # Convert plain rows to response models in one batch
+        return _test_case_responses(rows)
     
     def get_test_cases_by_type(self, project_id: int, user_id: int, type_: TestCaseType) -> List[TestCaseResponse]:
         """Get test cases by type"""
@@ -207,13 +426,14 @@ class TestCaseService:
             raise ValueError("Access denied")
         
         # Get test cases by type
-        test_cases = self.test_case_repository.get_all(
+        rows = self.test_case_repository.get_all(
             project_id=project_id, 
-            type=type_
+            type=type_,
+            columns=TEST_CASE_RESPONSE_COLUMNS
         )
         
-        # Convert to response models
-        return [TestCaseResponse.from_orm(test_case) for test_case in test_cases]
+        # Convert plain rows to response models in one batch
+        return _test_case_responses(rows)
     
     def get_test_cases_by_status(self, project_id: int, user_id: int, status: TestCaseStatus) -> List[TestCaseResponse]:
         """Get test cases by status"""
@@ -222,13 +442,31 @@ class TestCaseService:
             raise ValueError("Access denied")
         
         # Get test cases by status
-        test_cases = self.test_case_repository.get_all(
+        rows = self.test_case_repository.get_all(
             project_id=project_id, 
-            status=status
+            status=status,
+            columns=TEST_CASE_RESPONSE_COLUMNS
         )
         
-        # Convert to response models
-        return [TestCaseResponse.from_orm(test_case) for test_case in test_cases]
+        # Convert plain rows to response models in one batch
+        return _test_case_responses(rows)
+    
+    def bulk_update_test_cases(
+        self,
+        project_id: int,
+        test_case_ids: List[int],
+        values: Dict[str, Any],
+        user_id: int
+    ) -> Dict[str, Any]:
+        """Apply the same field values to many test cases in one statement"""
+        return self._bulk_result(
+            project_id,
+            test_case_ids,
+            user_id,
+            lambda ids: self.test_case_repository.bulk_update(
+                project_id, ids, values, user_id
+            ),
+        )
     
     def bulk_update_test_cases_status(
         self, 
@@ -238,39 +476,545 @@ class TestCaseService:
         user_id: int
     ) -> Dict[str, Any]:
         """Bulk update test case status"""
-        results = {
-            'success': 0,
-            'failed': 0,
-            'errors': []
+        return self.bulk_update_test_cases(
+            project_id, test_case_ids, {'status': status}, user_id
+        )
+    
+    def bulk_update_test_cases_priority(
+        self,
+        project_id: int,
+        test_case_ids: List[int],
+        priority: TestCasePriority,
+        user_id: int
+    ) -> Dict[str, Any]:
+        """Bulk update test case priority"""
+        return self.bulk_update_test_cases(
+            project_id, test_case_ids, {'priority': priority}, user_id
+        )
+    
+    def bulk_update_test_cases_type(
+        self,
+        project_id: int,
+        test_case_ids: List[int],
+        type_: TestCaseType,
+        user_id: int
+    ) -> Dict[str, Any]:
+        """Bulk update test case type"""
+        return self.bulk_update_test_cases(
+            project_id, test_case_ids, {'type': type_}, user_id
+        )
+    
+    def bulk_update_test_cases_tags(
+        self,
+        project_id: int,
+        test_case_ids: List[int],
+        tags: List[str],
+        operation: TestCaseTagsOperation,
+        user_id: int
+    ) -> Dict[str, Any]:
+        """Bulk set, add or remove test case tags"""
+        return self._bulk_result(
+            project_id, test_case_ids, user_id,
+            lambda ids: self.test_case_repository.bulk_update_tags(
+                project_id, ids, tags, operation, user_id
+            )
+        )
+    
+    def _bulk_result(
+        self,
+        project_id: int,
+        test_case_ids: List[int],
+        user_id: int,
+        apply: Callable[[List[int]], List[int]]
+    ) -> Dict[str, Any]:
+        """Check access once, run a set-based update and report per-ID results"""
+        if not self.project_repository.user_has_access(user_id, project_id):
+            raise ValueError("Access denied")
+        
+        requested_ids = list(dict.fromkeys(test_case_ids))
+        updated_ids = set(apply(requested_ids))
+        missing_ids = [
+            test_case_id
+            for test_case_id in requested_ids
+            if test_case_id not in updated_ids
+        ]
+        
+        return {
+            'success': len(updated_ids),
+            'failed': len(missing_ids),
+            'updated_ids': sorted(updated_ids),
+            'errors': [
+                f"Test case {test_case_id} not found" for test_case_id in missing_ids
+            ],
+        }
+    
+    def export_test_cases(
+        self,
+        project_id: int,
+        user_id: int,
+        query_params: Optional[TestCaseSearchQuery] = None
+    ) -> Iterator[tuple]:
+        """
+        Check access, then return a lazy iterator of rows in EXPORT_FIELDS order.
+        
+        The access check runs immediately so that it can fail before a
+        streaming response has started.
+        """
+        stmt = self.export_statement(project_id, user_id, query_params)
+        with replica_reads(self.db):
+            result = self.db.execute(stmt)
+        return (tuple(row) for row in result)
+    
+    def export_statement(
+        self,
+        project_id: int,
+        user_id: int,
+        query_params: Optional[TestCaseSearchQuery] = None
+    ):
+        """Check access and build the streaming export query (EXPORT_FIELDS columns)"""
+        if not self.project_repository.user_has_access(user_id, project_id):
+            raise ValueError("Access denied")
+        
+        columns = [getattr(TestCaseDB, field) for field in EXPORT_FIELDS]
+        return self.test_case_repository.export_statement(
+            project_id, columns, query_params
+        )
+    
+    def import_test_cases(
+        self,
+        project_id: int,
+        records: Iterable[ImportRecord],
+        user_id: int,
+        batch_size: int = IMPORT_BATCH_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Validate and insert parsed import rows batch by batch.
+        
+        Each batch is validated with ``TestCaseCreate``, written with one
+        multi-row insert and committed on its own. Invalid rows are reported
+        and skipped; if the insert itself fails, the batch is retried row by
+        row so that only the offending rows are rejected.
+        """
+        if not self.project_repository.user_has_access(user_id, project_id):
+            raise ValueError("Access denied")
+        
+        imported = 0
+        errors: List[Tuple[int, str]] = []
+        batch: List[Tuple[int, TestCaseCreate]] = []
+        
+        for row_number, record, error in records:
+            if error is None:
+                try:
+                    batch.append((row_number, TestCaseCreate(**record)))
+                except ValidationError as e:
+                    error = self._format_validation_error(e)
+            if error is not None:
+                errors.append((row_number, error))
+                continue
+            
+            if len(batch) >= batch_size:
+                imported += self._import_batch(project_id, batch, user_id, errors)
+                batch = []
+        
+        if batch:
+            imported += self._import_batch(project_id, batch, user_id, errors)
+        
+        errors.sort()
+        return {
+            'imported': imported,
+            'failed': len(errors),
+            'errors': [
+                {'row': row_number, 'error': error}
+                for row_number, error in errors[:self.MAX_REPORTED_IMPORT_ERRORS]
+            ],
+            'errors_truncated': len(errors) > self.MAX_REPORTED_IMPORT_ERRORS
         }
+    
+    def _import_batch(
+        self,
+        project_id: int,
+        batch: List[Tuple[int, TestCaseCreate]],
+        user_id: int,
+        errors: List[Tuple[int, str]]
+    ) -> int:
+        """Insert and index one validated batch, appending row failures to errors"""
+        try:
+            ids = self.test_case_repository.bulk_create(
+                [data for _, data in batch], project_id, user_id
+            )
+            inserted = list(zip(ids, batch))
+        except SQLAlchemyError:
+            self.db.rollback()
+            inserted = []
+            for row_number, data in batch:
+                try:
+                    with self.db.begin_nested():
+                        ids = self.test_case_repository.bulk_create(
+                            [data], project_id, user_id
+                        )
+                    inserted.append((ids[0], (row_number, data)))
+                except SQLAlchemyError as e:
+                    message = str(getattr(e, 'orig', None) or e).strip()
+                    errors.append((row_number, f"Database error: {message}"))
+        
+        self.similarity_service.index_contents(
+            (test_case_id, project_id, data.title, data.steps, data.expected_results)
+            for test_case_id, (_, data) in inserted
+        )
+        self.db.commit()
+        return len(inserted)
+    
+    @staticmethod
+    def _format_validation_error(error: ValidationError) -> str:
+        """Flatten pydantic errors into a single message"""
+        return "; ".join(
+            f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}"
+            for item in error.errors()
+        )
+
+
+class AsyncTestCaseService(AsyncService):
+    """Async variant of TestCaseService"""
+    
+    service_class = TestCaseService
+    
+    async def create_test_case(
+        self, test_case_data: TestCaseCreate, project_id: int, user_id: int
+    ) -> TestCaseResponse:
+        """Create a new test case"""
+        return await self._write(
+            "create_test_case", test_case_data, project_id, user_id
+        )
+    
+    async def get_test_case(
+        self, test_case_id: int, user_id: int
+    ) -> Optional[TestCaseResponse]:
+        """Get test case by ID with user access check (cached)"""
+        load = partial(self._call, "get_test_case", test_case_id, user_id)
+        if not response_cache.available:
+            return await load()
+        
+        # The owning project is needed for the versioned key; learn it on the first miss
+        project_key = response_cache.project_key(test_case_id)
+        project_id = await response_cache.get(project_key)
+        if project_id is None:
+            cache_requests.inc(endpoint="detail", result="miss")
+            test_case = await load()
+            if test_case is not None:
+                await response_cache.set(project_key, test_case.project_id)
+            return test_case
+        
+        return await self._cached(
+            "detail", int(project_id), user_id, test_case_id, _TEST_CASE_ADAPTER, load
+        )
+    
+    async def get_test_case_version(
+        self, test_case_id: int, user_id: int
+    ) -> Optional[int]:
+        """Get the current version of a test case without loading it"""
+        return await self._call("get_test_case_version", test_case_id, user_id)
+    
+    async def get_project_test_cases(
+        self,
+        project_id: int,
+        user_id: int,
+        query_params: Optional[TestCaseSearchQuery] = None
+    ) -> TestCaseListResponse:
+        """Get test cases for a project with filters and pagination (cached)"""
+        fields = tuple((query_params or TestCaseSearchQuery()).fields)
+        return await self._cached(
+            "list",
+            project_id,
+            user_id,
+            self._list_params(query_params),
+            _list_adapter(fields),
+            lambda: self._call(
+                "get_project_test_cases", project_id, user_id, query_params
+            ),
+        )
+    
+    async def get_project_test_cases_etag(
+        self,
+        project_id: int,
+        user_id: int,
+        query_params: Optional[TestCaseSearchQuery] = None
+    ) -> Optional[str]:
+        """Weak ETag of a list from the project's change version; None without Redis"""
+        if not response_cache.available:
+            return None
         
-        for test_case_id in test_case_ids:
+        await self._call("check_project_access", project_id, user_id)
+        version = await response_cache.project_version(project_id)
+        if version is None:
+            return None
+        return list_etag(
+            project_id,
+            version,
+            response_cache.params_digest(self._list_params(query_params)),
+        )
+    
+    @staticmethod
+    def _list_params(query_params: Optional[TestCaseSearchQuery]) -> Dict[str, Any]:
+        """Normalized list parameters for cache keys and ETags"""
+        params = (query_params or TestCaseSearchQuery()).dict(exclude_none=True)
+        if "tags" in params:
+            params["tags"] = sorted(set(params["tags"]))
+        return params
+    
+    async def update_test_case(
+        self,
+        test_case_id: int,
+        update_data: TestCaseUpdate,
+        user_id: int,
+        expected_version: Optional[int] = None
+    ) -> Optional[TestCaseResponse]:
+        """Update a test case, optionally only if it still has ``expected_version``"""
+        return await self._write(
+            "update_test_case", test_case_id, update_data, user_id, expected_version
+        )
+    
+    async def delete_test_case(self, test_case_id: int, user_id: int) -> bool:
+        """Soft-delete a test case"""
+        return await self._write("delete_test_case", test_case_id, user_id)
+    
+    async def restore_test_case(
+        self, test_case_id: int, user_id: int
+    ) -> Optional[TestCaseResponse]:
+        """Restore an archived test case"""
+        return await self._write("restore_test_case", test_case_id, user_id)
+    
+    async def get_test_case_stats(
+        self, project_id: int, user_id: int
+    ) -> Dict[str, Any]:
+        """Get test case statistics for a project"""
+        return await self._call("get_test_case_stats", project_id, user_id)
+    
+    async def search_test_cases(
+        self,
+        project_id: int,
+        user_id: int,
+        query: str,
+        page: int = 1,
+        size: int = 10,
+        include_archived: bool = False
+    ) -> TestCaseSearchResponse:
+        """Ranked full-text search over a project's test cases"""
+        return await self._call(
+            "search_test_cases",
+            project_id,
+            user_id,
+            query,
+            page,
+            size,
+            include_archived,
+        )
+    
+    async def search_similar_test_cases(
+        self,
+        test_case_id: int,
+        user_id: int,
+        top_k: int = SimilarityService.DEFAULT_TOP_K,
+        min_similarity: float = SimilarityService.DEFAULT_MIN_SIMILARITY,
+        project_id: Optional[int] = None
+    ) -> List[SimilarTestCaseResponse]:
+        """Find test cases similar to an existing one"""
+        return await self._call(
+            "search_similar_test_cases",
+            test_case_id,
+            user_id,
+            top_k,
+            min_similarity,
+            project_id,
+        )
+    
+    async def find_duplicate_test_cases(
+        self,
+        project_id: int,
+        test_case_data: TestCaseCreate,
+        user_id: int,
+        top_k: int = SimilarityService.DEFAULT_TOP_K,
+        min_similarity: float = SimilarityService.DEFAULT_MIN_SIMILARITY
+    ) -> List[SimilarTestCaseResponse]:
+        """Find likely duplicates of a test case that has not been saved yet"""
+        return await self._call(
+            "find_duplicate_test_cases",
+            project_id,
+            test_case_data,
+            user_id,
+            top_k,
+            min_similarity,
+        )
+    
+    async def get_test_cases_by_priority(
+        self, project_id: int, user_id: int, priority: TestCasePriority
+    ) -> List[TestCaseResponse]:
+        """Get test cases by priority (cached)"""
+        return await self._cached(
+            "by_priority",
+            project_id,
+            user_id,
+            priority,
+            _TEST_CASES_ADAPTER,
+            lambda: self._call(
+                "get_test_cases_by_priority", project_id, user_id, priority
+            ),
+        )
+    
+    async def get_test_cases_by_type(
+        self, project_id: int, user_id: int, type_: TestCaseType
+    ) -> List[TestCaseResponse]:
+        """Get test cases by type (cached)"""
+        return await self._cached(
+            "by_type", project_id, user_id, type_, _TEST_CASES_ADAPTER,
+            lambda: self._call("get_test_cases_by_type", project_id, user_id, type_)
+        )
+    
+    async def get_test_cases_by_status(
+        self, project_id: int, user_id: int, status: TestCaseStatus
+    ) -> List[TestCaseResponse]:
+        """Get test cases by status (cached)"""
+        return await self._cached(
+            "by_status", project_id, user_id, status, _TEST_CASES_ADAPTER,
+            lambda: self._call("get_test_cases_by_status", project_id, user_id, status)
+        )
+    
+    async def bulk_update_test_cases_status(
+        self,
+        project_id: int,
+        test_case_ids: List[int],
+        status: TestCaseStatus,
+        user_id: int,
+    ) -> Dict[str, Any]:
+        """Bulk update test case status"""
+        return await self._write(
+            "bulk_update_test_cases_status", project_id, test_case_ids, status, user_id
+        )
+    
+    async def bulk_update_test_cases_priority(
+        self,
+        project_id: int,
+        test_case_ids: List[int],
+        priority: TestCasePriority,
+        user_id: int
+    ) -> Dict[str, Any]:
+        """Bulk update test case priority"""
+        return await self._write(
+            "bulk_update_test_cases_priority",
+            project_id,
+            test_case_ids,
+            priority,
+            user_id,
+        )
+    
+    async def bulk_update_test_cases_type(
+        self,
+        project_id: int,
+        test_case_ids: List[int],
+        type_: TestCaseType,
+        user_id: int
+    ) -> Dict[str, Any]:
+        """Bulk update test case type"""
+        return await self._write(
+            "bulk_update_test_cases_type", project_id, test_case_ids, type_, user_id
+        )
+    
+    async def bulk_update_test_cases_tags(
+        self,
+        project_id: int,
+        test_case_ids: List[int],
+        tags: List[str],
+        operation: TestCaseTagsOperation,
+        user_id: int
+    ) -> Dict[str, Any]:
+        """Bulk set, add or remove test case tags"""
+        return await self._write(
+            "bulk_update_test_cases_tags",
+            project_id,
+            test_case_ids,
+            tags,
+            operation,
+            user_id,
+        )
+    
+    async def _cached(
+        self,
+        endpoint: str,
+        project_id: int,
+        user_id: int,
+        params: Any,
+        adapter: TypeAdapter,
+        load: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Serve a response from the response cache, loading and storing it on a miss.
+        
+        Access is checked on every call, hit or miss; the key carries the
+        project's version, so any write to the project makes it unreachable.
+        Misses are loaded from the primary: a replica may not have replayed
+        the write that produced the version yet, and its older rows would
+        then be cached (and list ETags matched) under the new version.
+        """
+        if not response_cache.available:
+            return await load()
+        
+        await self._call("check_project_access", project_id, user_id)
+        version = await response_cache.project_version(project_id)
+        if version is None:
+            return await load()
+        
+        key = response_cache.response_key(project_id, version, endpoint, params)
+        cached = await response_cache.get(key)
+        if cached is not None:
+            try:
+                value = adapter.validate_json(cached)
+            except ValidationError:
+                # Written by a release with a different response schema
+                pass
+            else:
+                cache_requests.inc(endpoint=endpoint, result="hit")
+                return value
+        
+        cache_requests.inc(endpoint=endpoint, result="miss")
+        with primary_reads(self.db):
+            value = await load()
+        await response_cache.set(key, adapter.dump_json(value))
+        return value
+    
+    async def export_test_cases(
+        self,
+        project_id: int,
+        user_id: int,
+        query_params: Optional[TestCaseSearchQuery] = None
+    ) -> AsyncIterator[List[tuple]]:
+        """
+        Check access, then return an async iterator of row batches.
+        
+        Rows are streamed from a server-side cursor with ``AsyncSession.stream``.
+        """
+        stmt = await self._call("export_statement", project_id, user_id, query_params)
+        with replica_reads(self.db):
+            result = await self.db.stream(stmt)
+        return (partition async for partition in result.partitions())
+    
+    async def import_test_cases(
+        self,
+        project_id: int,
+        records: Iterable[ImportRecord],
+        user_id: int
+    ) -> Dict[str, Any]:
+        """
+        Bulk import test cases.
+        
+        Parsing and validating large bodies is CPU-bound, so imports run in a
+        worker thread on their own synchronous session instead of on the loop.
+        """
+        def run_import() -> Dict[str, Any]:
+            db = get_db_session()
             try:
-                # Check user access
-                test_case = self.test_case_repository.get_by_id_and_project(test_case_id, project_id)
-                if not test_case:
-                    results['failed'] += 1
-                    results['errors'].append(f"Test case {test_case_id} not found")
-                    continue
-                
-                if not self.project_repository.user_has_access(user_id, project_id):
-                    results['failed'] += 1
-                    results['errors'].append(f"Access denied for test case {test_case_id}")
-                    continue
-                
-                # Update status
-                from app.models.test_case import TestCaseUpdate
-                update_data = TestCaseUpdate(status=status)
-                updated_test_case = self.test_case_repository.update(test_case_id, update_data)
-                
-                if updated_test_case:
-                    results['success'] += 1
-                else:
-                    results['failed'] += 1
-                    results['errors'].append(f"Failed to update test case {test_case_id}")
-                    
-            except Exception as e:
-                results['failed'] += 1
-                results['errors'].append(f"Error updating test case {test_case_id}: {str(e)}")
-        
-        return results
\ No newline at end of file
+                return TestCaseService(db).import_test_cases(
+                    project_id, records, user_id
+                )
+            finally:
+                db.close()
+        
+        return await run_in_threadpool(run_import)
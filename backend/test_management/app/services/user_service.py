@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from app.repositories.user_repository import UserRepository
 from app.models.user import User, UserCreate, UserUpdate, UserResponse
+from core.revocation import revocation_list
 
 
 class UserService:
@@ -88,11 +89,20 @@ class UserService:
         if not db_user:
             return None
         
+        # Cached tokens of disabled users must stop working right away
+        if update_data.is_active is False:
+            revocation_list.revoke_user(user_id)
+        elif update_data.is_active is True:
+            revocation_list.restore_user(user_id)
+        
         return UserResponse.from_orm(db_user)
     
     def delete_user(self, user_id: int) -> bool:
         """Delete a user (soft delete)"""
-        return self.user_repository.delete(user_id)
+        deleted = self.user_repository.delete(user_id)
+        if deleted:
+            revocation_list.revoke_user(user_id)
+        return deleted
     
     def authenticate_user(self, email: str, password: str) -> Optional[UserResponse]:
         """Authenticate user by email and password"""
@@ -0,0 +1 @@
+"""Utility helpers for Test Management Service"""
@@ -0,0 +1,28 @@
+"""
+Opaque keyset pagination cursors
+
+A cursor encodes the ``(created_at, id)`` sort key of the last row of a page.
+The next page seeks directly past that key instead of skipping rows with
+``OFFSET``, so every page costs the same regardless of depth.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(created_at: datetime, test_case_id: int) -> str:
+    """Encode a sort key into an opaque URL-safe cursor string"""
+    payload = json.dumps([created_at.isoformat(), test_case_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor string back into its sort key"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, test_case_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(test_case_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
@@ -0,0 +1,71 @@
+"""
+Entity tags for conditional requests
+
+A test case's strong ETag is its ID and row version, so a client can
+revalidate with ``If-None-Match`` (304 without loading the row) and make
+optimistic updates with ``If-Match``. List ETags are weak: they combine the
+project's change version with the normalized query, and the same version can
+render a slightly different body (e.g. estimated totals).
+
+A compressed representation has different bytes, so the compression
+middleware appends its content coding to strong tags (``"12-3-gzip"``).
+Conditional headers compare tags without that suffix, so revalidation and
+``If-Match`` work whichever representation the client holds.
+"""
+
+import re
+from typing import List, Optional
+
+_ETAG_PATTERN = re.compile(r'\s*(W/)?"([^"]*)"\s*(?:,|$)')
+_ENCODING_SUFFIX = re.compile(r"-(?:gzip|br)$")
+
+
+def test_case_etag(test_case_id: int, version: int) -> str:
+    """Strong ETag of one test case"""
+    return f'"{test_case_id}-{version}"'
+
+
+def list_etag(project_id: int, version: int, params_digest: str) -> str:
+    """Weak ETag of a project test case list"""
+    return f'W/"{project_id}-{version}-{params_digest}"'
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """ETag of the ``encoding``-compressed representation; weak tags stay as they are"""
+    if etag.startswith('"') and etag.endswith('"'):
+        return f'"{etag[1:-1]}-{encoding}"'
+    return etag
+
+
+def _parse(header: str) -> List[tuple]:
+    """Split an If-Match/If-None-Match header into ``(weak, opaque_tag)`` pairs"""
+    return [
+        (bool(weak), _ENCODING_SUFFIX.sub("", tag))
+        for weak, tag in _ETAG_PATTERN.findall(header)
+    ]
+
+
+def none_match(header: Optional[str], etag: str) -> bool:
+    """Whether If-None-Match matches ``etag`` (weak comparison), i.e. 304"""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    _, opaque = _parse(etag)[0]
+    return any(tag == opaque for _, tag in _parse(header))
+
+
+def if_match_version(header: str, test_case_id: int) -> Optional[int]:
+    """
+    Version a test case must still have for If-Match to pass.
+    
+    Returns None for ``*`` (any current version). Raises ValueError when no
+    strong tag of this test case is listed, which can never match.
+    """
+    if header.strip() == "*":
+        return None
+    prefix = f"{test_case_id}-"
+    for weak, tag in _parse(header):
+        if not weak and tag.startswith(prefix) and tag[len(prefix):].isdigit():
+            return int(tag[len(prefix):])
+    raise ValueError("If-Match does not match the current test case")
@@ -0,0 +1,98 @@
+"""
+MinHash signatures and LSH banding for near-duplicate detection
+
+Signatures use one-permutation hashing: every shingle is hashed once and
+assigned to one of ``NUM_BINS`` bins, keeping the minimum per bin. Empty
+bins are filled from the next non-empty bin (rotation densification), so
+the signature behaves like a classic ``NUM_BINS``-permutation MinHash while
+costing O(shingles) instead of O(shingles x permutations) to compute.
+
+Signatures are split into ``NUM_BANDS`` bands; two documents whose band
+hashes collide in at least one band become candidates. With 16 bands of
+4 rows, pairs with Jaccard similarity 0.7 collide with ~99% probability
+and pairs at 0.3 with ~12%.
+"""
+
+import hashlib
+import re
+from typing import Iterable, List, Sequence, Set
+
+NUM_BINS = 64
+NUM_BANDS = 16
+ROWS_PER_BAND = NUM_BINS // NUM_BANDS
+
+_HASH_RANGE = 1 << 64
+_BIN_RANGE = _HASH_RANGE // NUM_BINS
+_EMPTY = -1
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def _hash64(value: str) -> int:
+    """Stable 64-bit hash of a string"""
+    return int.from_bytes(
+        hashlib.blake2b(value.encode(), digest_size=8).digest(), "big"
+    )
+
+
+def _signed64(value: int) -> int:
+    """Map an unsigned 64-bit integer into the signed BIGINT range"""
+    return value - _HASH_RANGE if value >= _HASH_RANGE // 2 else value
+
+
+def shingles(parts: Iterable[str]) -> Set[str]:
+    """Word unigrams and bigrams of the given text parts, lower-cased"""
+    result: Set[str] = set()
+    for part in parts:
+        words = [word.lower() for word in _WORD_PATTERN.findall(part or "")]
+        result.update(words)
+        result.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    return result
+
+
+def signature(shingle_set: Iterable[str]) -> List[int]:
+    """Compute the densified one-permutation MinHash signature"""
+    bins = [_EMPTY] * NUM_BINS
+    for shingle in shingle_set:
+        hashed = _hash64(shingle)
+        index, value = divmod(hashed, _BIN_RANGE)
+        if bins[index] == _EMPTY or value < bins[index]:
+            bins[index] = value
+    
+    if all(value == _EMPTY for value in bins):
+        return bins
+    
+    # Rotation densification: borrow from the next non-empty bin to the right
+    densified = list(bins)
+    for index in range(NUM_BINS):
+        if bins[index] != _EMPTY:
+            continue
+        distance = 1
+        while bins[(index + distance) % NUM_BINS] == _EMPTY:
+            distance += 1
+        densified[index] = bins[(index + distance) % NUM_BINS] + distance * _BIN_RANGE
+    return densified
+
+
+def band_hashes(sig: Sequence[int]) -> List[int]:
+    """Hash each band of a signature into a signed 64-bit bucket key"""
+    if all(value == _EMPTY for value in sig):
+        return []
+    return [
+        _signed64(
+            _hash64(
+                f"{band}:"
+                + ",".join(
+                    map(str, sig[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND])
+                )
+            )
+        )
+        for band in range(NUM_BANDS)
+    ]
+
+
+def similarity(sig_a: Sequence[int], sig_b: Sequence[int]) -> float:
+    """Estimate Jaccard similarity as the fraction of matching bins"""
+    if not sig_a or not sig_b:
+        return 0.0
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b and a != _EMPTY) / NUM_BINS
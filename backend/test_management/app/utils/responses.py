@@ -0,0 +1,29 @@
+"""
+orjson response class for endpoints returning large pydantic payloads
+
+Returning a model from an endpoint makes FastAPI dump it, validate the dump
+against ``response_model`` again, run ``jsonable_encoder`` over the result and
+encode it with the stdlib ``json`` module. Services already return validated
+models, so list endpoints return ``ORJSONModelResponse(result)`` instead; the
+``response_model`` is kept for the OpenAPI schema.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def _default(value: Any) -> Any:
+    """Encode what orjson does not know natively (datetimes and enums it does)"""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONModelResponse(ORJSONResponse):
+    """ORJSONResponse that also renders pydantic models, without re-validating them"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
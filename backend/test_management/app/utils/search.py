@@ -0,0 +1,26 @@
+"""
+Full-text search helpers
+"""
+
+import re
+from typing import List
+
+MAX_SEARCH_TERMS = 10
+
+_TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def search_terms(query: str) -> List[str]:
+    """Split free text into lower-cased search terms"""
+    return [term.lower() for term in _TERM_PATTERN.findall(query)][:MAX_SEARCH_TERMS]
+
+
+def build_prefix_tsquery(query: str) -> str:
+    """
+    Build a PostgreSQL ``to_tsquery`` expression that matches every term as a
+    prefix, e.g. ``"log in"`` -> ``"log:* & in:*"``.
+    
+    Only word characters survive, so the result is always a valid tsquery.
+    Returns an empty string when the input has no searchable terms.
+    """
+    return " & ".join(f"{term}:*" for term in search_terms(query))
@@ -0,0 +1,140 @@
+"""
+Line-oriented test case import/export formats (JSON lines and CSV)
+"""
+
+import csv
+import enum
+import io
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, TextIO, Tuple
+
+LIST_FIELDS = ("steps", "expected_results", "tags")
+
+# Export column order; CSV exports can be imported again as-is
+EXPORT_FIELDS = (
+    "id", "project_id", "title", "description", "status", "priority", "type",
+    "preconditions", "steps", "expected_results", "estimated_duration", "tags",
+    "created_by", "updated_by", "created_at", "updated_at",
+)
+
+# Exports are flushed in chunks of roughly this many characters
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# One parsed input row: (row_number, record, error)
+ImportRecord = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def iter_jsonl_records(stream: TextIO) -> Iterator[ImportRecord]:
+    """Parse one JSON object per line; blank lines are skipped"""
+    for row_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row_number, None, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield row_number, None, "Each line must be a JSON object"
+            continue
+        yield row_number, record, None
+
+
+def iter_csv_records(stream: TextIO) -> Iterator[ImportRecord]:
+    """
+    Parse CSV with a header row named after TestCaseCreate fields.
+    
+    List columns hold either a JSON array or ``|``-separated values. Empty
+    cells are treated as missing so model defaults apply.
+    """
+    reader = csv.DictReader(stream)
+    for row_number, row in enumerate(reader, start=1):
+        try:
+            yield row_number, _csv_row_to_record(row), None
+        except ValueError as e:
+            yield row_number, None, str(e)
+
+
+def _csv_row_to_record(row: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    """Convert a CSV row of strings into a TestCaseCreate-shaped dict"""
+    record: Dict[str, Any] = {}
+    for field, value in row.items():
+        if field is None or value is None or value == "":
+            continue
+        if field in LIST_FIELDS:
+            if value.lstrip().startswith("["):
+                try:
+                    record[field] = json.loads(value)
+                except json.JSONDecodeError:
+                    raise ValueError(f"Invalid JSON array in column '{field}'")
+            else:
+                record[field] = [
+                    item.strip() for item in value.split("|") if item.strip()
+                ]
+        else:
+            record[field] = value
+    return record
+
+
+def iter_ndjson_chunks(rows: Iterable[Sequence[Any]]) -> Iterator[str]:
+    """Serialize rows (in EXPORT_FIELDS order) as JSON lines"""
+    lines = (
+        json.dumps(
+            dict(zip(EXPORT_FIELDS, map(_export_value, row))), ensure_ascii=False
+        )
+        + "\n"
+        for row in rows
+    )
+    return _chunked(lines)
+
+
+def iter_csv_chunks(
+    rows: Iterable[Sequence[Any]], header: bool = True
+) -> Iterator[str]:
+    """Serialize rows (in EXPORT_FIELDS order) as CSV, by default with a header row"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        writer.writerow(
+            [
+                (
+                    json.dumps(value, ensure_ascii=False)
+                    if field in LIST_FIELDS
+                    else _export_value(value)
+                )
+                for field, value in zip(EXPORT_FIELDS, row)
+            ]
+        )
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _chunked(lines: Iterable[str]) -> Iterator[str]:
+    """Join small lines into chunks of about EXPORT_CHUNK_SIZE characters"""
+    chunk: list = []
+    size = 0
+    for line in lines:
+        chunk.append(line)
+        size += len(line)
+        if size >= EXPORT_CHUNK_SIZE:
+            yield "".join(chunk)
+            chunk, size = [], 0
+    if chunk:
+        yield "".join(chunk)
+
+
+def _export_value(value: Any) -> Any:
+    """Convert enums and datetimes to their JSON/CSV representation"""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
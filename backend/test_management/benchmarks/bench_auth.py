@@ -0,0 +1,88 @@
+"""
+Benchmark: authentication overhead per request
+
+Compares the previous dependency (decode the JWT, then query the user on every
+request) against ``JWTBearer.authenticate`` with a warm token cache.
+"""
+
+import argparse
+from datetime import datetime
+from functools import partial
+
+from sqlalchemy import delete, insert
+
+from app.middleware.auth import JWTBearer, token_cache
+from app.models.user import UserDB
+from app.services.user_service import UserService
+from benchmarks.common import QueryCounter, get_engine, get_session, measure, report
+
+USER_ID = 900011
+
+
+def legacy_authenticate(bearer: JWTBearer, session_factory, token: str):
+    """The pre-cache path: verify the signature and load the user each time"""
+    payload = bearer.verify_token(token)
+    session = session_factory()
+    try:
+        return payload, UserService(session).get_user_by_id(payload["user_id"])
+    finally:
+        session.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+    
+    engine = get_engine()
+    session = get_session(engine)
+    now = datetime.utcnow()
+    session.execute(
+        insert(UserDB.__table__).values(
+            id=USER_ID,
+            username="bench_auth",
+            email="bench_auth@example.com",
+            password_hash="x",
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    session.commit()
+    
+    bearer = JWTBearer()
+    token = bearer.create_access_token({
+        "user_id": USER_ID, "username": "bench_auth", "email": "bench_auth@example.com"
+    })
+    session_factory = partial(get_session, engine)
+    
+    try:
+        scenarios = {
+            "decode + user query": lambda: legacy_authenticate(
+                bearer, session_factory, token
+            ),
+            "cached authenticate": lambda: bearer.authenticate(token, db=session),
+        }
+        
+        results = {}
+        for name, fn in scenarios.items():
+            token_cache.clear()
+            fn()
+            with QueryCounter(engine) as counter:
+                fn()
+            stats = measure(fn, repeat=args.repeat)
+            results[name] = {"queries": counter.count, **{
+                key.replace("_ms", "_us"): value * 1000 for key, value in stats.items()
+            }}
+        
+        report("Authentication overhead per request", results)
+    finally:
+        session.execute(
+            delete(UserDB.__table__).where(UserDB.__table__.c.id == USER_ID)
+        )
+        session.commit()
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
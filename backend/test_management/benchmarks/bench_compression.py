@@ -0,0 +1,97 @@
+"""
+Benchmark: response compression by payload size
+
+CPU-only (no database). For realistic response bodies of increasing size
+(one full test case, summary and full list pages, an NDJSON export) reports
+bytes on the wire and compression time per encoding and level. The export
+is also compressed the way the middleware streams it: one sync flush per
+chunk of rows.
+
+Run from the service root::
+    
+    python -m benchmarks.bench_compression
+"""
+
+import argparse
+from typing import Callable, Dict, List
+
+import orjson
+
+from app.middleware.compression import _Compressor, brotli
+from app.models.test_case import TEST_CASE_RESPONSE_FIELDS, TEST_CASE_SUMMARY_FIELDS
+from benchmarks.bench_serialization import make_rows
+from benchmarks.common import measure, report
+
+EXPORT_CHUNK_ROWS = 100
+
+
+def _items(rows, fields) -> List[dict]:
+    items = [dict(zip(TEST_CASE_RESPONSE_FIELDS, row)) for row in rows]
+    return [{name: item[name] for name in fields} for item in items]
+
+
+def payloads(export_rows: int) -> Dict[str, List[bytes]]:
+    """Response bodies by size bucket; each body is a list of chunks"""
+    rows = make_rows(max(100, export_rows))
+    dump = orjson.dumps
+    return {
+        "detail (1 full case)": [dump(_items(rows[:1], TEST_CASE_RESPONSE_FIELDS)[0])],
+        "list 10 summary": [
+            dump({"test_cases": _items(rows[:10], TEST_CASE_SUMMARY_FIELDS)})
+        ],
+        "list 100 summary": [
+            dump({"test_cases": _items(rows[:100], TEST_CASE_SUMMARY_FIELDS)})
+        ],
+        "list 100 full": [
+            dump({"test_cases": _items(rows[:100], TEST_CASE_RESPONSE_FIELDS)})
+        ],
+        f"export {export_rows} ndjson": [
+            b"".join(
+                dump(item) + b"\n"
+                for item in _items(
+                    rows[start : start + EXPORT_CHUNK_ROWS], TEST_CASE_RESPONSE_FIELDS
+                )
+            )
+            for start in range(0, export_rows, EXPORT_CHUNK_ROWS)
+        ],
+    }
+
+
+def compress(encoding: str, level: int, chunks: List[bytes]) -> bytes:
+    """Compress like the middleware: one shot for one chunk, else flushed per chunk"""
+    compressor = _Compressor(encoding, gzip_level=level, brotli_quality=level)
+    streaming = len(chunks) > 1
+    return (
+        b"".join(compressor.compress(chunk, flush=streaming) for chunk in chunks)
+        + compressor.finish()
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--export-rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    
+    codecs = [("gzip", 1), ("gzip", 5), ("gzip", 9)]
+    if brotli is not None:
+        codecs += [("br", 4), ("br", 6)]
+    
+    for bucket, chunks in payloads(args.export_rows).items():
+        identity = sum(len(chunk) for chunk in chunks)
+        results: Dict[str, Dict[str, float]] = {"identity": {"bytes": identity}}
+        for encoding, level in codecs:
+            fn: Callable[[], bytes] = lambda: compress(encoding, level, chunks)
+            size = len(fn())
+            results[f"{encoding}-{level}"] = {
+                "bytes": size,
+                "ratio": identity / size,
+                **measure(fn, repeat=args.repeat),
+            }
+        report(
+            f"{bucket} ({len(chunks)} chunk{'s' if len(chunks) > 1 else ''})", results
+        )
+
+
+if __name__ == "__main__":
+    main()
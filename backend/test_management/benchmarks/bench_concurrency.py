@@ -0,0 +1,145 @@
+"""
+Benchmark: fast request latency next to slow requests
+
+Runs many fast "requests" (test case stats for a small project) concurrently
+with a few slow ones (``pg_sleep``) on one event loop, once with the
+synchronous Session called from coroutines (the previous endpoint behaviour)
+and once with AsyncSession, and reports fast-request latency percentiles.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database import to_async_url
+from app.repositories.test_case_repository import TestCaseRepository
+from benchmarks.common import (
+    BENCHMARK_DATABASE_URL,
+    get_engine,
+    get_session,
+    report,
+    seeded_project,
+)
+
+PROJECT_ID = 900012
+
+
+def summarize(samples: List[float]) -> dict:
+    """Latency percentiles in milliseconds"""
+    samples = sorted(samples)
+    return {
+        "requests": len(samples),
+        "mean_ms": statistics.mean(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+    }
+
+
+async def run_mix(
+    slow, fast, fast_requests: int, slow_requests: int, concurrency: int
+) -> List[float]:
+    """Start the slow requests, then issue fast ones with bounded concurrency"""
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def timed_fast():
+        async with semaphore:
+            start = time.perf_counter()
+            await fast()
+            latencies.append((time.perf_counter() - start) * 1000)
+    
+    slow_tasks = [asyncio.create_task(slow()) for _ in range(slow_requests)]
+    await asyncio.sleep(0)
+    await asyncio.gather(*(timed_fast() for _ in range(fast_requests)))
+    await asyncio.gather(*slow_tasks)
+    return latencies
+
+
+def blocking_handlers(engine, slow_seconds: float):
+    """Coroutines that call the synchronous Session, as the old endpoints did"""
+    async def slow():
+        session = get_session(engine)
+        try:
+            session.execute(
+                text("SELECT pg_sleep(:seconds)"), {"seconds": slow_seconds}
+            )
+        finally:
+            session.close()
+    
+    async def fast():
+        session = get_session(engine)
+        try:
+            TestCaseRepository(session).get_stats(PROJECT_ID)
+        finally:
+            session.close()
+    
+    return slow, fast
+
+
+def async_handlers(session_factory, slow_seconds: float):
+    """Coroutines that await an AsyncSession"""
+    async def slow():
+        async with session_factory() as session:
+            await session.execute(
+                text("SELECT pg_sleep(:seconds)"), {"seconds": slow_seconds}
+            )
+    
+    async def fast():
+        async with session_factory() as session:
+            await session.run_sync(
+                lambda sync_session: TestCaseRepository(sync_session).get_stats(
+                    PROJECT_ID
+                )
+            )
+    
+    return slow, fast
+
+
+async def main_async(args) -> None:
+    engine = get_engine()
+    async_engine = create_async_engine(
+        to_async_url(BENCHMARK_DATABASE_URL),
+        pool_size=args.concurrency + args.slow,
+        max_overflow=0,
+    )
+    session_factory = async_sessionmaker(async_engine, expire_on_commit=False)
+    
+    with seeded_project(engine, PROJECT_ID, args.cases):
+        results = {}
+        for name, (slow, fast) in {
+            "sync Session in async def": blocking_handlers(engine, args.slow_seconds),
+            "AsyncSession (asyncpg)": async_handlers(
+                session_factory, args.slow_seconds
+            ),
+        }.items():
+            latencies = await run_mix(
+                slow, fast, args.fast, args.slow, args.concurrency
+            )
+            results[name] = summarize(latencies)
+        
+        report(
+            f"Fast request latency with {args.slow} concurrent "
+            f"{args.slow_seconds}s queries",
+            results,
+        )
+    
+    await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cases", type=int, default=1_000)
+    parser.add_argument("--fast", type=int, default=500)
+    parser.add_argument("--slow", type=int, default=5)
+    parser.add_argument("--slow-seconds", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, default=20)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
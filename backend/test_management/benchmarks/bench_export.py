@@ -0,0 +1,71 @@
+"""
+Benchmark: exporting a whole project
+
+Compares walking the paginated list (offset pages of 100 with a total count,
+as API clients had to) against the streaming export iterator, reporting wall
+time and peak Python memory.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from app.models.test_case import TestCaseDB, TestCaseSearchQuery
+from app.repositories.test_case_repository import TestCaseRepository
+from app.utils.test_case_io import EXPORT_FIELDS, iter_ndjson_chunks
+from benchmarks.common import get_engine, report, seeded_project
+
+PROJECT_ID = 900009
+PAGE_SIZE = 100
+
+
+def paginated_export(session) -> int:
+    """Fetch every page through get_by_project, like a list-endpoint client"""
+    repository = TestCaseRepository(session)
+    exported = 0
+    skip = 0
+    while True:
+        test_cases, _, _ = repository.get_by_project(
+            PROJECT_ID, skip=skip, limit=PAGE_SIZE, query_params=TestCaseSearchQuery()
+        )
+        if not test_cases:
+            return exported
+        exported += len(test_cases)
+        skip += PAGE_SIZE
+
+
+def streaming_export(session) -> int:
+    """Serialize the streaming export to NDJSON and count the bytes"""
+    columns = [getattr(TestCaseDB, field) for field in EXPORT_FIELDS]
+    rows = TestCaseRepository(session).iter_by_project(PROJECT_ID, columns)
+    return sum(len(chunk) for chunk in iter_ndjson_chunks(rows))
+
+
+def run(fn, session) -> dict:
+    """Time fn and record its peak traced memory"""
+    session.expunge_all()
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(session)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": elapsed, "peak_mib": peak / (1024 * 1024)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cases", type=int, default=100_000)
+    args = parser.parse_args()
+    
+    engine = get_engine()
+    with seeded_project(engine, PROJECT_ID, args.cases) as session:
+        results = {
+            f"paginated (size={PAGE_SIZE})": run(paginated_export, session),
+            "streaming export": run(streaming_export, session),
+        }
+        report(f"Export of {args.cases} test cases", results)
+
+
+if __name__ == "__main__":
+    main()
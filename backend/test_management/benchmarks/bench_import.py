@@ -0,0 +1,124 @@
+"""
+Benchmark: bulk test case import throughput
+
+Compares creating test cases one ``TestCaseRepository.create`` call (and
+transaction) at a time against ``TestCaseService.import_test_cases`` fed from
+a JSON-lines document, reporting rows per second.
+"""
+
+import argparse
+import io
+import json
+import time
+from datetime import datetime
+
+from sqlalchemy import delete, insert
+
+from app.models.project import ProjectDB
+from app.models.similarity import TestCaseLSHBucketDB, TestCaseSignatureDB
+from app.models.test_case import TestCaseCreate, TestCaseDB
+from app.repositories.test_case_repository import TestCaseRepository
+from app.services.test_case_service import TestCaseService
+from app.utils.test_case_io import iter_jsonl_records
+from benchmarks.common import get_engine, get_session, report
+
+PROJECT_ID = 900008
+USER_ID = 900008
+
+
+def make_records(count: int) -> list:
+    """Build synthetic import rows"""
+    return [
+        {
+            "title": f"Imported case {i}",
+            "description": f"Legacy suite case {i}",
+            "priority": ["low", "medium", "high", "critical"][i % 4],
+            "steps": [f"Step {n} of case {i}" for n in range(5)],
+            "expected_results": [f"Result {n} of case {i}" for n in range(5)],
+            "tags": [f"suite{i % 10}", "legacy"],
+        }
+        for i in range(count)
+    ]
+
+
+def cleanup(session) -> None:
+    """Remove everything the benchmark inserted"""
+    session.rollback()
+    for model in (TestCaseLSHBucketDB, TestCaseSignatureDB, TestCaseDB):
+        session.execute(delete(model).where(model.project_id == PROJECT_ID))
+    session.commit()
+
+
+def run_row_by_row(session, records: list) -> float:
+    """The pre-import approach: one create (and commit) per row"""
+    repository = TestCaseRepository(session)
+    start = time.perf_counter()
+    for record in records:
+        repository.create(TestCaseCreate(**record), PROJECT_ID, USER_ID)
+    return time.perf_counter() - start
+
+
+def run_import(session, records: list, batch_size: int) -> float:
+    """Stream a JSON-lines document through the bulk import service"""
+    body = io.StringIO("\n".join(json.dumps(record) for record in records))
+    service = TestCaseService(session)
+    start = time.perf_counter()
+    result = service.import_test_cases(
+        PROJECT_ID, iter_jsonl_records(body), USER_ID, batch_size=batch_size
+    )
+    elapsed = time.perf_counter() - start
+    assert result["imported"] == len(records), result
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--legacy-rows", type=int, default=2_000,
+                        help="Rows for the row-by-row baseline (it is slow)")
+    parser.add_argument(
+        "--batch-size", type=int, default=TestCaseService.IMPORT_BATCH_SIZE
+    )
+    args = parser.parse_args()
+    
+    engine = get_engine()
+    session = get_session(engine)
+    now = datetime.utcnow()
+    session.execute(
+        insert(ProjectDB.__table__).values(
+            id=PROJECT_ID,
+            name="Import benchmark",
+            created_by=USER_ID,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    session.commit()
+    
+    try:
+        results = {}
+        
+        elapsed = run_row_by_row(session, make_records(args.legacy_rows))
+        results["row-by-row create"] = {"rows": args.legacy_rows, "seconds": elapsed,
+                                        "rows_per_sec": args.legacy_rows / elapsed}
+        cleanup(session)
+        
+        elapsed = run_import(session, make_records(args.rows), args.batch_size)
+        results[f"import (batch={args.batch_size})"] = {
+            "rows": args.rows,
+            "seconds": elapsed,
+            "rows_per_sec": args.rows / elapsed,
+        }
+        
+        report("Test case import throughput", results)
+    finally:
+        cleanup(session)
+        session.execute(
+            delete(ProjectDB.__table__).where(ProjectDB.__table__.c.id == PROJECT_ID)
+        )
+        session.commit()
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark: connection checkout cost per pre-ping strategy
+
+Measures checkout + ``SELECT 1`` latency with pre-ping on every checkout,
+pre-ping only after idle periods, and no pre-ping, then prints the pool
+metrics collected while running.
+"""
+
+import argparse
+
+from sqlalchemy import create_engine, text
+
+from app import db_pool
+from app.db_pool import InstrumentedQueuePool, instrument_engine
+from benchmarks.common import BENCHMARK_DATABASE_URL, measure, report
+from core.config import settings
+from core.metrics import registry
+
+
+def checkout_and_query(engine) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+    
+    results = {}
+    for strategy in (
+        db_pool.PRE_PING_ALWAYS,
+        db_pool.PRE_PING_IDLE,
+        db_pool.PRE_PING_NEVER,
+    ):
+        settings.DB_POOL_PRE_PING = strategy
+        engine = create_engine(
+            BENCHMARK_DATABASE_URL,
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_pre_ping=strategy == db_pool.PRE_PING_ALWAYS,
+        )
+        instrument_engine(engine, f"bench_{strategy}")
+        results[f"pre-ping {strategy}"] = measure(
+            lambda: checkout_and_query(engine), repeat=args.repeat
+        )
+        engine.dispose()
+    
+    report("Checkout + SELECT 1 latency", results)
+    print()
+    print(registry.render())
+
+
+if __name__ == "__main__":
+    main()
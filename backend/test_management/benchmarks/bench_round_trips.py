@@ -0,0 +1,147 @@
+"""
+Benchmark: database round trips per write endpoint
+
+Runs the service call behind each write endpoint and counts the statements
+and COMMITs it sends, committing at the end like the async service facade
+does (a no-op for services that already committed their own transactions).
+"""
+
+import argparse
+from datetime import datetime
+from typing import Callable, Dict
+
+from sqlalchemy import event, insert
+
+from app.models.project import ProjectCreate, ProjectDB, ProjectUpdate
+from app.models.test_case import (
+    TestCaseCreate,
+    TestCaseDB,
+    TestCaseStatus,
+    TestCaseUpdate,
+)
+from app.models.user import UserDB
+from app.services.project_service import ProjectService
+from app.services.test_case_service import TestCaseService
+from benchmarks.common import QueryCounter, get_engine, get_session, report
+
+USER_ID = 900021
+PROJECT_ID = 900021
+
+
+def seed(session) -> None:
+    """A user and a project owned by them"""
+    now = datetime.utcnow()
+    session.execute(
+        insert(UserDB),
+        [
+            {
+                "id": USER_ID,
+                "username": "bench_round_trips",
+                "email": "bench_round_trips@example.com",
+                "password_hash": "x",
+                "is_active": True,
+                "created_at": now,
+                "updated_at": now,
+            }
+        ],
+    )
+    session.execute(
+        insert(ProjectDB),
+        [
+            {
+                "id": PROJECT_ID,
+                "name": "bench_round_trips",
+                "created_by": USER_ID,
+                "created_at": now,
+                "updated_at": now,
+            }
+        ],
+    )
+    session.commit()
+
+
+def cleanup(session) -> None:
+    session.rollback()
+    session.query(TestCaseDB).filter(TestCaseDB.project_id == PROJECT_ID).delete(
+        synchronize_session=False
+    )
+    session.query(ProjectDB).filter(ProjectDB.created_by == USER_ID).delete(
+        synchronize_session=False
+    )
+    session.query(UserDB).filter(UserDB.id == USER_ID).delete(synchronize_session=False)
+    session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.parse_args()
+    
+    engine = get_engine()
+    commits = []
+    event.listen(engine, "commit", lambda conn: commits.append(1))
+    
+    session = get_session(engine)
+    try:
+        seed(session)
+        test_cases = TestCaseService(session)
+        projects = ProjectService(session)
+        state: Dict[str, int] = {}
+        
+        def create_test_case():
+            data = TestCaseCreate(
+                title="Round trips",
+                steps=["open", "submit"],
+                expected_results=["saved"],
+            )
+            state["test_case_id"] = test_cases.create_test_case(
+                data, PROJECT_ID, USER_ID
+            ).id
+        
+        def create_project():
+            state["project_id"] = projects.create_project(
+                ProjectCreate(name="Round trips"), USER_ID
+            ).id
+        
+        scenarios: Dict[str, Callable[[], object]] = {
+            "POST /projects": create_project,
+            "PUT /projects/{id}": lambda: projects.update_project(
+                state["project_id"], ProjectUpdate(description="updated"), USER_ID
+            ),
+            "POST /projects/{id}/testcases": create_test_case,
+            "PUT /testcases/{id}": lambda: test_cases.update_test_case(
+                state["test_case_id"],
+                TestCaseUpdate(title="Round trips updated"),
+                USER_ID,
+            ),
+            "PUT .../testcases/bulk/status": (
+                lambda: test_cases.bulk_update_test_cases_status(
+                    PROJECT_ID, [state["test_case_id"]], TestCaseStatus.ACTIVE, USER_ID
+                )
+            ),
+            "DELETE /testcases/{id}": lambda: test_cases.delete_test_case(
+                state["test_case_id"], USER_ID
+            ),
+            "DELETE /projects/{id}": lambda: projects.delete_project(
+                state["project_id"], USER_ID
+            ),
+        }
+        
+        results = {}
+        for name, fn in scenarios.items():
+            # Start every request with a clean identity map, as a new session would
+            session.expunge_all()
+            del commits[:]
+            with QueryCounter(engine) as counter:
+                fn()
+                session.commit()
+            results[name] = {"statements": counter.count, "commits": len(commits),
+                             "round_trips": counter.count + len(commits)}
+        
+        report("Round trips per write endpoint", results)
+    finally:
+        cleanup(session)
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark: serialization of a test case list page
+
+CPU-only (no database). Compares, for one page of realistic test cases with
+50 steps and 50 expected results each:
+
+- legacy: ``TestCaseResponse.from_orm`` per ORM object, then FastAPI's
+  ``response_model`` handling (dump, re-validate, ``jsonable_encoder``) and
+  the stdlib JSON encoder
+- batch: one ``TypeAdapter`` validation of the page built from row tuples,
+  rendered by ``ORJSONModelResponse``
+
+Run from the service root::
+    
+    python -m benchmarks.bench_serialization --rows 100
+"""
+
+import argparse
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.models.test_case import (
+    TEST_CASE_RESPONSE_FIELDS,
+    TestCaseListResponse,
+    TestCasePriority,
+    TestCaseResponse,
+    TestCaseStatus,
+    TestCaseType,
+)
+from app.services.test_case_service import _test_case_responses
+from app.utils.responses import ORJSONModelResponse
+from benchmarks.common import measure, report
+
+
+def make_rows(count: int, steps: int = 50):
+    """Row tuples of TEST_CASE_RESPONSE_COLUMNS for realistic test cases"""
+    now = datetime.utcnow()
+    rows = []
+    for i in range(count):
+        values = {
+            "id": i + 1,
+            "project_id": 1,
+            "created_by": 1,
+            "updated_by": 2,
+            "title": f"Checkout with saved card and coupon #{i}",
+            "description": (
+                "Verify that a returning customer can pay with a saved card. " * 4
+            ),
+            "status": TestCaseStatus.ACTIVE,
+            "priority": TestCasePriority.HIGH,
+            "type": TestCaseType.FUNCTIONAL,
+            "preconditions": "Customer has a saved card and an active coupon",
+            "steps": [
+                f"Step {n}: open the page, fill the form and submit it"
+                for n in range(steps)
+            ],
+            "expected_results": [
+                f"Result {n}: the page shows the confirmation" for n in range(steps)
+            ],
+            "estimated_duration": 15,
+            "tags": ["checkout", "payments", "regression"],
+            "created_at": now,
+            "updated_at": now,
+            "version": 3,
+        }
+        rows.append(tuple(values[name] for name in TEST_CASE_RESPONSE_FIELDS))
+    return rows
+
+
+def page(test_cases) -> TestCaseListResponse:
+    """Wrap a page of responses like the list endpoint"""
+    return TestCaseListResponse(
+        test_cases=test_cases, total=len(test_cases), page=1, size=len(test_cases),
+        has_next=False, has_prev=False
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    
+    rows = make_rows(args.rows)
+    # Attribute access like loaded TestCaseDB objects, without configured mappers
+    test_case_objects = [
+        SimpleNamespace(**dict(zip(TEST_CASE_RESPONSE_FIELDS, row))) for row in rows
+    ]
+    response_field = create_response_field(
+        "Response_list_testcases", TestCaseListResponse
+    )
+    loop = asyncio.new_event_loop()
+    
+    def legacy() -> bytes:
+        result = page(
+            [TestCaseResponse.from_orm(test_case) for test_case in test_case_objects]
+        )
+        content = loop.run_until_complete(
+            serialize_response(
+                field=response_field, response_content=result, is_coroutine=True
+            )
+        )
+        return JSONResponse(content).body
+    
+    def batch() -> bytes:
+        return ORJSONModelResponse(page(_test_case_responses(rows))).body
+    
+    assert json.loads(legacy()) == json.loads(batch())
+    results = {
+        "legacy from_orm + jsonable_encoder": measure(legacy, repeat=args.repeat),
+        "batch TypeAdapter + orjson": measure(batch, repeat=args.repeat),
+    }
+    report(f"Serializing a page of {args.rows} test cases", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark: project and test case statistics
+
+Compares the legacy per-enum ``count()`` approach (plus loading every row to
+tally creators) against the single aggregate query in
+``TestCaseRepository.get_stats`` / ``ProjectRepository.get_status_counts``,
+and the aggregate against the maintained counters read by
+``TestCaseStatsRepository.get``.
+"""
+
+import argparse
+from collections import defaultdict
+
+from app.models.project import ProjectDB
+from app.models.test_case import (
+    TestCaseDB,
+    TestCasePriority,
+    TestCaseStatus,
+    TestCaseType,
+)
+from app.repositories.project_repository import ProjectRepository
+from app.repositories.stat_counter_repository import TestCaseStatsRepository
+from app.repositories.test_case_repository import TestCaseRepository
+from benchmarks.common import QueryCounter, get_engine, measure, report, seeded_project
+
+PROJECT_ID = 900001
+
+
+def legacy_test_case_stats(session, project_id: int) -> dict:
+    """The pre-aggregation implementation: one count() per enum value"""
+    query = session.query(TestCaseDB).filter(TestCaseDB.project_id == project_id)
+    stats = {
+        "status": {
+            s.value: query.filter(TestCaseDB.status == s).count()
+            for s in TestCaseStatus
+        },
+        "priority": {
+            p.value: query.filter(TestCaseDB.priority == p).count()
+            for p in TestCasePriority
+        },
+        "type": {
+            t.value: query.filter(TestCaseDB.type == t).count() for t in TestCaseType
+        },
+        "total": query.count(),
+    }
+    creators = defaultdict(int)
+    for test_case in query.all():
+        creators[test_case.created_by] += 1
+    stats["created_by"] = dict(creators)
+    return stats
+
+
+def legacy_project_stats(session, user_id: int) -> dict:
+    """The pre-aggregation implementation: one count() per status"""
+    query = session.query(ProjectDB).filter(ProjectDB.created_by == user_id)
+    return {
+        "total": query.count(),
+        "active": query.filter(ProjectDB.status == "active").count(),
+        "inactive": query.filter(ProjectDB.status == "inactive").count(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cases", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    
+    engine = get_engine()
+    with seeded_project(engine, PROJECT_ID, args.cases) as session:
+        test_case_repository = TestCaseRepository(session)
+        test_case_stats_repository = TestCaseStatsRepository(session)
+        project_repository = ProjectRepository(session)
+        
+        # Seeding bypasses the ORM, so build the counters once
+        test_case_stats_repository.rebuild(PROJECT_ID)
+        session.commit()
+        
+        scenarios = {
+            "test_case_stats legacy": lambda: legacy_test_case_stats(
+                session, PROJECT_ID
+            ),
+            "test_case_stats aggregate": lambda: test_case_repository.get_stats(
+                PROJECT_ID
+            ),
+            "test_case_stats counters": lambda: test_case_stats_repository.get(
+                PROJECT_ID
+            ),
+            "project_stats legacy": lambda: legacy_project_stats(session, 1),
+            "project_stats aggregate": lambda: project_repository.get_status_counts(
+                created_by=1
+            ),
+        }
+        
+        results = {}
+        for name, fn in scenarios.items():
+            with QueryCounter(engine) as counter:
+                fn()
+            results[name] = {
+                "queries": counter.count,
+                **measure(fn, repeat=args.repeat),
+            }
+        
+        report(f"Statistics at {args.cases} test cases", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: tag filtering
+
+Compares the legacy JSON-in-TEXT tag filter (one leading-wildcard LIKE per
+tag) against native ``TEXT[]`` containment served by the GIN index on
+``test_cases.tags``. The legacy layout is recreated in a scratch table
+holding the same data.
+"""
+
+import argparse
+
+from sqlalchemy import text
+
+from app.models.test_case import TestCaseSearchQuery
+from app.repositories.test_case_repository import TestCaseRepository
+from benchmarks.common import get_engine, measure, report, seeded_project
+
+PROJECT_ID = 900004
+
+LEGACY_TABLE = "bench_test_cases_legacy_tags"
+
+
+def create_legacy_table(session) -> None:
+    """Copy the seeded rows into a table that stores tags as JSON text"""
+    session.execute(text(f"DROP TABLE IF EXISTS {LEGACY_TABLE}"))
+    session.execute(text(
+        f"CREATE TABLE {LEGACY_TABLE} AS "
+        "SELECT id, project_id, created_at, to_json(tags)::text AS tags "
+        "FROM test_cases WHERE project_id = :project_id"
+    ), {"project_id": PROJECT_ID})
+    session.execute(text(f"CREATE INDEX ON {LEGACY_TABLE} (project_id)"))
+    session.execute(text(f"ANALYZE {LEGACY_TABLE}"))
+    session.execute(text("ANALYZE test_cases"))
+    session.commit()
+
+
+def legacy_filter(session, tags) -> int:
+    """Legacy filter: tags LIKE '%"tag"%' for every requested tag"""
+    conditions = " AND ".join(f"tags LIKE :tag{i}" for i in range(len(tags)))
+    params = {f"tag{i}": f'%"{tag}"%' for i, tag in enumerate(tags)}
+    rows = session.execute(
+        text(
+            f"SELECT id FROM {LEGACY_TABLE} "
+            f"WHERE project_id = :project_id AND {conditions} "
+            "ORDER BY created_at DESC LIMIT 20"
+        ),
+        {"project_id": PROJECT_ID, **params},
+    ).all()
+    return len(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cases", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    
+    engine = get_engine()
+    with seeded_project(engine, PROJECT_ID, args.cases, tags_pool=500) as session:
+        create_legacy_table(session)
+        repository = TestCaseRepository(session)
+        
+        results = {}
+        try:
+            for tags in (["tag7"], ["tag7", "tag42"]):
+                query = TestCaseSearchQuery(tags=tags)
+                label = "+".join(tags)
+                results[f"legacy LIKE {label}"] = measure(
+                    lambda: legacy_filter(session, tags), repeat=args.repeat
+                )
+                results[f"native @> {label}"] = measure(
+                    lambda: repository.get_by_project(PROJECT_ID, 0, 20, query),
+                    repeat=args.repeat,
+                )
+        finally:
+            session.execute(text(f"DROP TABLE IF EXISTS {LEGACY_TABLE}"))
+            session.commit()
+        
+        report(f"Tag filtering at {args.cases} test cases", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Cross-process cache invalidation over a Redis stream
+
+Process-local caches drop their own entries at once, but other service
+instances only learn about a change through a shared channel. Invalidated
+keys are appended to a Redis stream; a daemon thread in every process
+publishes that process's invalidations and applies everyone else's, so a
+change made anywhere reaches every cache within about one sync interval.
+Nothing on the request path waits for Redis: publishing only queues the keys.
+While Redis is unreachable the caches' own TTL bounds staleness, and the
+thread resumes from its last stream position once Redis is back.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, List, Optional, Set
+
+import redis
+
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class InvalidationBus:
+    """Publishes and applies invalidated cache keys through one Redis stream"""
+    
+    READ_BATCH = 1000
+    ERROR_BACKOFF_SECONDS = 5
+    
+    def __init__(
+        self,
+        redis_url: Optional[str],
+        stream_key: str,
+        on_invalidate: Callable[[List[str]], None],
+        sync_interval_seconds: float = 1,
+        max_length: int = 10000,
+        client: Optional["redis.Redis"] = None
+    ):
+        self.stream_key = stream_key
+        self.on_invalidate = on_invalidate
+        self.sync_interval_seconds = sync_interval_seconds
+        self.max_length = max_length
+        self._client = client
+        if self._client is None and redis_url:
+            self._client = redis.Redis.from_url(
+                redis_url, socket_timeout=0.2, socket_connect_timeout=0.2
+            )
+        
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._last_id: Optional[bytes] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def publish(self, keys: Iterable[Any]) -> None:
+        """Queue keys for the other processes; never waits for Redis"""
+        if self._client is None:
+            return
+        self.start()
+        for key in keys:
+            self._queue.put(str(key))
+    
+    def start(self) -> None:
+        """Start the sync thread of this process (once)"""
+        if self._client is None or self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._sync_forever,
+                    name=f"{self.stream_key}-sync",
+                    daemon=True,
+                )
+                self._thread.start()
+    
+    def sync(self, wait: float = 0) -> bool:
+        """
+        Publish queued keys and apply the keys published by other processes.
+        
+        Waits up to ``wait`` seconds for the first queued key. Returns False
+        when Redis failed; keys queued for this round are then dropped.
+        """
+        keys = self._drain(wait)
+        try:
+            if self._last_id is None:
+                # Start at the end of the stream; older entries predate our cache
+                latest = self._client.xrevrange(self.stream_key, count=1)
+                self._last_id = latest[0][0] if latest else b"0-0"
+            
+            own_ids: Set[bytes] = set()
+            if keys:
+                with self._client.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.xadd(self.stream_key, {"key": key}, maxlen=self.max_length)
+                    own_ids.update(pipe.execute())
+            
+            while True:
+                response = self._client.xread(
+                    {self.stream_key: self._last_id}, count=self.READ_BATCH
+                )
+                entries = response[0][1] if response else []
+                if entries:
+                    self._last_id = entries[-1][0]
+                    published = [
+                        fields[b"key"].decode("utf-8")
+                        for entry_id, fields in entries
+                        if entry_id not in own_ids
+                    ]
+                    if published:
+                        self.on_invalidate(published)
+                if len(entries) < self.READ_BATCH:
+                    return True
+        except redis.RedisError as e:
+            logger.warning(f"Invalidation sync of {self.stream_key} failed: {e}")
+            return False
+    
+    def _drain(self, wait: float) -> List[str]:
+        keys = []
+        try:
+            keys.append(
+                self._queue.get(timeout=wait) if wait else self._queue.get_nowait()
+            )
+            while True:
+                keys.append(self._queue.get_nowait())
+        except queue.Empty:
+            return keys
+    
+    def _sync_forever(self) -> None:
+        while True:
+            try:
+                synced = self.sync(self.sync_interval_seconds)
+            except Exception as e:
+                logger.error(f"Invalidation sync of {self.stream_key} crashed: {e}")
+                synced = False
+            if not synced:
+                time.sleep(self.ERROR_BACKOFF_SECONDS)
@@ -0,0 +1,169 @@
+"""
+Redis response cache with per-project version counters
+
+Cached responses are keyed by project, the project's current version and a
+hash of the normalized request parameters. Writes bump the project's version
+with a single INCR, which orphans every cached response of that project at
+once; orphaned keys simply expire. Redis errors never fail a request: reads
+fall through to the database and Redis is left alone for a short back-off.
+"""
+
+import hashlib
+import json
+import secrets
+import time
+from typing import Any, Iterable, Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from core.config import settings
+from core.logger import setup_logger
+from core.metrics import registry
+
+logger = setup_logger(__name__)
+
+cache_requests = registry.counter(
+    "response_cache_requests_total",
+    "Response cache lookups by result (hit or miss)",
+    ["endpoint", "result"],
+)
+cache_errors = registry.counter(
+    "response_cache_errors_total",
+    "Failed Redis calls of the response cache",
+    ["operation"],
+)
+
+
+class ResponseCache:
+    """Versioned response cache shared by all service instances"""
+    
+    KEY_PREFIX = "testcases"
+    ERROR_BACKOFF_SECONDS = 5
+    
+    def __init__(
+        self,
+        redis_url: Optional[str],
+        ttl_seconds: int = 300,
+        enabled: bool = True,
+        client: Optional["redis.Redis"] = None,
+        async_client: Optional["aioredis.Redis"] = None
+    ):
+        self.ttl_seconds = ttl_seconds
+        self._client = client
+        self._async_client = async_client
+        if redis_url and client is None:
+            self._client = redis.Redis.from_url(
+                redis_url, socket_timeout=0.2, socket_connect_timeout=0.2
+            )
+        if redis_url and async_client is None:
+            self._async_client = aioredis.Redis.from_url(
+                redis_url, socket_timeout=0.2, socket_connect_timeout=0.2
+            )
+        self.enabled = enabled and self._async_client is not None
+        self._retry_at = 0.0
+    
+    @classmethod
+    def version_key(cls, project_id: int) -> str:
+        return f"{cls.KEY_PREFIX}:{project_id}:version"
+    
+    @classmethod
+    def project_key(cls, test_case_id: int) -> str:
+        return f"{cls.KEY_PREFIX}:case:{test_case_id}:project"
+    
+    @staticmethod
+    def params_digest(params: Any) -> str:
+        """Stable digest of JSON-serializable request parameters"""
+        return hashlib.sha256(
+            json.dumps(
+                params, sort_keys=True, separators=(",", ":"), default=str
+            ).encode("utf-8")
+        ).hexdigest()[:32]
+    
+    @classmethod
+    def response_key(
+        cls, project_id: int, version: int, endpoint: str, params: Any = None
+    ) -> str:
+        """Key of one cached response"""
+        digest = cls.params_digest(params)
+        return f"{cls.KEY_PREFIX}:{project_id}:v{version}:{endpoint}:{digest}"
+    
+    @property
+    def available(self) -> bool:
+        return self.enabled and time.monotonic() >= self._retry_at
+    
+    async def project_version(self, project_id: int) -> Optional[int]:
+        """
+        Current change version of a project, None when Redis is unavailable.
+        
+        Counters start at a random value, so a counter lost to eviction or a
+        Redis restart never returns to a version that was already handed out
+        (cached keys and list ETags embed it).
+        """
+        key = self.version_key(project_id)
+        value = await self._run("version", self._async_client.get, key)
+        if value is None and self.available:
+            await self._run(
+                "version", self._async_client.set, key, secrets.randbits(48), nx=True
+            )
+            value = await self._run("version", self._async_client.get, key)
+        return int(value) if value is not None else None
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._run("get", self._async_client.get, key)
+    
+    async def set(self, key: str, value: Any) -> None:
+        await self._run("set", self._async_client.set, key, value, ex=self.ttl_seconds)
+    
+    async def bump_projects_async(self, project_ids: Iterable[int]) -> None:
+        """Invalidate every cached response of the given projects"""
+        if not self.enabled:
+            return
+        
+        try:
+            async with self._async_client.pipeline(transaction=False) as pipe:
+                for project_id in project_ids:
+                    pipe.incr(self.version_key(project_id))
+                await pipe.execute()
+        except redis.RedisError as e:
+            # Cached responses of these projects stay visible until their TTL ends
+            cache_errors.inc(operation="bump")
+            logger.warning(
+                f"Could not bump response cache versions {sorted(project_ids)}: {e}"
+            )
+    
+    def bump_projects(self, project_ids: Iterable[int]) -> None:
+        """Invalidate every cached response of the given projects (synchronous)"""
+        if not self.enabled or self._client is None:
+            return
+        
+        try:
+            with self._client.pipeline(transaction=False) as pipe:
+                for project_id in project_ids:
+                    pipe.incr(self.version_key(project_id))
+                pipe.execute()
+        except redis.RedisError as e:
+            # Cached responses of these projects stay visible until their TTL ends
+            cache_errors.inc(operation="bump")
+            logger.warning(
+                f"Could not bump response cache versions {sorted(project_ids)}: {e}"
+            )
+    
+    async def _run(self, operation: str, method, *args: Any, **kwargs: Any) -> Any:
+        if not self.available:
+            return None
+        try:
+            return await method(*args, **kwargs)
+        except redis.RedisError as e:
+            cache_errors.inc(operation=operation)
+            self._retry_at = time.monotonic() + self.ERROR_BACKOFF_SECONDS
+            logger.warning(f"Response cache {operation} failed, bypassing cache: {e}")
+            return None
+
+
+# Global response cache instance
+response_cache = ResponseCache(
+    settings.REDIS_URL,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    enabled=settings.RESPONSE_CACHE_ENABLED,
+)
@@ -0,0 +1,236 @@
+"""
+Token and user revocation list
+
+Revocations are stored in a Redis sorted set (member -> expiry timestamp) so
+that every service instance, and the auth service, share them. Each process
+keeps only a Bloom filter of that set, rebuilt by a background thread when
+the version counter changes, so checks on the request path read local state
+only; the rare filter hits are confirmed against Redis (callers on the event
+loop do that in a worker thread). Revocations made by this process are also
+kept locally so they apply immediately and keep working while Redis is
+unreachable.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+import redis
+
+from core.config import settings
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Score of entries that never expire (disabled users)
+NEVER_EXPIRES = float("inf")
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings"""
+    
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+    
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+    
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+    
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class RevocationList:
+    """Shared revocation set of token IDs (``jti``) and user IDs"""
+    
+    REDIS_KEY = "auth:revocations"
+    VERSION_KEY = "auth:revocations:version"
+    
+    def __init__(
+        self,
+        redis_url: Optional[str],
+        sync_interval_seconds: float = 5,
+        capacity: int = 100000,
+        error_rate: float = 0.001,
+        client: Optional["redis.Redis"] = None
+    ):
+        self.sync_interval_seconds = sync_interval_seconds
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._client = client
+        if self._client is None and redis_url:
+            self._client = redis.Redis.from_url(
+                redis_url, socket_timeout=0.2, socket_connect_timeout=0.2
+            )
+        
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._version: Optional[bytes] = None
+        self._sync_thread: Optional[threading.Thread] = None
+        self._local: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _token_member(jti: str) -> str:
+        return f"jti:{jti}"
+    
+    @staticmethod
+    def _user_member(user_id: int) -> str:
+        return f"user:{user_id}"
+    
+    def revoke_token(self, jti: str, expires_at: float) -> None:
+        """Revoke one token (logout) until its expiry timestamp"""
+        self._add(self._token_member(jti), expires_at)
+    
+    def revoke_user(self, user_id: int) -> None:
+        """Revoke every token of a user (disabled or deleted account)"""
+        self._add(self._user_member(user_id), NEVER_EXPIRES)
+    
+    def restore_user(self, user_id: int) -> None:
+        """Lift a user revocation"""
+        member = self._user_member(user_id)
+        with self._lock:
+            self._local.pop(member, None)
+        if self._client is not None:
+            try:
+                with self._client.pipeline() as pipe:
+                    pipe.zrem(self.REDIS_KEY, member)
+                    pipe.incr(self.VERSION_KEY)
+                    pipe.execute()
+            except redis.RedisError as e:
+                logger.warning(f"Could not remove revocation {member} from Redis: {e}")
+    
+    def is_revoked(self, jti: Optional[str], user_id: int) -> bool:
+        """
+        Check a token's ID and its user against the revocation set.
+        
+        Bloom filter hits are confirmed with a blocking Redis call; on the
+        event loop use ``check_local`` first.
+        """
+        revoked = self.check_local(jti, user_id)
+        if revoked is None:
+            now = time.time()
+            hits = self._bloom_hits(jti, user_id)
+            revoked = any(self._confirm(member, now) for member in hits)
+        return revoked
+    
+    def check_local(self, jti: Optional[str], user_id: int) -> Optional[bool]:
+        """
+        Check against local state only, without any I/O.
+        
+        Returns None when the Bloom filter reports a hit that still has to be
+        confirmed against Redis (``is_revoked``).
+        """
+        self._start_sync_thread()
+        now = time.time()
+        
+        for member in self._members(jti, user_id):
+            expires_at = self._local.get(member)
+            if expires_at is not None and expires_at > now:
+                return True
+        if self._bloom_hits(jti, user_id):
+            return None
+        return False
+    
+    def sync(self) -> None:
+        """Rebuild the Bloom filter if the shared set changed"""
+        if self._client is None:
+            return
+        
+        try:
+            version = self._client.get(self.VERSION_KEY)
+            if version == self._version:
+                return
+            
+            now = time.time()
+            self._client.zremrangebyscore(self.REDIS_KEY, "-inf", now)
+            members = self._client.zrange(self.REDIS_KEY, 0, -1)
+        except redis.RedisError as e:
+            logger.warning(f"Revocation sync failed, using local revocations only: {e}")
+            return
+        
+        bloom = BloomFilter(max(self.capacity, len(members)), self.error_rate)
+        for member in members:
+            bloom.add(member.decode("utf-8"))
+        self._bloom, self._version = bloom, version
+        
+        with self._lock:
+            self._local = {
+                member: expires_at
+                for member, expires_at in self._local.items()
+                if expires_at > now
+            }
+    
+    def _start_sync_thread(self) -> None:
+        """Keep the Bloom filter in sync from a daemon thread, started on first use"""
+        if self._client is None or self._sync_thread is not None:
+            return
+        with self._lock:
+            if self._sync_thread is None:
+                self._sync_thread = threading.Thread(
+                    target=self._sync_forever, name="revocation-sync", daemon=True
+                )
+                self._sync_thread.start()
+    
+    def _sync_forever(self) -> None:
+        while True:
+            try:
+                self.sync()
+            except Exception as e:
+                logger.error(f"Revocation sync crashed: {e}")
+            time.sleep(self.sync_interval_seconds)
+    
+    def _members(self, jti: Optional[str], user_id: int) -> List[str]:
+        members = [self._user_member(user_id)]
+        if jti:
+            members.append(self._token_member(jti))
+        return members
+    
+    def _bloom_hits(self, jti: Optional[str], user_id: int) -> List[str]:
+        bloom = self._bloom
+        return [member for member in self._members(jti, user_id) if member in bloom]
+    
+    def _confirm(self, member: str, now: float) -> bool:
+        """Rule out Bloom filter false positives; fails closed without Redis"""
+        if self._client is None:
+            return True
+        try:
+            expires_at = self._client.zscore(self.REDIS_KEY, member)
+        except redis.RedisError as e:
+            logger.warning(f"Revocation lookup failed for {member}: {e}")
+            return True
+        return expires_at is not None and expires_at > now
+    
+    def _add(self, member: str, expires_at: float) -> None:
+        with self._lock:
+            self._local[member] = expires_at
+        if self._client is not None:
+            try:
+                with self._client.pipeline() as pipe:
+                    pipe.zadd(self.REDIS_KEY, {member: expires_at})
+                    pipe.incr(self.VERSION_KEY)
+                    pipe.execute()
+            except redis.RedisError as e:
+                logger.warning(f"Could not publish revocation {member} to Redis: {e}")
+
+
+# Global revocation list instance
+revocation_list = RevocationList(
+    settings.REDIS_URL,
+    sync_interval_seconds=settings.REVOCATION_SYNC_INTERVAL_SECONDS,
+    capacity=settings.REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.REVOCATION_BLOOM_ERROR_RATE,
+)
@@ -3,10 +3,14 @@ Test Management Service - Main Application Entry Point
 """
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1 import api_router
+from app.middleware.compression import CompressionMiddleware
+from app.database import close_async_db
 from core.config import settings
+from core.metrics import registry
 from core.logger import setup_logger
 
 # Initialize logger
@@ -30,10 +34,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON, NDJSON and CSV responses (streamed exports chunk by chunk)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        content_types=settings.COMPRESSION_CONTENT_TYPES,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        encodings=settings.COMPRESSION_ENCODINGS,
+    )
+
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
 
 
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    """Release pooled database connections"""
+    await close_async_db()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -43,6 +64,12 @@ async def health_check():
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics (connection pool checkouts, waits and occupancy)"""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -0,0 +1,82 @@
+"""
+Shared test configuration
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.functions import now
+
+from app.models.test_case import (
+    TestCaseDB,
+    TestCasePriority,
+    TestCaseStatus,
+    TestCaseType,
+)
+
+
+@compiles(now, "sqlite")
+def _sqlite_now(element, compiler, **kw):
+    """
+    Render ``now()`` server defaults on SQLite in the format SQLAlchemy binds
+    datetimes with, so keyset cursors compare like they do on PostgreSQL
+    """
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+@pytest.fixture
+def sqlite_db():
+    """Factory: a Session on a fresh in-memory SQLite database with ``tables``"""
+    sessions = []
+    
+    def make(*tables):
+        engine = create_engine("sqlite://")
+        for table in tables:
+            table.create(engine)
+        db = Session(engine)
+        sessions.append(db)
+        return db
+    
+    yield make
+    for db in sessions:
+        db.close()
+
+
+@pytest.fixture
+def add_test_cases():
+    """
+    Factory: insert test case rows into ``table`` (test_cases by default)
+    
+    Each row needs an ``id``; every other required column has a default
+    (project 1, an active case created by user 7 now) that the row can
+    override, so the rows also fit archived_test_cases.
+    """
+    def add(db, rows, table=TestCaseDB.__table__):
+        created_at = datetime.utcnow()
+        archived = {"archived_at": created_at} if "archived_at" in table.c else {}
+        db.execute(
+            insert(table),
+            [
+                {
+                    **archived,
+                    "project_id": 1,
+                    "title": f"case {row['id']}",
+                    "status": TestCaseStatus.ACTIVE,
+                    "priority": TestCasePriority.MEDIUM,
+                    "type": TestCaseType.FUNCTIONAL,
+                    "created_by": 7,
+                    "steps": [],
+                    "expected_results": [],
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                    "version": 1,
+                    **row,
+                }
+                for row in rows
+            ],
+        )
+    
+    return add
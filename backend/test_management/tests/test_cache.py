@@ -0,0 +1,52 @@
+"""
+Unit tests for the in-process TTL cache
+"""
+
+from core.cache import TTLCache
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    """Values are served until their TTL elapses"""
+    timer = FakeTimer()
+    cache = TTLCache(max_size=10, ttl_seconds=5, timer=timer)
+    cache.set((1, 2), True)
+    
+    timer.now = 4.9
+    assert cache.get((1, 2)) is True
+    
+    timer.now = 5.0
+    assert cache.get((1, 2)) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    """The oldest untouched entry is evicted when the cache is full"""
+    cache = TTLCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_delete_where_removes_matching_keys():
+    """Entries can be invalidated by key predicate"""
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    cache.set((1, 10), True)
+    cache.set((2, 10), False)
+    cache.set((1, 20), True)
+    
+    assert cache.delete_where(lambda key: key[1] == 10) == 2
+    assert cache.get((1, 20)) is True
+    assert cache.get((2, 10)) is None
@@ -0,0 +1,168 @@
+"""
+Tests for the response compression middleware
+"""
+
+import asyncio
+import zlib
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.compression import CompressionMiddleware, choose_encoding
+from app.utils.etag import none_match
+
+ROWS = [
+    f'{{"id": {i}, "title": "Test case {i}", "steps": ["open", "submit"]}}\n'
+    for i in range(200)
+]
+
+app = FastAPI()
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=500,
+    content_types=["application/json", "application/x-ndjson"],
+    encodings=["gzip"],
+)
+
+
+@app.get("/large")
+def large():
+    return [{"id": i, "title": f"Test case {i}"} for i in range(100)]
+
+
+@app.get("/tagged")
+def tagged(request: Request):
+    etag = '"7-3"'
+    if none_match(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    body = [{"id": i, "title": f"Test case {i}"} for i in range(100)]
+    return JSONResponse(body, headers={"ETag": etag})
+
+
+@app.get("/small-tagged")
+def small_tagged():
+    return JSONResponse({"id": 8}, headers={"ETag": '"8-1"'})
+
+
+@app.get("/small")
+def small():
+    return {"id": 1}
+
+
+@app.get("/text")
+def text():
+    return PlainTextResponse("x" * 5000)
+
+
+@app.get("/export")
+def export():
+    return StreamingResponse(iter(ROWS), media_type="application/x-ndjson")
+
+
+client = TestClient(app)
+
+
+def test_choose_encoding_honors_quality_values():
+    """Server preference wins among accepted encodings; q=0 refuses one"""
+    assert choose_encoding("gzip, br", ("br", "gzip")) == "br"
+    assert choose_encoding("br;q=0, gzip;q=0.5", ("br", "gzip")) == "gzip"
+    assert choose_encoding("identity", ("br", "gzip")) is None
+    assert choose_encoding("*", ("gzip",)) == "gzip"
+
+
+def test_only_large_allowlisted_responses_are_compressed():
+    """Small bodies and other content types go out uncompressed"""
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert len(response.json()) == 100
+    
+    assert (
+        "content-encoding"
+        not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+    )
+    assert (
+        "content-encoding"
+        not in client.get("/text", headers={"Accept-Encoding": "gzip"}).headers
+    )
+    assert (
+        "content-encoding"
+        not in client.get("/large", headers={"Accept-Encoding": "identity"}).headers
+    )
+
+
+def test_streaming_chunks_are_decodable_on_arrival():
+    """Every streamed chunk decodes to its rows before the response ends"""
+    messages = []
+    
+    async def receive():
+        await asyncio.sleep(1)
+        return {"type": "http.disconnect"}
+    
+    async def send(message):
+        messages.append(message)
+    
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/export",
+        "raw_path": b"/export",
+        "query_string": b"",
+        "headers": [(b"accept-encoding", b"gzip")],
+        "root_path": "",
+        "scheme": "http",
+        "server": ("test", 80),
+        "client": ("test", 1),
+        "http_version": "1.1",
+    }
+    asyncio.run(app(scope, receive, send))
+    
+    start = messages[0]
+    assert (b"content-encoding", b"gzip") in start["headers"]
+    assert not any(name == b"content-length" for name, _ in start["headers"])
+    
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    bodies = [message for message in messages[1:] if message.get("more_body")]
+    assert len(bodies) == len(ROWS)
+    for row, message in zip(ROWS, bodies):
+        assert decompressor.decompress(message["body"]).decode() == row
+
+
+def test_compressed_responses_get_their_own_etag():
+    """A strong ETag names the bytes sent, so the content coding is appended"""
+    response = client.get("/tagged", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == '"7-3-gzip"'
+    
+    response = client.get("/tagged", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"7-3"'
+
+
+def test_not_modified_keeps_the_compressed_etag():
+    """A 304 after a gzip 200 carries the tag the client stored"""
+    response = client.get("/tagged", headers={"Accept-Encoding": "gzip"})
+    etag = response.headers["etag"]
+    assert etag == '"7-3-gzip"'
+    
+    response = client.get(
+        "/tagged", headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.headers["vary"] == "Accept-Encoding"
+    
+    response = client.get(
+        "/tagged", headers={"Accept-Encoding": "identity", "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == '"7-3"'
+
+
+def test_small_bodies_get_the_negotiated_etag():
+    """Below the minimum size the tag still names the negotiated encoding"""
+    response = client.get("/small-tagged", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"8-1-gzip"'
+    assert response.headers["vary"] == "Accept-Encoding"
@@ -0,0 +1,94 @@
+"""
+Unit tests for read-replica session routing
+"""
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, select, update
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import StaticPool
+
+from app.db_routing import RoutingSession, primary_reads, replica_read, replica_reads
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "items"
+    
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50))
+
+
+class ItemRepository:
+    def __init__(self, db):
+        self.db = db
+    
+    @replica_read
+    def names(self):
+        return [
+            name for (name,) in self.db.execute(select(Item.name).order_by(Item.id))
+        ]
+
+
+def make_engine(name):
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(Item.__table__.insert(), [{"name": name}])
+    return engine
+
+
+@pytest.fixture
+def session():
+    primary, replica = make_engine("primary"), make_engine("replica")
+    db = RoutingSession(bind=primary, replicas=[replica])
+    yield db
+    db.close()
+    primary.dispose()
+    replica.dispose()
+
+
+def test_reads_use_primary_unless_opted_in(session):
+    """Only replica-safe reads are routed to a replica"""
+    assert [name for (name,) in session.execute(select(Item.name))] == ["primary"]
+    assert ItemRepository(session).names() == ["replica"]
+    with replica_reads(session):
+        assert session.scalar(select(Item.name)) == "replica"
+    assert session.scalar(select(Item.name)) == "primary"
+
+
+def test_primary_reads_override_replica_safe_reads(session):
+    """Inside primary_reads even replica-safe reads use the primary"""
+    with primary_reads(session):
+        assert ItemRepository(session).names() == ["primary"]
+    assert ItemRepository(session).names() == ["replica"]
+
+
+def test_flush_makes_session_read_its_writes(session):
+    """After a flush every read of the session stays on the primary"""
+    session.add(Item(name="new"))
+    session.flush()
+    
+    assert ItemRepository(session).names() == ["primary", "new"]
+
+
+def test_dml_statement_goes_to_primary_and_sticks(session):
+    """Bulk DML is never sent to a replica, even inside replica_reads"""
+    with replica_reads(session):
+        session.execute(update(Item).values(name="renamed"))
+    session.commit()
+    
+    assert ItemRepository(session).names() == ["renamed"]
+
+
+def test_without_replicas_everything_uses_primary():
+    """A session with no replicas configured behaves like a plain Session"""
+    primary = make_engine("primary")
+    db = RoutingSession(bind=primary)
+    try:
+        assert ItemRepository(db).names() == ["primary"]
+    finally:
+        db.close()
+        primary.dispose()
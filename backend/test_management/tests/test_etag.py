@@ -0,0 +1,34 @@
+"""
+Unit tests for ETag formatting and conditional header parsing
+"""
+
+import pytest
+
+from app.utils import etag as etags
+from app.utils.etag import if_match_version, list_etag, none_match
+
+
+def test_none_match_uses_weak_comparison():
+    """If-None-Match matches listed tags regardless of the weak prefix"""
+    etag = etags.test_case_etag(7, 3)
+    
+    assert none_match(etag, etag)
+    assert none_match(f'"7-2", W/{etag}', etag)
+    assert none_match("*", etag)
+    assert not none_match('"7-2"', etag)
+    assert not none_match(None, etag)
+    assert none_match(list_etag(1, 5, "abc"), list_etag(1, 5, "abc"))
+    assert none_match('"7-3-gzip"', etag)
+
+
+def test_if_match_version():
+    """If-Match yields the expected version of this test case only"""
+    assert if_match_version('"7-3"', 7) == 3
+    assert if_match_version('"8-1", "7-4"', 7) == 4
+    assert if_match_version("*", 7) is None
+    assert if_match_version('"7-3-br"', 7) == 3
+    
+    with pytest.raises(ValueError):
+        if_match_version('W/"7-3"', 7)
+    with pytest.raises(ValueError):
+        if_match_version('"17-3"', 7)
@@ -0,0 +1,88 @@
+"""
+Unit tests for cross-process cache invalidation
+"""
+
+import redis
+
+from core.invalidation_bus import InvalidationBus
+
+
+class FakeStreamRedis:
+    """In-memory stand-in for the Redis stream calls used"""
+    
+    def __init__(self):
+        self.entries = []
+        self.fail = False
+        self._pending = []
+    
+    def _check(self):
+        if self.fail:
+            raise redis.ConnectionError("down")
+    
+    def xrevrange(self, name, count=None):
+        self._check()
+        return list(reversed(self.entries))[:count]
+    
+    def xread(self, streams, count=None):
+        self._check()
+        (last_id,) = streams.values()
+        entries = [entry for entry in self.entries if entry[0] > last_id][:count]
+        return [[b"stream", entries]] if entries else []
+    
+    def pipeline(self, transaction=True):
+        return self
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._pending = []
+    
+    def xadd(self, name, fields, maxlen=None):
+        self._pending.append(fields)
+    
+    def execute(self):
+        self._check()
+        ids = []
+        for fields in self._pending:
+            entry_id = f"{len(self.entries) + 1:020d}-0".encode()
+            encoded = {key.encode(): value.encode() for key, value in fields.items()}
+            self.entries.append((entry_id, encoded))
+            ids.append(entry_id)
+        return ids
+
+
+def _bus(client, received):
+    return InvalidationBus(None, "access:invalidations", received.extend, client=client)
+
+
+def test_invalidations_reach_other_processes_only():
+    """Published keys are applied by every other process, not echoed back"""
+    client = FakeStreamRedis()
+    first_received, second_received = [], []
+    first, second = _bus(client, first_received), _bus(client, second_received)
+    assert first.sync() and second.sync()
+    
+    first._queue.put("5")
+    first._queue.put("7")
+    assert first.sync()
+    assert second.sync()
+    
+    assert first_received == []
+    assert second_received == ["5", "7"]
+    
+    # Each entry is applied once
+    assert second.sync()
+    assert second_received == ["5", "7"]
+
+
+def test_redis_errors_are_reported_not_raised():
+    """A failing Redis leaves staleness to the cache TTL"""
+    client = FakeStreamRedis()
+    received = []
+    bus = _bus(client, received)
+    client.fail = True
+    bus._queue.put("5")
+    
+    assert bus.sync() is False
+    assert received == []
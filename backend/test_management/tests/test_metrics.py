@@ -0,0 +1,51 @@
+"""
+Unit tests for metrics and the instrumented connection pool
+"""
+
+from sqlalchemy import create_engine, text
+
+from app import db_pool
+from app.db_pool import InstrumentedQueuePool, checkout_wait_seconds, instrument_engine
+from core.config import settings
+from core.metrics import MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Histogram buckets are cumulative and end with +Inf"""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("wait_seconds", "Wait", ["pool"], buckets=(0.1, 1.0))
+    histogram.observe(0.05, pool="a")
+    histogram.observe(0.5, pool="a")
+    histogram.observe(5, pool="a")
+    
+    text_format = registry.render()
+    
+    assert 'wait_seconds_bucket{pool="a",le="0.1"} 1' in text_format
+    assert 'wait_seconds_bucket{pool="a",le="1.0"} 2' in text_format
+    assert 'wait_seconds_bucket{pool="a",le="+Inf"} 3' in text_format
+    assert 'wait_seconds_count{pool="a"} 3' in text_format
+
+
+def test_instrumented_pool_records_checkouts(tmp_path, monkeypatch):
+    """Checkouts are timed and idle connections are pinged"""
+    monkeypatch.setattr(settings, "DB_POOL_PRE_PING", db_pool.PRE_PING_IDLE)
+    monkeypatch.setattr(settings, "DB_POOL_PRE_PING_IDLE_SECONDS", 0)
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=2,
+        max_overflow=1,
+    )
+    instrument_engine(engine, "test")
+    
+    try:
+        for _ in range(3):
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        
+        assert checkout_wait_seconds.count(pool="test") == 3
+        assert db_pool.pre_pings.value(pool="test") == 2
+        assert 'db_pool_size{pool="test"} 2' in db_pool.registry.render()
+    finally:
+        db_pool._pools.remove(engine.pool)
+        engine.dispose()
@@ -0,0 +1,46 @@
+"""
+Unit tests for MinHash signatures and LSH banding
+"""
+
+from app.utils import minhash
+
+
+def _signature(*parts):
+    return minhash.signature(minhash.shingles(parts))
+
+
+def test_identical_content_is_fully_similar():
+    """Identical content yields identical signatures"""
+    a = _signature("User Login Test", "Open login page", "Click login button")
+    b = _signature("user login test", "open login page", "click login button")
+    
+    assert minhash.similarity(a, b) == 1.0
+    assert minhash.band_hashes(a) == minhash.band_hashes(b)
+
+
+def test_near_duplicates_share_buckets():
+    """Near-duplicates score high and collide in at least one LSH band"""
+    steps = (
+        "Open login page enter valid username enter valid password click login button"
+    )
+    a = _signature("User Login Test", steps)
+    b = _signature("User Authentication Test", steps)
+    
+    assert minhash.similarity(a, b) > 0.7
+    assert set(minhash.band_hashes(a)) & set(minhash.band_hashes(b))
+
+
+def test_unrelated_content_is_dissimilar():
+    """Unrelated content scores low"""
+    a = _signature("User Login Test", "Open login page and click login button")
+    b = _signature("Export report", "Generate monthly CSV export for finance")
+    
+    assert minhash.similarity(a, b) < 0.2
+
+
+def test_empty_content_has_no_buckets():
+    """Empty content is never a candidate"""
+    empty = _signature("")
+    
+    assert minhash.band_hashes(empty) == []
+    assert minhash.similarity(empty, empty) == 0.0
@@ -3,12 +3,19 @@ Unit tests for project API endpoints
 """
 
 import pytest
+from fastapi import Depends
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-
-from app.database import get_db, Base
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.commands.purge_deleted import purge
+from app.database import get_db, get_async_db
+from app.middleware.auth import get_current_user, get_current_user_dependency, security
+from app.models import (  # noqa: F401 (registers every table on the metadatas)
+    archived_test_case, project, purge_job, similarity, stat_counter, test_case, user
+)
 from main import app
 
 # Create test database
@@ -16,8 +23,8 @@ SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+# Model tables, recreated for every test (see ``database``)
+METADATAS = (project.Base.metadata, test_case.Base.metadata, user.Base.metadata)
 
 # Override database dependency
 def override_get_db():
@@ -27,11 +34,54 @@ def override_get_db():
     finally:
         db.close()
 
-app.dependency_overrides[get_db] = override_get_db
+
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+TestingAsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
+# Authentication is not under test here: any bearer token is the test user
+TEST_USER_ID = 1
+
+
+async def override_get_current_user_dependency(credentials=Depends(security)):
+    return {
+        "user_id": TEST_USER_ID,
+        "username": "testuser",
+        "email": "test@example.com"
+    }
+
+
+async def override_get_current_user(credentials=Depends(security)) -> user.UserResponse:
+    async with TestingAsyncSessionLocal() as db:
+        return user.UserResponse.from_orm(await db.get(user.UserDB, TEST_USER_ID))
 
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def database():
+    """Give every test empty tables and this module's dependency overrides"""
+    for metadata in METADATAS:
+        metadata.drop_all(bind=engine)
+        metadata.create_all(bind=engine)
+    
+    app.dependency_overrides.update({
+        get_db: override_get_db,
+        get_async_db: override_get_async_db,
+        get_current_user: override_get_current_user,
+        get_current_user_dependency: override_get_current_user_dependency,
+    })
+    yield
+    app.dependency_overrides.clear()
+
+
 @pytest.fixture
 def test_user():
     """Create a test user"""
@@ -55,20 +105,21 @@ def test_project():
 
 @pytest.fixture
 def auth_headers(test_user):
-    """Create authentication headers"""
-    # Register user
-    client.post("/api/v1/auth/register", json=test_user)
-    
-    # Login to get token
-    login_data = {
-        "email": test_user["email"],
-        "password": test_user["password"]
-    }
-    
-    response = client.post("/api/v1/auth/login", json=login_data)
-    token = response.json()["token"]["access_token"]
+    """Create the test user and authentication headers"""
+    db = TestingSessionLocal()
+    try:
+        db.add(user.UserDB(
+            id=TEST_USER_ID,
+            username=test_user["username"],
+            email=test_user["email"],
+            password_hash="not-a-real-hash",
+            full_name=test_user["full_name"]
+        ))
+        db.commit()
+    finally:
+        db.close()
     
-    return {"Authorization": f"Bearer {token}"}
+    return {"Authorization": "Bearer test-token"}
 
 
 def test_create_project(auth_headers, test_project):
@@ -215,10 +266,106 @@ def test_delete_project(auth_headers, test_project):
     create_response = client.post("/api/v1/projects", json=test_project, headers=auth_headers)
     project_id = create_response.json()["id"]
     
+    test_case_ids = [
+        client.post(
+            f"/api/v1/projects/{project_id}/testcases",
+            json={"title": title, "steps": ["Open page"], "expected_results": ["Ok"]},
+            headers=auth_headers,
+        ).json()["id"]
+        for title in ("First case", "Second case")
+    ]
+    
     response = client.delete(f"/api/v1/projects/{project_id}", headers=auth_headers)
     
     assert response.status_code == 200
-    assert response.json()["message"] == "Project deleted successfully"
+    data = response.json()
+    assert data["message"] == "Project deleted successfully"
+    job = data["purge_job"]
+    assert job["project_id"] == project_id
+    assert job["status"] == "pending"
+    assert job["test_cases_total"] == 2
+    assert job["test_cases_purged"] == 0
+    
+    # The project is gone at once, before any purge; its test cases are no
+    # longer reachable through it
+    response = client.get(f"/api/v1/projects/{project_id}", headers=auth_headers)
+    assert response.status_code == 404
+    response = client.get(
+        f"/api/v1/projects/{project_id}/testcases", headers=auth_headers
+    )
+    assert response.status_code == 403
+    for test_case_id in test_case_ids:
+        response = client.get(
+            f"/api/v1/testcases/{test_case_id}", headers=auth_headers
+        )
+        assert response.status_code == 403
+
+
+def test_purge_job_progress(auth_headers, test_project):
+    """Test a project purge job goes from pending through running to completed"""
+    create_response = client.post(
+        "/api/v1/projects", json=test_project, headers=auth_headers
+    )
+    project_id = create_response.json()["id"]
+    for title in ("First case", "Second case"):
+        client.post(
+            f"/api/v1/projects/{project_id}/testcases",
+            json={"title": title, "steps": ["Open page"], "expected_results": ["Ok"]},
+            headers=auth_headers,
+        )
+    job_id = client.delete(
+        f"/api/v1/projects/{project_id}", headers=auth_headers
+    ).json()["purge_job"]["id"]
+    
+    def job():
+        response = client.get(
+            f"/api/v1/projects/purge-jobs/{job_id}", headers=auth_headers
+        )
+        assert response.status_code == 200
+        return response.json()
+    
+    assert job()["status"] == "pending"
+    
+    db = TestingSessionLocal()
+    try:
+        assert purge(db, batch_size=1, pause=0, max_batches=1) == (0, 0)
+        assert (job()["status"], job()["test_cases_purged"]) == ("running", 1)
+        
+        assert purge(db, batch_size=1, pause=0) == (0, 1)
+    finally:
+        db.close()
+    
+    data = job()
+    assert data["status"] == "completed"
+    assert data["test_cases_purged"] == 2
+    assert data["completed_at"] is not None
+
+
+def test_purge_job_of_another_user(auth_headers, test_project):
+    """Test a purge job is only visible to the user who requested it"""
+    create_response = client.post(
+        "/api/v1/projects", json=test_project, headers=auth_headers
+    )
+    project_id = create_response.json()["id"]
+    job_id = client.delete(
+        f"/api/v1/projects/{project_id}", headers=auth_headers
+    ).json()["purge_job"]["id"]
+    
+    async def other_user(credentials=Depends(security)):
+        return {
+            "user_id": TEST_USER_ID + 1,
+            "username": "other",
+            "email": "other@example.com",
+        }
+    
+    app.dependency_overrides[get_current_user_dependency] = other_user
+    response = client.get(
+        f"/api/v1/projects/purge-jobs/{job_id}", headers=auth_headers
+    )
+    assert response.status_code == 403
+    
+    response = client.get("/api/v1/projects/purge-jobs/999", headers=auth_headers)
+    assert response.status_code == 404
 
 
 def test_delete_project_not_found(auth_headers):
@@ -280,4 +427,4 @@ def test_project_status_filter(auth_headers, test_project):
     data = response.json()
     assert len(data["projects"]) == 1
     assert data["projects"][0]["status"] == "active"
-    assert data["projects"][0]["name"] == "Active Project"
\ No newline at end of file
+    assert data["projects"][0]["name"] == "Active Project"
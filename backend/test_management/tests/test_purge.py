@@ -0,0 +1,145 @@
+"""
+Unit tests for the batched purge of soft-deleted rows
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.exc import OperationalError
+
+from app.commands.purge_deleted import purge
+from app.models.archived_test_case import ArchivedTestCaseDB
+from app.models.project import ProjectDB
+from app.models.purge_job import PurgeJobDB, PurgeJobStatus
+from app.models.stat_counter import TestCaseStatCounterDB
+from app.models.test_case import TestCaseDB
+from app.repositories.purge_repository import PurgeRepository
+
+TEST_CASES = TestCaseDB.__table__
+ARCHIVED_TEST_CASES = ArchivedTestCaseDB.__table__
+PROJECTS = ProjectDB.__table__
+STAT_COUNTERS = TestCaseStatCounterDB.__table__
+
+
+@pytest.fixture
+def deleted_projects(sqlite_db, add_test_cases):
+    """
+    Projects 1 and 2 soft-deleted with a queued purge job each; project 3 live
+    
+    Project 1 has test cases 1-3 and archived test case 4, project 2 has test
+    case 5 and project 3 has test case 6. Every project has a total counter.
+    """
+    db = sqlite_db(
+        TEST_CASES, ARCHIVED_TEST_CASES, PROJECTS, STAT_COUNTERS, PurgeJobDB.__table__
+    )
+    now = datetime.utcnow()
+    db.execute(insert(PROJECTS), [
+        {"id": project_id, "name": f"project {project_id}", "created_by": 7,
+         "deleted_at": None if project_id == 3 else now}
+        for project_id in (1, 2, 3)
+    ])
+    add_test_cases(db, [{"id": 1}, {"id": 2}, {"id": 3}])
+    add_test_cases(db, [{"id": 4}], table=ARCHIVED_TEST_CASES)
+    add_test_cases(db, [{"id": 5, "project_id": 2}, {"id": 6, "project_id": 3}])
+    db.execute(insert(STAT_COUNTERS), [
+        {"project_id": project_id, "dimension": "total", "value": "", "count": 1}
+        for project_id in (1, 2, 3)
+    ])
+    
+    repository = PurgeRepository(db)
+    for project_id in (1, 2):
+        repository.create_project_job(project_id, requested_by=7)
+    db.commit()
+    return db
+
+
+def _ids(db, table):
+    return db.execute(select(table.c.id).order_by(table.c.id)).scalars().all()
+
+
+def test_purge_test_cases_batch_removes_only_soft_deleted_rows(
+    sqlite_db, add_test_cases
+):
+    """Soft-deleted test cases go in bounded batches; live ones stay"""
+    db = sqlite_db(TEST_CASES)
+    now = datetime.utcnow()
+    add_test_cases(db, [
+        {"id": test_case_id, "deleted_at": now if test_case_id % 2 else None}
+        for test_case_id in range(1, 8)
+    ])
+    db.commit()
+    repository = PurgeRepository(db)
+    
+    assert repository.purge_test_cases_batch(batch_size=3) == 3
+    db.commit()
+    assert db.execute(
+        select(TEST_CASES.c.id).order_by(TEST_CASES.c.id)
+    ).scalars().all() == [2, 4, 6, 7]
+    
+    assert repository.purge_test_cases_batch(batch_size=3) == 1
+    assert repository.purge_test_cases_batch(batch_size=3) == 0
+    db.commit()
+    assert db.execute(
+        select(TEST_CASES.c.id).order_by(TEST_CASES.c.id)
+    ).scalars().all() == [2, 4, 6]
+
+
+def test_purge_project_batch_removes_test_cases_then_the_project(deleted_projects):
+    """A job purges test cases, then archived ones, then counters and project"""
+    db = deleted_projects
+    repository = PurgeRepository(db)
+    
+    job = repository.next_project_job()
+    assert (job.project_id, job.status) == (1, PurgeJobStatus.PENDING.value)
+    assert job.test_cases_total == 4
+    
+    assert not repository.purge_project_batch(job, batch_size=2)
+    db.commit()
+    assert (job.status, job.test_cases_purged) == (PurgeJobStatus.RUNNING.value, 2)
+    assert job.started_at is not None
+    
+    assert not repository.purge_project_batch(job, batch_size=2)
+    assert not repository.purge_project_batch(job, batch_size=2)
+    assert job.test_cases_purged == 4
+    assert _ids(db, TEST_CASES) == [5, 6]
+    assert _ids(db, ARCHIVED_TEST_CASES) == []
+    assert _ids(db, PROJECTS) == [1, 2, 3]
+    
+    assert repository.purge_project_batch(job, batch_size=2)
+    db.commit()
+    assert job.status == PurgeJobStatus.COMPLETED.value
+    assert job.completed_at is not None
+    assert _ids(db, PROJECTS) == [2, 3]
+    assert db.execute(
+        select(STAT_COUNTERS.c.project_id).order_by(STAT_COUNTERS.c.project_id)
+    ).scalars().all() == [2, 3]
+    
+    # The next open job is project 2's
+    assert repository.next_project_job().project_id == 2
+
+
+def test_purge_fails_a_broken_job_and_moves_on(deleted_projects, monkeypatch):
+    """A job whose batch fails is marked failed; the worker continues with the next"""
+    db = deleted_projects
+    purge_project_batch = PurgeRepository.purge_project_batch
+    
+    def failing_for_project_1(self, job, batch_size=1000):
+        if job.project_id == 1:
+            raise OperationalError("DELETE FROM test_cases", {}, Exception("timeout"))
+        return purge_project_batch(self, job, batch_size)
+    
+    monkeypatch.setattr(PurgeRepository, "purge_project_batch", failing_for_project_1)
+    
+    assert purge(db, batch_size=10, pause=0) == (0, 1)
+    
+    jobs = {job.project_id: job for job in db.query(PurgeJobDB)}
+    assert jobs[1].status == PurgeJobStatus.FAILED.value
+    assert "timeout" in jobs[1].error
+    assert jobs[2].status == PurgeJobStatus.COMPLETED.value
+    assert _ids(db, PROJECTS) == [1, 3]
+    assert _ids(db, TEST_CASES) == [1, 2, 3, 6]
+    
+    # Failed jobs are not picked up again
+    assert PurgeRepository(db).next_project_job() is None
+    assert purge(db, batch_size=10, pause=0) == (0, 0)
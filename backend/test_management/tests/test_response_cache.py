@@ -0,0 +1,130 @@
+"""
+Unit tests for the versioned response cache
+"""
+
+import asyncio
+
+import redis
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.repositories.cache_invalidation import mark_project_changed
+from app.services.async_service import AsyncService
+from core.response_cache import ResponseCache, response_cache
+
+
+class FakeRedis:
+    """In-memory stand-in for the few sync and async Redis calls used"""
+    
+    def __init__(self):
+        self.data = {}
+        self.fail = False
+        self._pending = []
+    
+    async def get(self, key):
+        if self.fail:
+            raise redis.ConnectionError("down")
+        return self.data.get(key)
+    
+    async def set(self, key, value, ex=None, nx=False):
+        if not (nx and key in self.data):
+            self.data[key] = value
+    
+    def pipeline(self, transaction=True):
+        return self
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._pending = []
+    
+    def incr(self, key):
+        self._pending.append(key)
+    
+    def execute(self):
+        for key in self._pending:
+            self.data[key] = str(int(self.data.get(key, 0)) + 1).encode()
+
+
+def _cache(fake):
+    return ResponseCache(redis_url=None, client=fake, async_client=fake)
+
+
+def test_response_key_ignores_parameter_order():
+    """Equal parameters map to the same key, different versions do not"""
+    first = ResponseCache.response_key(1, 3, "list", {"page": 1, "status": "active"})
+    second = ResponseCache.response_key(1, 3, "list", {"status": "active", "page": 1})
+    
+    assert first == second
+    assert first != ResponseCache.response_key(
+        1, 4, "list", {"page": 1, "status": "active"}
+    )
+
+
+def test_bump_moves_project_to_a_new_version():
+    """A write makes every previously cached key of the project unreachable"""
+    fake = FakeRedis()
+    cache = _cache(fake)
+    
+    async def scenario():
+        version = await cache.project_version(1)
+        assert await cache.project_version(1) == version
+        cache.bump_projects([1])
+        return version, await cache.project_version(1)
+    
+    before, after = asyncio.run(scenario())
+    assert after == before + 1
+
+
+def test_redis_errors_bypass_the_cache():
+    """A failing Redis is reported as unavailable instead of raising"""
+    fake = FakeRedis()
+    cache = _cache(fake)
+    fake.fail = True
+    
+    assert asyncio.run(cache.project_version(1)) is None
+    assert not cache.available
+
+
+class _TouchService:
+    def __init__(self, db):
+        self.db = db
+    
+    def touch(self, project_id):
+        mark_project_changed(self.db, project_id)
+
+
+class _AsyncTouchService(AsyncService):
+    service_class = _TouchService
+    
+    async def touch(self, project_id):
+        return await self._write("touch", project_id)
+
+
+def test_async_writes_bump_versions_with_the_async_client(monkeypatch):
+    """Commits of an AsyncSession never make a blocking Redis call"""
+    sync_bumps, async_bumps = [], []
+    
+    async def bump_projects_async(project_ids):
+        async_bumps.append(set(project_ids))
+    
+    monkeypatch.setattr(response_cache, "bump_projects", sync_bumps.append)
+    monkeypatch.setattr(response_cache, "bump_projects_async", bump_projects_async)
+    
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with async_sessionmaker(engine)() as db:
+            await _AsyncTouchService(db).touch(3)
+        await engine.dispose()
+    
+    asyncio.run(scenario())
+    assert async_bumps == [{3}]
+    assert sync_bumps == []
+    
+    # Synchronous sessions (imports, commands) still bump in the commit hook
+    with Session(create_engine("sqlite://")) as db:
+        mark_project_changed(db, 4)
+        db.commit()
+    assert sync_bumps == [{4}]
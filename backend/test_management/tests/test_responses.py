@@ -0,0 +1,87 @@
+"""
+Unit tests for row-based list responses, field projections and orjson rendering
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from app.models.test_case import (
+    TEST_CASE_RESPONSE_FIELDS,
+    TEST_CASE_SUMMARY_FIELDS,
+    TestCaseStatus,
+    projected_list_model,
+    resolve_test_case_fields,
+)
+from app.services.test_case_service import _test_case_responses
+from app.utils.responses import ORJSONModelResponse
+
+
+def _row(test_case_id):
+    values = {
+        "id": test_case_id,
+        "project_id": 1,
+        "created_by": 2,
+        "updated_by": None,
+        "title": f"Case {test_case_id}",
+        "description": None,
+        "status": TestCaseStatus.DRAFT,
+        "priority": "high",
+        "type": "manual",
+        "preconditions": None,
+        "steps": ["open", "submit"],
+        "expected_results": ["saved"],
+        "estimated_duration": None,
+        "tags": ["smoke"],
+        "created_at": datetime(2024, 1, 2, 3, 4, 5),
+        "updated_at": datetime(2024, 1, 2, 3, 4, 5),
+        "version": 1,
+    }
+    return tuple(values[name] for name in TEST_CASE_RESPONSE_FIELDS)
+
+
+def test_rows_render_like_the_response_model():
+    """Row tuples become validated models that render to the standard JSON body"""
+    test_cases = _test_case_responses([_row(1), _row(2)])
+    body = json.loads(ORJSONModelResponse(test_cases).body)
+    
+    assert [test_case["id"] for test_case in body] == [1, 2]
+    assert body[0] == json.loads(test_cases[0].model_dump_json())
+    assert body[0]["status"] == "draft"
+    assert body[0]["created_at"] == "2024-01-02T03:04:05"
+
+
+def test_resolve_fields_expands_sets_and_keeps_required_fields():
+    """Field sets expand, required fields are added and order follows the model"""
+    assert resolve_test_case_fields("steps,title") == [
+        "title",
+        "steps",
+        "id",
+        "created_at",
+    ]
+    assert resolve_test_case_fields(None) == list(TEST_CASE_SUMMARY_FIELDS)
+    assert resolve_test_case_fields("all") == list(TEST_CASE_RESPONSE_FIELDS)
+    with pytest.raises(ValueError):
+        resolve_test_case_fields("title,password")
+
+
+def test_projected_list_model_renders_only_requested_fields():
+    """A projection validates and renders items with exactly the selected fields"""
+    fields = tuple(resolve_test_case_fields("title,status"))
+    model = projected_list_model(fields)
+    page = model.model_validate({
+        "test_cases": [dict(zip(fields, ("Case", "draft", 1, datetime(2024, 1, 2))))],
+        "page": 1, "size": 10, "has_next": False, "has_prev": False,
+    })
+    
+    body = json.loads(ORJSONModelResponse(page).body)
+    assert body["test_cases"] == [
+        {
+            "title": "Case",
+            "status": "draft",
+            "id": 1,
+            "created_at": "2024-01-02T00:00:00",
+        }
+    ]
+    assert projected_list_model(fields) is model
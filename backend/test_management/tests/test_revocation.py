@@ -0,0 +1,144 @@
+"""
+Unit tests for the revocation list and the verified-token cache
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.middleware import auth
+from app.models.user import UserResponse
+from core.revocation import BloomFilter, RevocationList
+
+
+def _user(user_id=1):
+    now = datetime.utcnow()
+    return UserResponse(
+        id=user_id,
+        username="alice",
+        email="alice@example.com",
+        full_name=None,
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_bloom_filter_has_no_false_negatives():
+    """Every added item is reported as present"""
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f"jti:{i}" for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+    
+    assert all(item in bloom for item in items)
+    false_positives = sum(f"other:{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_local_revocations_without_redis():
+    """Revocations apply immediately when no Redis is configured"""
+    revocations = RevocationList(redis_url=None)
+    
+    revocations.revoke_token("abc", time.time() + 60)
+    revocations.revoke_user(2)
+    
+    assert revocations.is_revoked("abc", 1)
+    assert revocations.is_revoked(None, 2)
+    assert not revocations.is_revoked("def", 1)
+    
+    revocations.restore_user(2)
+    assert not revocations.is_revoked(None, 2)
+
+
+def test_expired_token_revocations_lapse():
+    """A token revocation ends at the token's expiry"""
+    revocations = RevocationList(redis_url=None)
+    revocations.revoke_token("old", time.time() - 1)
+    
+    assert not revocations.is_revoked("old", 1)
+
+
+def test_cached_token_is_rejected_once_revoked(monkeypatch):
+    """A cache hit skips verification but still honours revocations"""
+    revocations = RevocationList(redis_url=None)
+    monkeypatch.setattr(auth, "revocation_list", revocations)
+    
+    bearer = auth.JWTBearer()
+    token = bearer.create_access_token(
+        {"user_id": 1, "username": "alice", "email": "alice@example.com"}
+    )
+    claims = bearer.verify_token(token)
+    auth.token_cache.set(token, (claims, _user()))
+    
+    try:
+        assert bearer.authenticate(token)[1].id == 1
+        
+        revocations.revoke_token(claims["jti"], claims["exp"])
+        with pytest.raises(HTTPException) as exc_info:
+            bearer.authenticate(token)
+        assert exc_info.value.status_code == 401
+    finally:
+        auth.token_cache.delete(token)
+
+
+class _FakeRedis:
+    """Revocation set in memory, recording the thread of every call"""
+    
+    def __init__(self, members):
+        self.members = members
+        self.threads = []
+    
+    def _record(self):
+        self.threads.append(threading.current_thread())
+    
+    def get(self, key):
+        self._record()
+        return b"1"
+    
+    def zremrangebyscore(self, key, low, high):
+        self._record()
+    
+    def zrange(self, key, start, end):
+        self._record()
+        return [member.encode("utf-8") for member in self.members]
+    
+    def zscore(self, key, member):
+        self._record()
+        return self.members.get(member)
+
+
+def test_checks_on_the_loop_read_local_state_only(monkeypatch):
+    """The Bloom filter syncs in the background; hits are confirmed off the loop"""
+    client = _FakeRedis({"user:2": float("inf")})
+    revocations = RevocationList(None, sync_interval_seconds=60, client=client)
+    monkeypatch.setattr(auth, "revocation_list", revocations)
+    
+    # The first check starts the sync thread and does not wait for it
+    revocations.check_local(None, 1)
+    deadline = time.monotonic() + 5
+    while revocations._version is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    
+    assert revocations.check_local(None, 1) is False
+    assert revocations.check_local(None, 2) is None
+    assert client.threads and threading.main_thread() not in client.threads
+    
+    bearer = auth.JWTBearer()
+    token = bearer.create_access_token(
+        {"user_id": 2, "username": "bob", "email": "bob@example.com"}
+    )
+    auth.token_cache.set(token, (bearer.verify_token(token), _user(2)))
+    client.threads.clear()
+    try:
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(auth._authenticate(token))
+        assert exc_info.value.status_code == 401
+        assert len(client.threads) == 1
+        assert client.threads[0] is not threading.main_thread()
+    finally:
+        auth.token_cache.delete(token)
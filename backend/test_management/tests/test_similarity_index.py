@@ -0,0 +1,37 @@
+"""
+Unit tests for the similarity index backfill
+"""
+
+from sqlalchemy import func, select
+
+from app.commands.rebuild_similarity_index import rebuild
+from app.models.similarity import TestCaseLSHBucketDB, TestCaseSignatureDB
+from app.models.test_case import TestCaseDB
+from app.services.similarity_service import SimilarityService
+
+TEST_CASES = TestCaseDB.__table__
+SIGNATURES = TestCaseSignatureDB.__table__
+
+
+def test_rebuild_indexes_only_test_cases_without_signatures(sqlite_db, add_test_cases):
+    """Test cases without a signature are backfilled in batches; others are kept"""
+    db = sqlite_db(TEST_CASES, SIGNATURES, TestCaseLSHBucketDB.__table__)
+    add_test_cases(db, [
+        {"id": test_case_id, "project_id": 1 + test_case_id % 2,
+         "title": f"Login with account {test_case_id}", "steps": ["Open login page"]}
+        for test_case_id in range(1, 6)
+    ])
+    SimilarityService(db).index_contents([(1, 2, "Already indexed", [], [])])
+    db.commit()
+    
+    assert rebuild(db, batch_size=2) == 4
+    signatures = dict(
+        db.execute(select(SIGNATURES.c.test_case_id, SIGNATURES.c.project_id)).all()
+    )
+    assert signatures == {1: 2, 2: 1, 3: 2, 4: 1, 5: 2}
+    buckets = select(func.count()).select_from(TestCaseLSHBucketDB.__table__)
+    assert db.scalar(buckets) > 0
+    
+    # Nothing left to backfill; --all recomputes the entries of one project
+    assert rebuild(db) == 0
+    assert rebuild(db, project_ids=[1], missing_only=False) == 2
@@ -0,0 +1,86 @@
+"""
+Unit tests for moving test cases between test_cases and archived_test_cases
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, select
+
+from app.models.archived_test_case import ArchivedTestCaseDB
+from app.models.stat_counter import TestCaseStatCounterDB
+from app.models.test_case import TestCaseDB, TestCaseStatus
+from app.repositories.archive_repository import TestCaseArchiveRepository
+
+HOT = TestCaseDB.__table__
+COLD = ArchivedTestCaseDB.__table__
+COUNTERS = TestCaseStatCounterDB.__table__
+
+
+@pytest.fixture
+def session(sqlite_db, add_test_cases):
+    """Factory: a database holding ``(id, status, days since update)`` cases"""
+    def make(cases):
+        db = sqlite_db(HOT, COLD, COUNTERS)
+        now = datetime.utcnow()
+        add_test_cases(db, [
+            {
+                "id": test_case_id,
+                "status": status,
+                "updated_at": now - timedelta(days=age_days),
+                "version": 3,
+            }
+            for test_case_id, status, age_days in cases
+        ])
+        db.execute(insert(COUNTERS), [
+            {"project_id": 1, "dimension": "total", "value": "", "count": len(cases)},
+        ])
+        db.commit()
+        return db
+    
+    return make
+
+
+def _total(db):
+    return db.execute(
+        select(COUNTERS.c.count).where(COUNTERS.c.dimension == "total")
+    ).scalar()
+
+
+def test_archive_batch_moves_deprecated_and_untouched_test_cases(session):
+    """Only deprecated and long-untouched test cases move, keeping their IDs"""
+    db = session([
+        (1, TestCaseStatus.ACTIVE, 0),
+        (2, TestCaseStatus.DEPRECATED, 0),
+        (3, TestCaseStatus.ACTIVE, 400),
+        (4, TestCaseStatus.DRAFT, 10),
+    ])
+    repository = TestCaseArchiveRepository(db)
+    cutoff = datetime.utcnow() - timedelta(days=365)
+    
+    assert repository.archive_batch(cutoff, batch_size=1) == [2]
+    assert repository.archive_batch(cutoff, after_id=2, batch_size=1) == [3]
+    assert repository.archive_batch(cutoff, after_id=3) == []
+    db.commit()
+    
+    assert db.execute(select(HOT.c.id).order_by(HOT.c.id)).scalars().all() == [1, 4]
+    assert db.execute(select(COLD.c.id).order_by(COLD.c.id)).scalars().all() == [2, 3]
+    assert _total(db) == 2
+
+
+def test_restore_moves_test_case_back_with_new_version(session):
+    """A restored test case is live again under a new version (old ETags fail)"""
+    db = session([(1, TestCaseStatus.DEPRECATED, 0)])
+    repository = TestCaseArchiveRepository(db)
+    repository.archive_batch(datetime.utcnow())
+    db.commit()
+    
+    assert repository.get_project_id(1) == 1
+    assert repository.restore(1, project_id=1)
+    db.commit()
+    
+    assert db.execute(select(HOT.c.version)).scalars().all() == [4]
+    assert db.execute(select(COLD.c.id)).scalars().all() == []
+    assert repository.get_project_id(1) is None
+    assert not repository.restore(1, project_id=1)
+    assert _total(db) == 1
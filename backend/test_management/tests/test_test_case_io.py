@@ -0,0 +1,82 @@
+"""
+Unit tests for test case import parsing
+"""
+
+import io
+from datetime import datetime
+
+from app.models.test_case import TestCaseStatus
+from app.utils.test_case_io import (
+    EXPORT_FIELDS,
+    iter_csv_chunks,
+    iter_csv_records,
+    iter_jsonl_records,
+    iter_ndjson_chunks,
+)
+
+
+def test_jsonl_records_report_bad_lines():
+    """Malformed lines become row errors and blank lines are skipped"""
+    body = io.StringIO('{"title": "a"}\n\nnot json\n[1, 2]\n')
+    
+    records = list(iter_jsonl_records(body))
+    
+    assert records[0] == (1, {"title": "a"}, None)
+    assert [(row, error is not None) for row, _, error in records[1:]] == [
+        (3, True),
+        (4, True),
+    ]
+
+
+def test_csv_records_parse_list_columns():
+    """List columns accept JSON arrays or pipe-separated values"""
+    body = io.StringIO(
+        'title,steps,tags,description\n'
+        'a,"[""s1"", ""s2""]",x| y,\n'
+        '"multi\nline",,,text\n',
+        newline=''
+    )
+    
+    records = list(iter_csv_records(body))
+    
+    assert records[0] == (
+        1,
+        {"title": "a", "steps": ["s1", "s2"], "tags": ["x", "y"]},
+        None,
+    )
+    assert records[1] == (2, {"title": "multi\nline", "description": "text"}, None)
+
+
+def test_csv_records_reject_bad_json_array():
+    """A broken JSON array in a list column is a row error"""
+    body = io.StringIO('title,steps\na,"[oops"\n', newline='')
+    
+    row, record, error = next(iter_csv_records(body))
+    
+    assert (row, record) == (1, None)
+    assert "steps" in error
+
+
+def test_export_chunks_serialize_rows():
+    """Exports emit enum values, ISO dates and JSON list cells"""
+    row = dict.fromkeys(EXPORT_FIELDS)
+    row.update(
+        id=1,
+        title="a",
+        status=TestCaseStatus.ACTIVE,
+        steps=["x, y"],
+        tags=["t"],
+        created_at=datetime(2024, 1, 2, 3, 4, 5),
+    )
+    values = [row[field] for field in EXPORT_FIELDS]
+    
+    ndjson = "".join(iter_ndjson_chunks([values]))
+    assert (
+        '"status": "active"' in ndjson
+        and '"created_at": "2024-01-02T03:04:05"' in ndjson
+    )
+    
+    csv_text = "".join(iter_csv_chunks([values]))
+    ((_, record, error),) = iter_csv_records(io.StringIO(csv_text, newline=''))
+    assert error is None
+    assert record["steps"] == ["x, y"] and record["tags"] == ["t"]
@@ -0,0 +1,67 @@
+"""
+Unit tests for the per-project test case counters
+"""
+
+from sqlalchemy import create_engine, select
+
+from app.models.stat_counter import TestCaseStatCounterDB
+from app.models.test_case import TestCasePriority, TestCaseStatus, TestCaseType
+from app.repositories.stat_counter_repository import (
+    StatDeltas,
+    add_test_case,
+    apply_stat_deltas,
+    move_test_case,
+)
+
+
+def _counters(connection):
+    table = TestCaseStatCounterDB.__table__
+    rows = connection.execute(select(table.c.dimension, table.c.value, table.c.count))
+    return {(dimension, value): count for dimension, value, count in rows}
+
+
+def test_deltas_normalize_enum_members_and_names():
+    """Enum members, enum names and creator IDs land on the same counters"""
+    deltas = StatDeltas()
+    add_test_case(deltas, 1, {"status": TestCaseStatus.ACTIVE, "priority": "HIGH",
+                              "type": TestCaseType.AUTOMATED, "created_by": 7})
+    move_test_case(deltas, 1, "status", "ACTIVE", TestCaseStatus.ACTIVE)
+    move_test_case(deltas, 1, "priority", TestCasePriority.HIGH, TestCasePriority.LOW)
+    
+    assert deltas == {
+        (1, "total", ""): 1,
+        (1, "status", "active"): 1,
+        (1, "priority", "high"): 0,
+        (1, "priority", "low"): 1,
+        (1, "type", "automated"): 1,
+        (1, "created_by", "7"): 1,
+    }
+
+
+def test_apply_stat_deltas_accumulates_counters():
+    """Deltas are added to existing counters instead of overwriting them"""
+    engine = create_engine("sqlite://")
+    TestCaseStatCounterDB.__table__.create(engine)
+    
+    values = {
+        "status": "draft",
+        "priority": "medium",
+        "type": "functional",
+        "created_by": 1,
+    }
+    with engine.begin() as connection:
+        for _ in range(2):
+            deltas = StatDeltas()
+            add_test_case(deltas, 1, values)
+            apply_stat_deltas(connection, deltas)
+        
+        deltas = StatDeltas()
+        move_test_case(deltas, 1, "status", "draft", "active")
+        apply_stat_deltas(connection, deltas)
+        
+        counters = _counters(connection)
+    
+    assert counters[("total", "")] == 2
+    assert counters[("status", "draft")] == 1
+    assert counters[("status", "active")] == 1
+    assert counters[("created_by", "1")] == 2
@@ -2,13 +2,21 @@
 Unit tests for test case API endpoints
 """
 
+import json
 import pytest
+from fastapi import Depends
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
-from app.database import get_db, Base
+from app.database import get_db, get_async_db
+from app.middleware.auth import get_current_user, get_current_user_dependency, security
+from app.models import (  # noqa: F401 (registers every table on the metadatas)
+    archived_test_case, project, purge_job, similarity, stat_counter, test_case, user
+)
+from core.response_cache import response_cache
 from main import app
 
 # Create test database
@@ -16,8 +24,8 @@ SQLALCHEMY_DATABASE_URL = "sqlite:///./test_cases_test.db"
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+# Model tables, recreated for every test (see ``database``)
+METADATAS = (project.Base.metadata, test_case.Base.metadata, user.Base.metadata)
 
 # Override database dependency
 def override_get_db():
@@ -27,11 +35,59 @@ def override_get_db():
     finally:
         db.close()
 
-app.dependency_overrides[get_db] = override_get_db
+
+async_engine = create_async_engine("sqlite+aiosqlite:///./test_cases_test.db")
+TestingAsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
+# Authentication is not under test here: any bearer token is the test user
+TEST_USER_ID = 1
+
+
+async def override_get_current_user_dependency(credentials=Depends(security)):
+    return {
+        "user_id": TEST_USER_ID,
+        "username": "testuser",
+        "email": "test@example.com"
+    }
+
+
+async def override_get_current_user(credentials=Depends(security)) -> user.UserResponse:
+    async with TestingAsyncSessionLocal() as db:
+        return user.UserResponse.from_orm(await db.get(user.UserDB, TEST_USER_ID))
+
+# The test database is recreated on every run, so cached responses would be stale
+response_cache.enabled = False
 
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def database():
+    """Give every test empty tables and this module's dependency overrides"""
+    for metadata in METADATAS:
+        metadata.drop_all(bind=engine)
+        metadata.create_all(bind=engine)
+    
+    app.dependency_overrides.update({
+        get_db: override_get_db,
+        get_async_db: override_get_async_db,
+        get_current_user: override_get_current_user,
+        get_current_user_dependency: override_get_current_user_dependency,
+    })
+    # Imports run on their own synchronous session in a worker thread
+    with patch("app.services.test_case_service.get_db_session", TestingSessionLocal):
+        yield
+    app.dependency_overrides.clear()
+
+
 @pytest.fixture
 def test_user():
     """Create a test user"""
@@ -80,20 +136,21 @@ def test_test_case():
 
 @pytest.fixture
 def auth_headers(test_user):
-    """Create authentication headers"""
-    # Register user
-    client.post("/api/v1/auth/register", json=test_user)
-    
-    # Login to get token
-    login_data = {
-        "email": test_user["email"],
-        "password": test_user["password"]
-    }
-    
-    response = client.post("/api/v1/auth/login", json=login_data)
-    token = response.json()["token"]["access_token"]
+    """Create the test user and authentication headers"""
+    db = TestingSessionLocal()
+    try:
+        db.add(user.UserDB(
+            id=TEST_USER_ID,
+            username=test_user["username"],
+            email=test_user["email"],
+            password_hash="not-a-real-hash",
+            full_name=test_user["full_name"]
+        ))
+        db.commit()
+    finally:
+        db.close()
     
-    return {"Authorization": f"Bearer {token}"}
+    return {"Authorization": "Bearer test-token"}
 
 
 @pytest.fixture
@@ -189,6 +246,41 @@ class TestTestCaseRetrieval:
         assert data["title"] == test_test_case["title"]
         assert data["description"] == test_test_case["description"]
     
+    def test_get_test_case_not_modified(self, project_with_auth, test_test_case):
+        """Test conditional GET with If-None-Match"""
+        project_id, auth_headers = project_with_auth
+        
+        create_response = client.post(
+            f"/api/v1/projects/{project_id}/testcases",
+            json=test_test_case,
+            headers=auth_headers,
+        )
+        case_id = create_response.json()["id"]
+        
+        response = client.get(f"/api/v1/testcases/{case_id}", headers=auth_headers)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        
+        response = client.get(
+            f"/api/v1/testcases/{case_id}",
+            headers={**auth_headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+        
+        client.put(
+            f"/api/v1/testcases/{case_id}",
+            json={"title": "Changed"},
+            headers=auth_headers,
+        )
+        response = client.get(
+            f"/api/v1/testcases/{case_id}",
+            headers={**auth_headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 200
+        assert response.json()["title"] == "Changed"
+    
     def test_get_test_case_not_found(self, auth_headers):
         """Test getting a non-existent test case"""
         response = client.get("/api/v1/testcases/999", headers=auth_headers)
@@ -197,11 +289,14 @@ class TestTestCaseRetrieval:
     
     def test_get_test_case_unauthenticated(self, project_with_auth, test_test_case):
         """Test getting a test case without authentication"""
-        project_id, _ = project_with_auth
+        project_id, auth_headers = project_with_auth
         
         # Create test case first
-        create_response = client.post(f"/api/v1/projects/{project_id}/testcases", 
-                                     json=test_test_case)
+        create_response = client.post(
+            f"/api/v1/projects/{project_id}/testcases",
+            json=test_test_case,
+            headers=auth_headers,
+        )
         
         case_id = create_response.json()["id"]
         
@@ -281,6 +376,47 @@ class TestTestCaseRetrieval:
         data = response.json()
         assert len(data["test_cases"]) >= 1  # At least one functional test case
     
+    def test_list_test_cases_filter_by_tags(self, project_with_auth, test_test_case):
+        """Test the tag filter returns test cases carrying every requested tag"""
+        project_id, auth_headers = project_with_auth
+        
+        for title, tags in [
+            ("Login and checkout", ["login", "checkout"]),
+            ("Login only", ["login"]),
+            ("Untagged", []),
+        ]:
+            client.post(
+                f"/api/v1/projects/{project_id}/testcases",
+                json={**test_test_case, "title": title, "tags": tags},
+                headers=auth_headers,
+            )
+        
+        response = client.get(
+            f"/api/v1/projects/{project_id}/testcases?tags=login",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert sorted(tc["title"] for tc in data["test_cases"]) == [
+            "Login and checkout",
+            "Login only",
+        ]
+        
+        response = client.get(
+            f"/api/v1/projects/{project_id}/testcases?tags=checkout,login",
+            headers=auth_headers,
+        )
+        data = response.json()
+        assert data["total"] == 1
+        assert data["test_cases"][0]["title"] == "Login and checkout"
+        
+        response = client.get(
+            f"/api/v1/projects/{project_id}/testcases?tags=logout",
+            headers=auth_headers,
+        )
+        assert response.json()["total"] == 0
+    
     def test_list_test_cases_pagination(self, project_with_auth, test_test_case):
         """Test test case pagination"""
         project_id, auth_headers = project_with_auth
@@ -311,7 +447,107 @@ class TestTestCaseRetrieval:
         assert data["page"] == 2
         assert data["has_next"] is True
         assert data["has_prev"] is True
-
+    
+    def test_list_test_cases_cursor_pagination(self, project_with_auth, test_test_case):
+        """Test keyset pagination with next_cursor"""
+        project_id, auth_headers = project_with_auth
+        
+        # Create multiple test cases
+        for i in range(5):
+            test_case = test_test_case.copy()
+            test_case["title"] = f"Test Case {i}"
+            client.post(
+                f"/api/v1/projects/{project_id}/testcases",
+                json=test_case,
+                headers=auth_headers,
+            )
+        
+        # First page without total count
+        response = client.get(
+            f"/api/v1/projects/{project_id}/testcases?size=2&count=none",
+            headers=auth_headers,
+        )
+        data = response.json()
+        assert data["total"] is None
+        assert data["has_next"] is True
+        assert data["next_cursor"]
+        
+        # Follow the cursor through the remaining pages
+        seen = [tc["id"] for tc in data["test_cases"]]
+        while data["next_cursor"]:
+            response = client.get(
+                f"/api/v1/projects/{project_id}/testcases",
+                params={"size": 2, "cursor": data["next_cursor"]},
+                headers=auth_headers,
+            )
+            data = response.json()
+            assert data["has_prev"] is True
+            seen.extend(tc["id"] for tc in data["test_cases"])
+        
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+    
+    def test_list_test_cases_sparse_fields(self, project_with_auth, test_test_case):
+        """Test that lists return summary items by default and honor fields="""
+        project_id, auth_headers = project_with_auth
+        
+        client.post(f"/api/v1/projects/{project_id}/testcases",
+                    json=test_test_case, headers=auth_headers)
+        
+        response = client.get(
+            f"/api/v1/projects/{project_id}/testcases", headers=auth_headers
+        )
+        test_case = response.json()["test_cases"][0]
+        assert test_case["title"] == test_test_case["title"]
+        assert "steps" not in test_case and "description" not in test_case
+        
+        response = client.get(
+            f"/api/v1/projects/{project_id}/testcases?fields=title,steps",
+            headers=auth_headers,
+        )
+        test_case = response.json()["test_cases"][0]
+        assert set(test_case) == {"id", "title", "steps", "created_at"}
+        
+        response = client.get(
+            f"/api/v1/projects/{project_id}/testcases?fields=title,secret",
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+    
+    def test_list_test_cases_estimated_count(self, project_with_auth, test_test_case):
+        """Test an estimated total falls back to an exact count outside PostgreSQL"""
+        project_id, auth_headers = project_with_auth
+        
+        for i in range(3):
+            test_case = test_test_case.copy()
+            test_case["title"] = f"Test Case {i}"
+            client.post(
+                f"/api/v1/projects/{project_id}/testcases",
+                json=test_case,
+                headers=auth_headers,
+            )
+        
+        response = client.get(
+            f"/api/v1/projects/{project_id}/testcases?count=estimated",
+            headers=auth_headers,
+        )
+        
+        # The planner estimate is PostgreSQL only (see test_query_plans.py)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_is_estimate"] is False
+        assert data["total"] == 3
+    
+    def test_list_test_cases_invalid_cursor(self, project_with_auth):
+        """Test listing test cases with a malformed cursor"""
+        project_id, auth_headers = project_with_auth
+        
+        response = client.get(
+            f"/api/v1/projects/{project_id}/testcases?cursor=not-a-cursor",
+            headers=auth_headers,
+        )
+        
+        assert response.status_code == 400
 
 class TestTestCaseUpdate:
     """Test test case update endpoints"""
@@ -356,13 +592,46 @@ class TestTestCaseUpdate:
         
         assert response.status_code == 404
     
+    def test_update_test_case_if_match(self, project_with_auth, test_test_case):
+        """Test optimistic concurrency with If-Match"""
+        project_id, auth_headers = project_with_auth
+        
+        create_response = client.post(
+            f"/api/v1/projects/{project_id}/testcases",
+            json=test_test_case,
+            headers=auth_headers,
+        )
+        case_id = create_response.json()["id"]
+        etag = client.get(f"/api/v1/testcases/{case_id}", headers=auth_headers).headers[
+            "ETag"
+        ]
+        
+        response = client.put(f"/api/v1/testcases/{case_id}", json={"title": "First"},
+                              headers={**auth_headers, "If-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        
+        # A second writer holding the old ETag is rejected
+        response = client.put(f"/api/v1/testcases/{case_id}", json={"title": "Second"},
+                              headers={**auth_headers, "If-Match": etag})
+        assert response.status_code == 412
+        assert (
+            client.get(f"/api/v1/testcases/{case_id}", headers=auth_headers).json()[
+                "title"
+            ]
+            == "First"
+        )
+    
     def test_update_test_case_unauthenticated(self, project_with_auth, test_test_case):
         """Test updating a test case without authentication"""
-        project_id, _ = project_with_auth
+        project_id, auth_headers = project_with_auth
         
         # Create test case first
-        create_response = client.post(f"/api/v1/projects/{project_id}/testcases", 
-                                     json=test_test_case)
+        create_response = client.post(
+            f"/api/v1/projects/{project_id}/testcases",
+            json=test_test_case,
+            headers=auth_headers,
+        )
         
         case_id = create_response.json()["id"]
         
@@ -406,11 +675,14 @@ class TestTestCaseDeletion:
     
     def test_delete_test_case_unauthenticated(self, project_with_auth, test_test_case):
         """Test deleting a test case without authentication"""
-        project_id, _ = project_with_auth
+        project_id, auth_headers = project_with_auth
         
         # Create test case first
-        create_response = client.post(f"/api/v1/projects/{project_id}/testcases", 
-                                     json=test_test_case)
+        create_response = client.post(
+            f"/api/v1/projects/{project_id}/testcases",
+            json=test_test_case,
+            headers=auth_headers,
+        )
         
         case_id = create_response.json()["id"]
         
@@ -486,6 +758,43 @@ class TestTestCaseAdvancedFeatures:
         # Should find test_case2 as similar (contains "User" and "Test")
         assert len(data["similar_test_cases"]) >= 1
     
+    def test_search_test_cases(self, project_with_auth, test_test_case):
+        """Test full-text search of test cases"""
+        project_id, auth_headers = project_with_auth
+        
+        for title in ["User Login Test", "Password Reset Test", "Logout Flow"]:
+            test_case = test_test_case.copy()
+            test_case["title"] = title
+            test_case["description"] = f"Verify {title.lower()}"
+            client.post(
+                f"/api/v1/projects/{project_id}/testcases",
+                json=test_case,
+                headers=auth_headers,
+            )
+        
+        response = client.get(
+            f"/api/v1/projects/{project_id}/testcases/search?q=passw",
+            headers=auth_headers,
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["results"][0]["title"] == "Password Reset Test"
+        assert "rank" in data["results"][0]
+        assert "highlight" in data["results"][0]
+    
+    def test_search_test_cases_without_terms(self, project_with_auth):
+        """Test full-text search with no searchable terms"""
+        project_id, auth_headers = project_with_auth
+        
+        response = client.get(
+            f"/api/v1/projects/{project_id}/testcases/search?q=%21%21",
+            headers=auth_headers,
+        )
+        
+        assert response.status_code == 400
+    
     def test_get_test_cases_by_priority(self, project_with_auth, test_test_case):
         """Test getting test cases by priority"""
         project_id, auth_headers = project_with_auth
@@ -606,4 +915,257 @@ class TestTestCaseAdvancedFeatures:
         response2 = client.get(f"/api/v1/testcases/{case_id2}", headers=auth_headers)
         
         assert response1.json()["status"] == "blocked"
-        assert response2.json()["status"] == "blocked"
\ No newline at end of file
+        assert response2.json()["status"] == "blocked"
+    
+    def test_bulk_update_test_case_priority_reports_missing(
+        self, project_with_auth, test_test_case
+    ):
+        """Test bulk priority update reports IDs that were not updated"""
+        project_id, auth_headers = project_with_auth
+        
+        response = client.post(
+            f"/api/v1/projects/{project_id}/testcases",
+            json=test_test_case,
+            headers=auth_headers,
+        )
+        case_id = response.json()["id"]
+        
+        update_data = {
+            "test_case_ids": [case_id, 999999],
+            "priority": "critical"
+        }
+        
+        response = client.put(
+            f"/api/v1/projects/{project_id}/testcases/bulk/priority",
+            json=update_data,
+            headers=auth_headers,
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] == 1
+        assert data["failed"] == 1
+        assert data["updated_ids"] == [case_id]
+        assert len(data["errors"]) == 1
+        
+        response = client.get(f"/api/v1/testcases/{case_id}", headers=auth_headers)
+        assert response.json()["priority"] == "critical"
+    
+    def test_bulk_update_test_case_tags(self, project_with_auth, test_test_case):
+        """Test bulk tag add, remove and set with their per-request reports"""
+        project_id, auth_headers = project_with_auth
+        
+        case_ids = [
+            client.post(
+                f"/api/v1/projects/{project_id}/testcases",
+                json={**test_test_case, "title": title, "tags": tags},
+                headers=auth_headers,
+            ).json()["id"]
+            for title, tags in [
+                ("Smoke login", ["smoke", "login"]),
+                ("Login", ["login"]),
+                ("Untagged", []),
+            ]
+        ]
+        
+        def bulk_tags(test_case_ids, tags, operation):
+            response = client.put(
+                f"/api/v1/projects/{project_id}/testcases/bulk/tags",
+                json={
+                    "test_case_ids": test_case_ids,
+                    "tags": tags,
+                    "operation": operation,
+                },
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+            return response.json()
+        
+        def tags_of(test_case_id):
+            response = client.get(
+                f"/api/v1/testcases/{test_case_id}", headers=auth_headers
+            )
+            return response.json()["tags"]
+        
+        # Adding a tag a test case already has does not duplicate it
+        data = bulk_tags(case_ids[:2], ["smoke"], "add")
+        assert (data["success"], data["failed"]) == (2, 0)
+        assert data["updated_ids"] == sorted(case_ids[:2])
+        assert sorted(tags_of(case_ids[0])) == ["login", "smoke"]
+        assert sorted(tags_of(case_ids[1])) == ["login", "smoke"]
+        
+        # Removing a tag a test case does not have leaves it unchanged
+        data = bulk_tags([case_ids[0], case_ids[2]], ["login", "nightly"], "remove")
+        assert data["updated_ids"] == sorted([case_ids[0], case_ids[2]])
+        assert tags_of(case_ids[0]) == ["smoke"]
+        assert tags_of(case_ids[2]) == []
+        
+        # Setting replaces the tags; unknown IDs are reported, not updated
+        data = bulk_tags([case_ids[1], 999999], ["regression"], "set")
+        assert (data["success"], data["failed"]) == (1, 1)
+        assert data["updated_ids"] == [case_ids[1]]
+        assert data["errors"] == ["Test case 999999 not found"]
+        assert tags_of(case_ids[1]) == ["regression"]
+        assert tags_of(case_ids[0]) == ["smoke"]
+    
+    def test_bulk_update_test_case_type_reports_unknown_and_foreign(
+        self, project_with_auth, test_project, test_test_case
+    ):
+        """Test bulk type update skips IDs that are unknown or in another project"""
+        project_id, auth_headers = project_with_auth
+        other_project_id = client.post(
+            "/api/v1/projects",
+            json={**test_project, "name": "Other project"},
+            headers=auth_headers,
+        ).json()["id"]
+        
+        case_id, foreign_case_id = [
+            client.post(
+                f"/api/v1/projects/{target_project_id}/testcases",
+                json=test_test_case,
+                headers=auth_headers,
+            ).json()["id"]
+            for target_project_id in (project_id, other_project_id)
+        ]
+        
+        response = client.put(
+            f"/api/v1/projects/{project_id}/testcases/bulk/type",
+            json={
+                "test_case_ids": [case_id, foreign_case_id, 999999],
+                "type": "performance",
+            },
+            headers=auth_headers,
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["success"], data["failed"]) == (1, 2)
+        assert data["updated_ids"] == [case_id]
+        assert data["errors"] == [
+            f"Test case {foreign_case_id} not found",
+            "Test case 999999 not found",
+        ]
+        
+        response = client.get(f"/api/v1/testcases/{case_id}", headers=auth_headers)
+        assert response.json()["type"] == "performance"
+        response = client.get(
+            f"/api/v1/testcases/{foreign_case_id}", headers=auth_headers
+        )
+        assert response.json()["type"] == test_test_case["type"]
+    
+    def test_import_test_cases_jsonl(self, project_with_auth):
+        """Test bulk import from JSON lines reports invalid rows and keeps valid ones"""
+        project_id, auth_headers = project_with_auth
+        
+        body = "\n".join(
+            [
+                '{"title": "Imported login test", "steps": ["Open page"], '
+                '"tags": ["imported"]}',
+                '{"title": ""}',
+                'not json',
+                '{"title": "Imported logout test", "priority": "high"}',
+            ]
+        )
+        
+        response = client.post(
+            f"/api/v1/projects/{project_id}/testcases/import",
+            content=body,
+            headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported"] == 2
+        assert data["failed"] == 2
+        assert [error["row"] for error in data["errors"]] == [2, 3]
+        
+        response = client.get(f"/api/v1/projects/{project_id}/testcases?fields=all",
+                              headers=auth_headers)
+        test_cases = {
+            test_case["title"]: test_case
+            for test_case in response.json()["test_cases"]
+        }
+        assert sorted(test_cases) == ["Imported login test", "Imported logout test"]
+        assert test_cases["Imported login test"]["tags"] == ["imported"]
+        
+        response = client.get(
+            f"/api/v1/projects/{project_id}/testcases?tags=imported",
+            headers=auth_headers,
+        )
+        assert response.json()["total"] == 1
+    
+    def test_import_test_cases_csv(self, project_with_auth):
+        """Test bulk import from CSV"""
+        project_id, auth_headers = project_with_auth
+        
+        body = 'title,steps,tags\nCSV case,"[""Step 1"", ""Step 2""]",csv|imported\n'
+        
+        response = client.post(f"/api/v1/projects/{project_id}/testcases/import",
+                               content=body,
+                               headers={**auth_headers, "Content-Type": "text/csv"})
+        
+        assert response.status_code == 200
+        assert response.json()["imported"] == 1
+        
+        response = client.get(
+            f"/api/v1/projects/{project_id}/testcases?tags=csv&fields=all",
+            headers=auth_headers,
+        )
+        assert response.json()["total"] == 1
+        test_case = response.json()["test_cases"][0]
+        assert test_case["steps"] == ["Step 1", "Step 2"]
+        assert test_case["tags"] == ["csv", "imported"]
+    
+    def test_export_test_cases_ndjson(self, project_with_auth, test_test_case):
+        """Test NDJSON export applies the list filters"""
+        project_id, auth_headers = project_with_auth
+        
+        client.post(f"/api/v1/projects/{project_id}/testcases",
+                    json=test_test_case, headers=auth_headers)
+        client.post(
+            f"/api/v1/projects/{project_id}/testcases",
+            json={
+                **test_test_case,
+                "title": "Low priority case",
+                "priority": "low",
+                "tags": ["nightly"],
+            },
+            headers=auth_headers,
+        )
+        
+        response = client.get(
+            f"/api/v1/projects/{project_id}/testcases/export?priority=low",
+            headers=auth_headers,
+        )
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["title"] for line in lines] == ["Low priority case"]
+        assert lines[0]["steps"] == test_test_case["steps"]
+        
+        response = client.get(
+            f"/api/v1/projects/{project_id}/testcases/export?tags=nightly",
+            headers=auth_headers,
+        )
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["title"] for line in lines] == ["Low priority case"]
+    
+    def test_export_test_cases_csv_round_trip(self, project_with_auth, test_test_case):
+        """Test a CSV export can be imported again"""
+        project_id, auth_headers = project_with_auth
+        
+        client.post(f"/api/v1/projects/{project_id}/testcases",
+                    json=test_test_case, headers=auth_headers)
+        
+        response = client.get(
+            f"/api/v1/projects/{project_id}/testcases/export?format=csv",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.text.splitlines()[0].startswith("id,project_id,title")
+        
+        response = client.post(f"/api/v1/projects/{project_id}/testcases/import",
+                               content=response.text,
+                               headers={**auth_headers, "Content-Type": "text/csv"})
+        assert response.json()["imported"] == 1
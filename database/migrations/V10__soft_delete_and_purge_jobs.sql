@@ -0,0 +1,34 @@
+-- V10__soft_delete_and_purge_jobs.sql
+-- 软删除：删除项目或测试用例只设置 deleted_at，所有 ORM 查询立即过滤掉这些行
+-- 物理删除由后台清理任务分批完成（每批一个短事务，批间可暂停）：
+--   python -m app.commands.purge_deleted
+-- 项目删除的进度：GET /api/v1/projects/purge-jobs/{id}
+
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP;
+ALTER TABLE test_cases ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP;
+
+-- 清理任务按 id 顺序查找已软删除的测试用例；部分索引只包含这些行
+CREATE INDEX IF NOT EXISTS idx_test_cases_deleted ON test_cases(id) WHERE deleted_at IS NOT NULL;
+
+-- 项目清理任务（项目行删除后保留，用于查询进度；不设外键）
+CREATE TABLE IF NOT EXISTS purge_jobs (
+    id SERIAL PRIMARY KEY,
+    project_id INTEGER NOT NULL,
+    requested_by INTEGER NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'running', 'completed', 'failed')),
+    test_cases_total INTEGER NOT NULL DEFAULT 0,
+    test_cases_purged INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    completed_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_purge_jobs_project_id ON purge_jobs(project_id);
+-- 清理任务只查找未完成的任务
+CREATE INDEX IF NOT EXISTS idx_purge_jobs_open ON purge_jobs(id) WHERE status IN ('pending', 'running');
+
+-- 输出完成信息
+SELECT 'Soft delete columns and purge jobs table created' as message;
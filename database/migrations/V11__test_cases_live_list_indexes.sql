@@ -0,0 +1,40 @@
+-- V11__test_cases_live_list_indexes.sql
+-- 将 V8 的列表复合索引改为只包含未软删除行的部分索引（WHERE deleted_at IS NULL）
+-- V10 之后每个 ORM 查询都带 deleted_at IS NULL 条件（见 app/repositories/soft_delete.py），
+-- 部分索引的谓词因此总能匹配；已软删除、等待清理的行不再占用这些索引，也不再在写入时维护它们
+-- idx_test_cases_project_id_id 保持完整：清理任务和归档迁移用不带 deleted_at 条件的核心语句按 (project_id, id) 分批
+-- 若已执行 optional/test_cases_hash_partitioning.sql，test_cases 为分区表，改建的是 idx_test_cases_part_* 索引
+-- 回归检查：tests/test_query_plans.py（设置 PLAN_TEST_DATABASE_URL 后运行）
+
+DO $$
+DECLARE
+    prefix TEXT;
+    definition RECORD;
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'test_cases'::regclass) = 'p' THEN
+        prefix := 'idx_test_cases_part_';
+    ELSE
+        prefix := 'idx_test_cases_';
+    END IF;
+
+    FOR definition IN
+        SELECT * FROM (VALUES
+            ('project_created', 'project_id, created_at, id'),
+            ('project_status_created', 'project_id, status, created_at, id'),
+            ('project_priority_created', 'project_id, priority, created_at, id'),
+            ('project_type_created', 'project_id, type, created_at, id'),
+            ('project_creator_created', 'project_id, created_by, created_at, id')
+        ) AS indexes(suffix, columns)
+    LOOP
+        EXECUTE format('DROP INDEX IF EXISTS %I', prefix || definition.suffix);
+        EXECUTE format(
+            'CREATE INDEX %I ON test_cases(%s) WHERE deleted_at IS NULL',
+            prefix || definition.suffix, definition.columns
+        );
+    END LOOP;
+END $$;
+
+ANALYZE test_cases;
+
+-- 输出完成信息
+SELECT 'Test case list indexes limited to live rows' as message;
@@ -0,0 +1,65 @@
+-- V3__test_cases_native_types.sql
+-- 测试用例列表字段改为原生类型
+-- steps / expected_results 使用 JSONB，tags 使用 TEXT[]，标签过滤走 GIN 索引
+
+-- 将 JSON 文本数组转换为 TEXT[] 的辅助函数
+CREATE OR REPLACE FUNCTION jsonb_text_array(value JSONB)
+RETURNS TEXT[] AS $$
+    SELECT COALESCE(ARRAY(SELECT jsonb_array_elements_text(value)), '{}')
+$$ LANGUAGE sql IMMUTABLE;
+
+-- steps：兼容由 ORM 以 TEXT 方式创建的旧表
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'test_cases' AND column_name = 'steps' AND data_type = 'text'
+    ) THEN
+        ALTER TABLE test_cases
+            ALTER COLUMN steps TYPE JSONB USING COALESCE(NULLIF(steps, ''), '[]')::jsonb;
+    END IF;
+END $$;
+
+-- expected_results：不存在则新增，TEXT 则转换
+ALTER TABLE test_cases ADD COLUMN IF NOT EXISTS expected_results JSONB;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'test_cases' AND column_name = 'expected_results' AND data_type = 'text'
+    ) THEN
+        ALTER TABLE test_cases
+            ALTER COLUMN expected_results TYPE JSONB
+            USING COALESCE(NULLIF(expected_results, ''), '[]')::jsonb;
+    END IF;
+END $$;
+
+-- tags：TEXT（JSON 字符串）转换为 TEXT[]
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'test_cases' AND column_name = 'tags' AND data_type = 'text'
+    ) THEN
+        ALTER TABLE test_cases
+            ALTER COLUMN tags TYPE TEXT[]
+            USING jsonb_text_array(COALESCE(NULLIF(tags, ''), '[]')::jsonb);
+    END IF;
+END $$;
+
+-- 默认值与非空约束
+UPDATE test_cases SET steps = '[]' WHERE steps IS NULL;
+UPDATE test_cases SET expected_results = '[]' WHERE expected_results IS NULL;
+
+ALTER TABLE test_cases ALTER COLUMN steps SET DEFAULT '[]';
+ALTER TABLE test_cases ALTER COLUMN steps SET NOT NULL;
+ALTER TABLE test_cases ALTER COLUMN expected_results SET DEFAULT '[]';
+ALTER TABLE test_cases ALTER COLUMN expected_results SET NOT NULL;
+ALTER TABLE test_cases ALTER COLUMN tags SET DEFAULT '{}';
+
+-- 标签索引（包含查询 tags @> ARRAY[...]）
+CREATE INDEX IF NOT EXISTS idx_test_cases_tags ON test_cases USING GIN(tags);
+
+-- 输出完成信息
+SELECT 'Test case list columns converted to native JSONB / TEXT[] types' as message;
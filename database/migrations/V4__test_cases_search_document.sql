@@ -0,0 +1,44 @@
+-- V4__test_cases_search_document.sql
+-- 测试用例全文检索
+-- 使用存储生成列 search_vector 维护加权检索文档，并建立 GIN 索引
+
+-- ORM 使用 title 列；V2 创建的表中为 name
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'test_cases' AND column_name = 'name'
+    ) AND NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'test_cases' AND column_name = 'title'
+    ) THEN
+        ALTER TABLE test_cases RENAME COLUMN name TO title;
+    END IF;
+END $$;
+
+ALTER TABLE test_cases ADD COLUMN IF NOT EXISTS preconditions TEXT;
+
+-- 旧的全文索引依赖 chinese 分词配置且只覆盖名称和描述
+DROP INDEX IF EXISTS idx_test_cases_search;
+
+-- 加权检索文档：标题(A) > 描述(B) > 前置条件(C) > 步骤与预期结果(D)
+-- 使用 simple 配置，不依赖额外的分词扩展，且为 IMMUTABLE 可用于生成列
+ALTER TABLE test_cases DROP COLUMN IF EXISTS search_vector;
+ALTER TABLE test_cases ADD COLUMN search_vector TSVECTOR GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(description, '')), 'B') ||
+    setweight(to_tsvector('simple', coalesce(preconditions, '')), 'C') ||
+    setweight(
+        jsonb_to_tsvector(
+            'simple',
+            coalesce(steps, '[]'::jsonb) || coalesce(expected_results, '[]'::jsonb),
+            '["string"]'
+        ),
+        'D'
+    )
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_test_cases_search_vector ON test_cases USING GIN(search_vector);
+
+-- 输出完成信息
+SELECT 'Test case search document (search_vector) created' as message;
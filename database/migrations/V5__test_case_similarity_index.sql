@@ -0,0 +1,29 @@
+-- V5__test_case_similarity_index.sql
+-- 测试用例相似度索引（MinHash 签名 + LSH 分桶）
+-- 签名在创建、更新和批量导入时增量维护，用于近似重复检测
+-- 迁移前已存在的测试用例没有签名，需分批回填：
+--   python -m app.commands.rebuild_similarity_index
+
+CREATE TABLE IF NOT EXISTS test_case_signatures (
+    test_case_id INTEGER PRIMARY KEY REFERENCES test_cases(id) ON DELETE CASCADE,
+    project_id INTEGER NOT NULL,
+    signature JSONB NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_test_case_signatures_project_id ON test_case_signatures(project_id);
+
+-- 每个测试用例每个 band 一行；候选查询只走 (project_id, band, bucket) 索引
+CREATE TABLE IF NOT EXISTS test_case_lsh_buckets (
+    test_case_id INTEGER NOT NULL REFERENCES test_cases(id) ON DELETE CASCADE,
+    band INTEGER NOT NULL,
+    project_id INTEGER NOT NULL,
+    bucket BIGINT NOT NULL,
+    PRIMARY KEY (test_case_id, band)
+);
+
+CREATE INDEX IF NOT EXISTS idx_test_case_lsh_buckets_lookup
+    ON test_case_lsh_buckets(project_id, band, bucket);
+
+-- 输出完成信息
+SELECT 'Test case similarity index tables created' as message;
@@ -0,0 +1,11 @@
+-- V6__test_cases_version_not_null.sql
+-- 测试用例版本号用于 ETag 和乐观并发控制（UPDATE ... WHERE version = ?）
+-- 版本号不能为空，否则条件更新永远不匹配
+
+UPDATE test_cases SET version = 1 WHERE version IS NULL;
+
+ALTER TABLE test_cases ALTER COLUMN version SET DEFAULT 1;
+ALTER TABLE test_cases ALTER COLUMN version SET NOT NULL;
+
+-- 输出完成信息
+SELECT 'Test case version column made NOT NULL' as message;
@@ -0,0 +1,32 @@
+-- V7__test_case_stat_counters.sql
+-- 按项目维护的测试用例计数表（总数、状态、优先级、类型、创建者）
+-- 计数在每次写入的同一事务中增量更新，统计接口只读取该项目的计数行
+-- 与 V2 的 test_cases_stats 视图并存；计数漂移时运行：
+--   python -m app.commands.reconcile_test_case_stats
+
+-- ORM 映射了 type 列；V2 创建的表中没有
+ALTER TABLE test_cases ADD COLUMN IF NOT EXISTS type VARCHAR(20) NOT NULL DEFAULT 'functional';
+
+CREATE TABLE IF NOT EXISTS test_case_stat_counters (
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    dimension VARCHAR(20) NOT NULL,
+    value VARCHAR(50) NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (project_id, dimension, value)
+);
+
+-- 用现有数据初始化计数
+INSERT INTO test_case_stat_counters (project_id, dimension, value, count)
+SELECT project_id, 'total', '', COUNT(*) FROM test_cases GROUP BY project_id
+UNION ALL
+SELECT project_id, 'status', LOWER(status::text), COUNT(*) FROM test_cases GROUP BY project_id, status
+UNION ALL
+SELECT project_id, 'priority', LOWER(priority::text), COUNT(*) FROM test_cases GROUP BY project_id, priority
+UNION ALL
+SELECT project_id, 'type', LOWER(type::text), COUNT(*) FROM test_cases GROUP BY project_id, type
+UNION ALL
+SELECT project_id, 'created_by', created_by::text, COUNT(*) FROM test_cases GROUP BY project_id, created_by
+ON CONFLICT (project_id, dimension, value) DO UPDATE SET count = EXCLUDED.count;
+
+-- 输出完成信息
+SELECT 'Test case stat counters table created and populated' as message;
@@ -0,0 +1,46 @@
+-- V8__test_cases_query_indexes.sql
+-- 按仓储层实际查询形态重建测试用例索引
+-- 列表查询：WHERE project_id = ? [AND status/priority/type/created_by = ?]
+--           ORDER BY created_at DESC, id DESC LIMIT n（游标分页为 (created_at, id) < (?, ?)）
+-- 复合索引以等值列开头、以排序键结尾，反向扫描即可按序取前 n 行，无需排序
+-- 回归检查：tests/test_query_plans.py（设置 PLAN_TEST_DATABASE_URL 后运行）
+
+-- 项目内默认列表、创建时间范围过滤、标题过滤
+CREATE INDEX IF NOT EXISTS idx_test_cases_project_created
+    ON test_cases(project_id, created_at, id);
+
+-- 项目内按枚举字段或创建者过滤的列表，同时服务按该字段分组的统计
+CREATE INDEX IF NOT EXISTS idx_test_cases_project_status_created
+    ON test_cases(project_id, status, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_test_cases_project_priority_created
+    ON test_cases(project_id, priority, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_test_cases_project_type_created
+    ON test_cases(project_id, type, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_test_cases_project_creator_created
+    ON test_cases(project_id, created_by, created_at, id);
+
+-- 导出（ORDER BY id）、按 ID 批量更新和无排名搜索
+CREATE INDEX IF NOT EXISTS idx_test_cases_project_id_id
+    ON test_cases(project_id, id);
+
+-- 删除被上述复合索引覆盖或选择性过低的单列索引，减少写入开销
+-- 保留 created_at 和 created_by 单列索引：不带项目过滤的 get_all 仍使用它们
+DROP INDEX IF EXISTS idx_test_cases_project_id;
+DROP INDEX IF EXISTS idx_test_cases_status;
+DROP INDEX IF EXISTS idx_test_cases_priority;
+DROP INDEX IF EXISTS idx_test_cases_updated_at;
+DROP INDEX IF EXISTS idx_test_cases_project_status;
+DROP INDEX IF EXISTS idx_test_cases_project_priority;
+
+-- ORM create_all 创建过的单列索引（未经迁移建库时存在）
+DROP INDEX IF EXISTS ix_test_cases_project_id;
+DROP INDEX IF EXISTS ix_test_cases_updated_by;
+DROP INDEX IF EXISTS ix_test_cases_title;
+DROP INDEX IF EXISTS ix_test_cases_status;
+DROP INDEX IF EXISTS ix_test_cases_priority;
+DROP INDEX IF EXISTS ix_test_cases_type;
+
+ANALYZE test_cases;
+
+-- 输出完成信息
+SELECT 'Test case indexes rebuilt for list query shapes' as message;
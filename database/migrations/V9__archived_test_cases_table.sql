@@ -0,0 +1,37 @@
+-- V9__archived_test_cases_table.sql
+-- 冷热分离：已废弃（deprecated）或长期未更新的测试用例移入 archived_test_cases
+-- 归档任务：python -m app.commands.archive_test_cases（按 id 分批，每批一个事务）
+-- 列表和搜索通过 include_archived 参数合并查询冷表；恢复：POST /testcases/{id}/restore
+
+-- V2 中的 archived_test_cases 是 test_cases 上的视图，改为实体表
+DROP VIEW IF EXISTS archived_test_cases;
+
+-- 与 test_cases 列一致（含 search_vector 生成列），保留原 id，不使用序列
+CREATE TABLE IF NOT EXISTS archived_test_cases (
+    LIKE test_cases INCLUDING DEFAULTS INCLUDING GENERATED
+);
+
+ALTER TABLE archived_test_cases ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE archived_test_cases ADD COLUMN IF NOT EXISTS archived_at TIMESTAMP;
+UPDATE archived_test_cases SET archived_at = CURRENT_TIMESTAMP WHERE archived_at IS NULL;
+ALTER TABLE archived_test_cases ALTER COLUMN archived_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE archived_test_cases ALTER COLUMN archived_at SET NOT NULL;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'archived_test_cases_pkey'
+    ) THEN
+        ALTER TABLE archived_test_cases ADD CONSTRAINT archived_test_cases_pkey PRIMARY KEY (id);
+    END IF;
+END $$;
+
+-- 合并列表（project_id = ? ORDER BY created_at DESC, id DESC）与合并搜索使用的索引
+CREATE INDEX IF NOT EXISTS idx_archived_test_cases_project_created
+    ON archived_test_cases(project_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_archived_test_cases_tags ON archived_test_cases USING GIN(tags);
+CREATE INDEX IF NOT EXISTS idx_archived_test_cases_search_vector
+    ON archived_test_cases USING GIN(search_vector);
+
+-- 输出完成信息
+SELECT 'Archived test cases table created' as message;
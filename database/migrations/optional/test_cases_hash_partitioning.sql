@@ -0,0 +1,96 @@
+-- test_cases_hash_partitioning.sql（可选迁移，不属于 Flyway 版本序列）
+-- 将 test_cases 转换为按 project_id 哈希分区的表，适用于单租户数百万测试用例的部署
+-- 每个分区独立 VACUUM、独立索引，大租户的膨胀和缓存淘汰不再影响其他租户
+-- 仓储层的列表、导出、批量更新以及 ORM 的 UPDATE/DELETE 都带 project_id 条件，可以裁剪到单个分区
+--
+-- 在线迁移步骤（需要 PostgreSQL 13+）：
+--   1. psql -f test_cases_hash_partitioning.sql
+--      创建分区影子表 test_cases_partitioned，并在 test_cases 上安装同步触发器
+--   2. python -m app.commands.partition_test_cases [--batch-size N] [--pause 秒]
+--      按 id 分批复制存量数据，每批一个短事务，可中断后重新执行
+--   3. python -m app.commands.partition_test_cases --swap
+--      短暂锁表：补齐差异、校验行数、迁移触发器/视图/外键并交换表名
+--      原表保留为 test_cases_unpartitioned，确认无误后手动删除
+
+-- 分区影子表：结构、默认值（共用 test_cases_id_seq）、生成列和 CHECK 约束与原表一致
+CREATE TABLE IF NOT EXISTS test_cases_partitioned (
+    LIKE test_cases INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS
+) PARTITION BY HASH (project_id);
+
+-- 分区表的主键必须包含分区键
+ALTER TABLE test_cases_partitioned DROP CONSTRAINT IF EXISTS test_cases_partitioned_pkey;
+ALTER TABLE test_cases_partitioned ADD CONSTRAINT test_cases_partitioned_pkey PRIMARY KEY (project_id, id);
+
+ALTER TABLE test_cases_partitioned DROP CONSTRAINT IF EXISTS fk_test_cases_partitioned_project;
+ALTER TABLE test_cases_partitioned
+    ADD CONSTRAINT fk_test_cases_partitioned_project
+    FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE;
+
+-- 16 个哈希分区
+DO $$
+BEGIN
+    FOR remainder IN 0..15 LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS test_cases_p%s PARTITION OF test_cases_partitioned '
+            'FOR VALUES WITH (MODULUS 16, REMAINDER %s)',
+            lpad(remainder::text, 2, '0'), remainder
+        );
+    END LOOP;
+END $$;
+
+-- 与 V8/V11 相同的查询索引（在父表上创建，自动建到每个分区）；列表索引只包含未软删除的行
+CREATE INDEX IF NOT EXISTS idx_test_cases_part_project_created
+    ON test_cases_partitioned(project_id, created_at, id) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_test_cases_part_project_status_created
+    ON test_cases_partitioned(project_id, status, created_at, id) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_test_cases_part_project_priority_created
+    ON test_cases_partitioned(project_id, priority, created_at, id) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_test_cases_part_project_type_created
+    ON test_cases_partitioned(project_id, type, created_at, id) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_test_cases_part_project_creator_created
+    ON test_cases_partitioned(project_id, created_by, created_at, id) WHERE deleted_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_test_cases_part_created_at ON test_cases_partitioned(created_at);
+CREATE INDEX IF NOT EXISTS idx_test_cases_part_created_by ON test_cases_partitioned(created_by);
+-- 只按 id 查询时（如 /testcases/{id}）每个分区走自己的 id 索引
+CREATE INDEX IF NOT EXISTS idx_test_cases_part_id ON test_cases_partitioned(id);
+CREATE INDEX IF NOT EXISTS idx_test_cases_part_tags ON test_cases_partitioned USING GIN(tags);
+CREATE INDEX IF NOT EXISTS idx_test_cases_part_search_vector ON test_cases_partitioned USING GIN(search_vector);
+
+-- 同步触发器：复制期间 test_cases 上的每次写入同时写入影子表
+-- 列清单在此处生成一次（不含生成列），触发器内不再查询系统表
+DO $$
+DECLARE
+    columns TEXT;
+BEGIN
+    SELECT string_agg(quote_ident(column_name), ', ' ORDER BY ordinal_position)
+    INTO columns
+    FROM information_schema.columns
+    WHERE table_schema = current_schema()
+      AND table_name = 'test_cases'
+      AND is_generated = 'NEVER';
+
+    EXECUTE format($function$
+        CREATE OR REPLACE FUNCTION test_cases_partition_sync()
+        RETURNS TRIGGER AS $body$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                DELETE FROM test_cases_partitioned WHERE project_id = OLD.project_id AND id = OLD.id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO test_cases_partitioned (%1$s)
+                SELECT %1$s FROM (SELECT NEW.*) AS changed
+                ON CONFLICT (project_id, id) DO NOTHING;
+            END IF;
+            RETURN NULL;
+        END;
+        $body$ LANGUAGE plpgsql;
+    $function$, columns);
+END $$;
+
+DROP TRIGGER IF EXISTS test_cases_partition_sync ON test_cases;
+CREATE TRIGGER test_cases_partition_sync
+AFTER INSERT OR UPDATE OR DELETE ON test_cases
+FOR EACH ROW EXECUTE FUNCTION test_cases_partition_sync();
+
+-- 输出完成信息
+SELECT 'Partitioned shadow table created; copy rows with python -m app.commands.partition_test_cases' as message;